@@ -0,0 +1,55 @@
+"""
+Benchmark annotating EPICS PV names, as streamed through
+``lclsspeak annotate``.
+
+PV names are synthesized from acronyms in the packaged sources, device
+numbers, and attribute names which are mostly not acronyms.
+
+    $ python benchmarks/bench_annotate.py
+"""
+import io
+import itertools
+import random
+import time
+
+from lclsspeak.annotate import load_annotator
+from lclsspeak.bin.annotate import format_result
+from lclsspeak.packaged import load_packaged_data
+
+NUM_PVS = 1_000_000
+ATTRIBUTES = ["ENRC", "RBV", "STATE", "Pos", "Setpoint", "Temp_1", "MMS-X"]
+
+
+def make_pvs(names: list[str], num_pvs: int = NUM_PVS) -> list[str]:
+    rng = random.Random(0)
+    return [
+        f"MR{rng.randrange(10)}L0:{rng.choice(names)}:{rng.choice(names)}:"
+        f"{rng.randrange(100):02d}:{rng.choice(ATTRIBUTES)}"
+        for _ in range(num_pvs)
+    ]
+
+
+def main():
+    definitions = load_packaged_data()
+    t0 = time.perf_counter()
+    annotator = load_annotator(definitions)
+    print(f"Build annotator: {time.perf_counter() - t0:.3f} s")
+
+    names = sorted({
+        defn.name for defn in itertools.islice(definitions, 0, None, 10)
+        if defn.name.isalnum()
+    })
+    pvs = make_pvs(names)
+    fp = io.StringIO()
+    t0 = time.perf_counter()
+    for line, annotations in annotator.annotate_many(pvs):
+        fp.write(format_result(line, annotations, "text") + "\n")
+    elapsed = time.perf_counter() - t0
+    print(
+        f"Annotate {len(pvs)} PV names: {elapsed:.3f} s "
+        f"({len(pvs) / elapsed * 60 / 1e6:.1f} million per minute)"
+    )
+
+
+if __name__ == "__main__":
+    main()
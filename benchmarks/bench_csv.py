@@ -0,0 +1,49 @@
+"""
+Compare the "csv" and "pandas" backends for loading the packaged CSV files,
+including import time and peak traced memory.  Each backend is measured in a
+fresh interpreter.
+
+    $ python benchmarks/bench_csv.py
+"""
+import json
+import subprocess
+import sys
+
+SCRIPT = """
+import json, sys, time, tracemalloc
+t0 = time.perf_counter()
+tracemalloc.start()
+from lclsspeak import packaged
+count = 0
+for pkg in packaged._packaged_data:
+    if isinstance(pkg, packaged.CsvData):
+        pkg.backend = {backend!r}
+        count += len(pkg.load(persistent=False))
+_, peak = tracemalloc.get_traced_memory()
+print(json.dumps({{
+    "elapsed": time.perf_counter() - t0,
+    "peak": peak,
+    "count": count,
+    "pandas_imported": "pandas" in sys.modules,
+}}))
+"""
+
+
+def main():
+    for backend in ("csv", "pandas"):
+        result = subprocess.run(
+            [sys.executable, "-c", SCRIPT.format(backend=backend)],
+            check=True,
+            capture_output=True,
+            universal_newlines=True,
+        )
+        info = json.loads(result.stdout)
+        print(
+            f"{backend}: {info['count']} definitions in {info['elapsed']:.3f} s "
+            f"(including imports), peak {info['peak'] / 1e6:.1f} MB, "
+            f"pandas imported: {info['pandas_imported']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
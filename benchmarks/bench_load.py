@@ -0,0 +1,51 @@
+"""
+Benchmark serial and parallel loading of the packaged sources, and loading
+unchanged sources from the persistent source cache.
+
+    $ python benchmarks/bench_load.py
+"""
+import pathlib
+import tempfile
+import time
+
+from lclsspeak import packaged, util
+
+MODES = (None, "thread", "process")
+NUMBER = 3
+
+
+def _reset():
+    for pkg in packaged._packaged_data + packaged._external_data:
+        pkg._data = None
+
+
+def _time_load(mode=None, cache_path=None):
+    """Time loading with ``cache_path``, or a new (cold) cache each time."""
+    elapsed = []
+    for _ in range(NUMBER):
+        _reset()
+        with tempfile.TemporaryDirectory() as temp_path:
+            util.CACHE_PATH = pathlib.Path(cache_path or temp_path)
+            t0 = time.perf_counter()
+            definitions = packaged.load_packaged_data(parallel=mode)
+            elapsed.append(time.perf_counter() - t0)
+    return definitions, min(elapsed)
+
+
+def main():
+    expected = None
+    for mode in MODES:
+        definitions, elapsed = _time_load(mode)
+        expected = expected or definitions
+        assert definitions == expected
+        print(f"parallel={mode}: best of {NUMBER} {elapsed:.3f} s")
+
+    with tempfile.TemporaryDirectory() as cache_path:
+        _time_load(cache_path=cache_path)
+        definitions, elapsed = _time_load(cache_path=cache_path)
+        assert definitions == expected
+        print(f"source cache: best of {NUMBER} {elapsed:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
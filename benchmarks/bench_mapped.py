@@ -0,0 +1,49 @@
+"""
+Compare starting up and looking up names with a ``NameIndex`` loaded from the
+compiled database against a ``MappedIndex``, as a worker process would.
+
+    $ python benchmarks/bench_mapped.py
+"""
+import time
+import tracemalloc
+
+from lclsspeak.index import load_name_index
+from lclsspeak.mapped import load_mapped_index
+
+NUMBER = 5
+
+
+def measure(label: str, load):
+    best = None
+    for _ in range(NUMBER):
+        t0 = time.perf_counter()
+        index = load()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    index = load()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    keys = list(index.keys())
+    t0 = time.perf_counter()
+    for key in keys:
+        index.lookup(key)
+    lookup = (time.perf_counter() - t0) / len(keys)
+    print(
+        f"{label:<10} start {best * 1e3:8.1f} ms  "
+        f"private memory {memory / 1e6:6.2f} MB  "
+        f"lookup {lookup * 1e6:5.1f} us"
+    )
+
+
+def main():
+    # Build the database and mapped index ahead of time
+    load_mapped_index().close()
+    measure("NameIndex", load_name_index)
+    measure("mapped", load_mapped_index)
+
+
+if __name__ == "__main__":
+    main()
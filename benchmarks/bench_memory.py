@@ -0,0 +1,50 @@
+"""
+Compare the memory used by the full dataset as a list of ``Definition``
+objects and as a columnar ``DefinitionStore``, measured with tracemalloc.
+
+    $ python benchmarks/bench_memory.py
+"""
+import gc
+import time
+import tracemalloc
+
+from lclsspeak import database
+from lclsspeak.store import DefinitionStore
+
+
+def measure(load):
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    data = load()
+    elapsed = time.perf_counter() - t0
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return data, current, peak, elapsed
+
+
+def main():
+    # Build the database up front, if needed
+    database.load_database()
+
+    results = {
+        "list[Definition]": lambda: database.load_database(),
+        "DefinitionStore": lambda: DefinitionStore.from_definitions(
+            database.stream_database()
+        ),
+    }
+    loaded = {}
+    for label, load in results.items():
+        data, current, peak, elapsed = measure(load)
+        loaded[label] = data
+        print(
+            f"{label}: {len(data)} definitions, {current / 1e6:.2f} MB retained, "
+            f"{peak / 1e6:.2f} MB peak, loaded in {elapsed:.3f} s"
+        )
+
+    assert list(loaded["DefinitionStore"]) == loaded["list[Definition]"]
+
+
+if __name__ == "__main__":
+    main()
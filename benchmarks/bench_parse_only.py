@@ -0,0 +1,35 @@
+"""
+Compare parsing the Confluence pages in full with parsing only the fragments
+found by ``htmlscan.extract_fragments`` (``WebsiteData.parse_only``).
+
+    $ python benchmarks/bench_parse_only.py
+"""
+import dataclasses
+import timeit
+
+from lclsspeak import packaged
+
+NUMBER = 5
+
+
+def main():
+    for pkg in packaged._external_data:
+        if not pkg.parse_only:
+            continue
+
+        full = dataclasses.replace(pkg, parse_only=None, _data=None)
+        fragments = dataclasses.replace(pkg, _data=None)
+        assert full.load(persistent=False) == fragments.load(persistent=False)
+        results = {}
+        for label, source in (("full", full), ("parse_only", fragments)):
+            results[label] = min(
+                timeit.repeat(lambda: list(source._load()), number=1, repeat=NUMBER)
+            )
+        print(
+            f"{pkg.cached.name} (parse_only={pkg.parse_only}): "
+            f"{results['full']:.3f} s -> {results['parse_only']:.3f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
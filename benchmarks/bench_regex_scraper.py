@@ -0,0 +1,52 @@
+"""
+Benchmark ``RegexHtmlScraper`` on a synthetic page with tens of thousands of
+list items, most of which do not define an acronym.
+
+    $ python benchmarks/bench_regex_scraper.py
+"""
+import re
+import timeit
+
+import bs4
+
+from lclsspeak import packaged
+
+NUM_ITEMS = 30_000
+NUMBER = 3
+
+REGEXES = [
+    re.compile(r"(?P<name>[^=]+)\s*=\s*(?P<definition>.+)"),
+    re.compile(r"^(?P<name>[A-Z][A-Z0-9]+)\s*:\s*(?P<definition>.+)$"),
+    re.compile(r"^(?P<name>[A-Z]{2,})\s+\((?P<definition>[^)]+)\)\s*(?P<note>.*)$"),
+]
+
+
+def make_page(num_items: int = NUM_ITEMS) -> str:
+    items = []
+    for idx in range(num_items):
+        if idx % 10 == 0:
+            items.append(f"<li>ACR{idx} = Acronym number {idx}</li>")
+        elif idx % 10 == 1:
+            items.append(f"<li>ABC{idx}: Another <b>acronym</b> {idx}</li>")
+        elif idx % 10 == 2:
+            items.append(f"<p>XY ({idx} things) note {idx}</p>")
+        else:
+            items.append(f"<li>Some ordinary list item, number {idx}, of no interest</li>")
+    return "<html><body><ul>" + "\n".join(items) + "</ul></body></html>"
+
+
+def main():
+    soup = bs4.BeautifulSoup(make_page(), "lxml")
+    scraper = packaged.RegexHtmlScraper(tags=["li", "p"], regexes=REGEXES)
+    definitions = list(scraper.scrape(soup))
+    elapsed = min(
+        timeit.repeat(lambda: list(scraper.scrape(soup)), number=1, repeat=NUMBER)
+    )
+    print(
+        f"{len(definitions)} definitions from {NUM_ITEMS} items: "
+        f"best of {NUMBER} {elapsed:.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Benchmark name search against the full packaged database.
+
+    $ python benchmarks/bench_search.py
+"""
+import time
+import timeit
+
+from lclsspeak.index import load_name_index
+from lclsspeak.search import SearchEngine
+
+QUERIES = ("XTE", "GMDD", "x", "spear", "Zevatorn", "stanford linear acelerator")
+NUMBER = 1000
+
+
+def main():
+    index = load_name_index()
+    t0 = time.perf_counter()
+    engine = SearchEngine(index)
+    print(f"Indexed {len(index)} names in {time.perf_counter() - t0:.3f} s")
+
+    for query in QUERIES:
+        elapsed = timeit.timeit(lambda: engine.search(query), number=NUMBER)
+        print(f"search({query!r}): {elapsed / NUMBER * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Compare the BeautifulSoup and streaming slacspeak parsers.
+
+    $ python benchmarks/bench_slacspeak.py
+"""
+import timeit
+import tracemalloc
+
+from lclsspeak import slacspeak, util
+
+NUMBER = 5
+
+
+def _bs4(parser):
+    with open(util.SLACSPEAK_PATH, encoding="ISO-8859-1") as fp:
+        return slacspeak.parse_slacspeak(fp.read(), parser=parser)
+
+
+def _stream():
+    with open(util.SLACSPEAK_PATH, encoding="ISO-8859-1") as fp:
+        # Consume without keeping the definitions around
+        return sum(1 for _ in slacspeak.iter_slacspeak(iter(lambda: fp.read(65536), "")))
+
+
+def main():
+    cases = {
+        "bs4 (html.parser)": lambda: _bs4("html.parser"),
+        "bs4 (lxml)": lambda: _bs4("lxml"),
+        "stream": _stream,
+    }
+    for name, func in cases.items():
+        elapsed = min(timeit.repeat(func, number=1, repeat=NUMBER))
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name}: best of {NUMBER} {elapsed:.3f} s, peak {peak / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
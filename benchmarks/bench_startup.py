@@ -0,0 +1,42 @@
+"""
+Benchmark command-line startup time using ``python -X importtime``.
+
+    $ python benchmarks/bench_startup.py
+"""
+import subprocess
+import sys
+import time
+
+from lclsspeak.tests.importtime import get_import_times
+
+COMMANDS = (
+    ["--version"],
+    ["--help"],
+    ["lookup", "--help"],
+    ["serve", "--help"],
+)
+NUMBER = 5
+
+
+def main():
+    for args in COMMANDS:
+        elapsed = []
+        for _ in range(NUMBER):
+            t0 = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-m", "lclsspeak", *args],
+                check=True,
+                capture_output=True,
+            )
+            elapsed.append(time.perf_counter() - t0)
+
+        import_times = get_import_times(args)
+        slowest = sorted(import_times.items(), key=lambda item: item[1])[-3:]
+        print(f"lclsspeak {' '.join(args)}: best of {NUMBER} {min(elapsed) * 1e3:.1f} ms")
+        print(f"    {len(import_times)} modules imported; slowest (cumulative us):")
+        for module, usec in reversed(slowest):
+            print(f"        {module}: {usec}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Annotation of free text and EPICS PV names with acronym definitions.
+
+Text is split into tokens on whitespace and the ``:``, ``_``, and ``-``
+separators of the LCLS naming conventions, so that a PV name such as
+``MR1L0:XTES:GMD:ENRC`` yields the tokens ``MR1L0``, ``XTES``, ``GMD``, and
+``ENRC``.  Many names span several tokens themselves (e.g., ``LCLS-II`` or
+``AC_PLC``), so at each token the longest run of tokens which is a name is
+used, with the original separators.  Runs are only extended while they begin
+some name, per a set of the token prefixes of all names, so that most tokens
+cost a single hash lookup.  Lookups are cached, as PV names and logbook text
+repeat the same few thousand tokens many times over.
+"""
+from __future__ import annotations
+
+import dataclasses
+import functools
+import re
+from typing import Generator, Iterable, Optional
+
+from .definition import Definition
+from .index import NameIndex, load_name_index, normalize_name
+from .merge import merge_definitions
+
+#: Characters stripped from tokens which do not match as-is, e.g. "(LCLS)."
+TOKEN_PUNCTUATION = ".,;!?()[]{}<>\"'"
+
+_token_re = re.compile(r"[^\s:_\-]+")
+
+#: The start offset and length of the name matched in a phrase (without
+#: surrounding punctuation), its definitions, and whether the phrase begins
+#: a longer name.
+_Resolved = tuple[int, int, tuple[Definition, ...], bool]
+
+
+def tokenize(text: str) -> Generator[tuple[str, int, int], None, None]:
+    """Split ``text`` into (token, start, end) tuples."""
+    for match in _token_re.finditer(text):
+        yield match.group(0), match.start(), match.end()
+
+
+def _strip_name(name: str) -> str:
+    # normalize_name without case-folding
+    return name.strip().lstrip("_-").strip()
+
+
+@dataclasses.dataclass
+class Annotation:
+    """Definitions of the name ``text[start:end]``, of one or more tokens."""
+    token: str
+    start: int
+    end: int
+    definitions: list[Definition]
+
+
+@dataclasses.dataclass
+class Annotator:
+    """
+    Resolves tokens of text against a name index.
+
+    Parameters
+    ----------
+    index : NameIndex
+        The index to resolve tokens with.
+    ignore_case : bool, optional
+        Match names case-insensitively.  By default, "IT" matches the acronym
+        IT but "it" does not.
+    cache_size : int, optional
+        The number of distinct tokens for which to cache definitions.
+    """
+    index: NameIndex
+    ignore_case: bool = False
+    cache_size: int = 65536
+
+    def __post_init__(self):
+        self._resolve_cached = functools.lru_cache(maxsize=self.cache_size)(
+            self._resolve
+        )
+        # Normalized leading tokens of multi-token names, e.g. "lcls" of
+        # "lcls-ii" and "a" and "a b" of "a b c"
+        self._prefixes = set()
+        for key in self.index.keys():
+            ends = [match.end() for match in _token_re.finditer(key)]
+            self._prefixes.update(key[:end] for end in ends[:-1])
+
+    def _lookup(self, token: str) -> tuple[Definition, ...]:
+        definitions = self.index.lookup(token)
+        if self.ignore_case or not definitions:
+            return tuple(definitions)
+
+        token = _strip_name(token)
+        return tuple(
+            defn for defn in definitions
+            if _strip_name(defn.name) == token
+            or any(_strip_name(alt) == token for alt in defn.alternates or [])
+        )
+
+    def _resolve(self, phrase: str) -> _Resolved:
+        matched = phrase
+        definitions = self._lookup(phrase)
+        if not definitions:
+            stripped = phrase.strip(TOKEN_PUNCTUATION)
+            if stripped and stripped != phrase:
+                matched = stripped
+                definitions = self._lookup(stripped)
+        offset = len(phrase) - len(phrase.lstrip(TOKEN_PUNCTUATION)) if matched != phrase else 0
+        is_prefix = normalize_name(phrase.lstrip(TOKEN_PUNCTUATION)) in self._prefixes
+        return offset, len(matched), definitions, is_prefix
+
+    def resolve(self, name: str) -> list[Definition]:
+        """Find the definitions of a single name."""
+        return list(self._resolve_cached(name)[2])
+
+    def _match(
+        self, text: str, spans: list[tuple[int, int]], idx: int, resolved: _Resolved
+    ) -> tuple[int, Optional[Annotation]]:
+        """
+        Match the longest name starting at ``spans[idx]``, returning the
+        index of the token after it and its annotation, if any.
+        """
+        start, end = spans[idx]
+        candidates = [(idx + 1, resolved)]
+        last = idx
+        # Extend the run only while it begins some name
+        while resolved[3] and last + 1 < len(spans):
+            last += 1
+            end = spans[last][1]
+            resolved = self._resolve_cached(text[start:end])
+            candidates.append((last + 1, resolved))
+
+        for next_idx, (offset, length, definitions, _) in reversed(candidates):
+            if definitions:
+                name_start = start + offset
+                name_end = name_start + length
+                return next_idx, Annotation(
+                    text[name_start:name_end], name_start, name_end, list(definitions)
+                )
+        return idx + 1, None
+
+    def annotate(self, text: str) -> list[Annotation]:
+        """
+        Find the definitions of each name in ``text``.
+
+        Names are one or more consecutive tokens; the longest name at each
+        position is used.
+        """
+        spans = [match.span() for match in _token_re.finditer(text)]
+        resolve = self._resolve_cached
+        annotations = []
+        idx = 0
+        while idx < len(spans):
+            start, end = spans[idx]
+            resolved = resolve(text[start:end])
+            if not (resolved[2] or resolved[3]):
+                # Most tokens: neither a name nor the start of one
+                idx += 1
+                continue
+            idx, annotation = self._match(text, spans, idx, resolved)
+            if annotation is not None:
+                annotations.append(annotation)
+        return annotations
+
+    def annotate_many(
+        self, lines: Iterable[str]
+    ) -> Generator[tuple[str, list[Annotation]], None, None]:
+        """Annotate each of ``lines``, yielding (line, annotations)."""
+        for line in lines:
+            yield line, self.annotate(line)
+
+
+def load_annotator(
+    definitions: Optional[Iterable[Definition]] = None,
+    ignore_case: bool = False,
+) -> Annotator:
+    """
+    Build an annotator, by default from the compiled database.
+
+    Duplicate definitions across sources are merged first, so that each
+    meaning of a token is reported once.
+    """
+    if definitions is None:
+        from .database import load_database
+        definitions = load_database()
+    return Annotator(
+        index=load_name_index(merge_definitions(definitions)),
+        ignore_case=ignore_case,
+    )
@@ -0,0 +1,111 @@
+"""
+`lclsspeak annotate` will annotate text or EPICS PV names with acronyms.
+
+Text is split on whitespace and the ":", "_", and "-" separators of PV names,
+and the longest run of tokens which is an acronym (e.g., "XTES" or "LCLS-II")
+is looked up in the acronym database at each position.  With no text (or "-")
+given, lines are read from standard input and annotated as they arrive.
+
+In the text format, each line is followed by a tab and the first definition
+of each acronym found:
+
+    MR1L0:XTES:GMD	XTES: X-ray Transport and Experimental Systems; ...
+"""
+
+import argparse
+import json
+import sys
+from typing import Iterable, Optional, TextIO
+
+from ..annotate import Annotation, load_annotator
+
+DESCRIPTION = __doc__
+
+
+def build_arg_parser(argparser=None):
+    if argparser is None:
+        argparser = argparse.ArgumentParser()
+
+    argparser.description = DESCRIPTION
+    argparser.formatter_class = argparse.RawTextHelpFormatter
+
+    argparser.add_argument(
+        'text',
+        nargs="*",
+        help="Text or PV names to annotate, each annotated separately.",
+    )
+
+    argparser.add_argument(
+        '--format',
+        type=str,
+        default="text",
+        choices=("text", "json"),
+    )
+
+    argparser.add_argument(
+        '--ignore-case',
+        action="store_true",
+        help="Match acronyms case-insensitively (e.g., \"it\" as IT).",
+    )
+
+    return argparser
+
+
+def format_result(line: str, annotations: list[Annotation], format: str) -> str:
+    if format == "json":
+        return json.dumps(
+            {
+                "text": line,
+                "annotations": [
+                    {
+                        "token": annotation.token,
+                        "start": annotation.start,
+                        "end": annotation.end,
+                        "definitions": [
+                            defn.to_dict() for defn in annotation.definitions
+                        ],
+                    }
+                    for annotation in annotations
+                ],
+            },
+            sort_keys=True,
+        )
+    if format == "text":
+        if not annotations:
+            return line
+        expanded = {}
+        for annotation in annotations:
+            expanded.setdefault(
+                annotation.token, annotation.definitions[0].definition.strip()
+            )
+        return line + "\t" + "; ".join(
+            f"{token}: {definition}" for token, definition in expanded.items()
+        )
+
+    raise ValueError(f"Unsupported format: {format}")
+
+
+def _get_lines(text: list[str]) -> Iterable[str]:
+    for item in text or ["-"]:
+        if item == "-":
+            for line in sys.stdin:
+                yield line.rstrip("\r\n")
+        else:
+            yield item
+
+
+def main(
+    text: list[str],
+    format: str = "text",
+    ignore_case: bool = False,
+    fp: Optional[TextIO] = None,
+):
+    fp = fp or sys.stdout
+    # Lines from standard input may arrive slowly (e.g., from "tail -f"), so
+    # pass each one on rather than leaving it in the output buffer
+    streaming = not text or "-" in text
+    annotator = load_annotator(ignore_case=ignore_case)
+    for line, annotations in annotator.annotate_many(_get_lines(text)):
+        fp.write(format_result(line, annotations, format) + "\n")
+        if streaming:
+            fp.flush()
@@ -0,0 +1,47 @@
+"""
+`lclsspeak build` will compile the acronym database from the packaged sources.
+"""
+
+import argparse
+import logging
+from typing import Optional
+
+from .. import database
+
+DESCRIPTION = __doc__
+
+logger = logging.getLogger(__name__)
+
+
+def build_arg_parser(argparser=None):
+    if argparser is None:
+        argparser = argparse.ArgumentParser()
+
+    argparser.description = DESCRIPTION
+    argparser.formatter_class = argparse.RawTextHelpFormatter
+
+    argparser.add_argument(
+        '--force',
+        action="store_true",
+        help="Rebuild the database even if it is up-to-date.",
+    )
+
+    argparser.add_argument(
+        '--parallel',
+        type=str,
+        choices=("process", "thread"),
+        default=None,
+        help="Parse sources concurrently in a pool of processes or threads.",
+    )
+
+    return argparser
+
+
+def main(force: bool = False, parallel: Optional[str] = None):
+    path = database.get_database_path()
+    if not force and database.is_database_current(path):
+        logger.info("The acronym database is up-to-date: %s", path)
+        return
+
+    definitions = database.build_database(path, parallel=parallel)
+    logger.info("Compiled %d definitions to %s", len(definitions), path)
@@ -3,12 +3,17 @@
 """
 
 import argparse
-import dataclasses
 import html
+import itertools
 import json
+import pathlib
+import sys
+from typing import Iterable, Optional, TextIO
 
-from ..definition import Definition
-from ..packaged import load_packaged_data
+from .. import export
+from ..database import stream_database
+from ..definition import Definition, by_name
+from ..merge import merge_definitions
 
 DESCRIPTION = __doc__
 
@@ -24,14 +29,77 @@ def build_arg_parser(argparser=None):
         '--format',
         type=str,
         default="json",
+        choices=("json", "html", *export.TEXT_FORMATS, *export.FILE_FORMATS),
+        help=(
+            "The output format.  The mapped, parquet, and sqlite formats "
+            "require --output."
+        ),
+    )
+
+    argparser.add_argument(
+        '--output', '-o',
+        type=str,
+        default=None,
+        help=(
+            "Write to this file rather than standard output.  "
+            "Required for the mapped, parquet, and sqlite formats."
+        ),
+    )
+
+    argparser.add_argument(
+        '--rebuild',
+        action="store_true",
+        help="Rebuild the acronym database prior to dumping.",
+    )
+
+    argparser.add_argument(
+        '--from-sources',
+        action="store_true",
+        help="Parse the packaged sources directly instead of using the database.",
+    )
+
+    argparser.add_argument(
+        '--no-sort',
+        dest="sort",
+        action="store_false",
+        help=(
+            "Output definitions in source order.  Only applies with "
+            "--from-sources, as the database is stored sorted."
+        ),
+    )
+
+    argparser.add_argument(
+        '--merged',
+        action="store_true",
+        help=(
+            "Merge duplicate definitions of the same acronym across sources, "
+            "listing each source in the metadata."
+        ),
+    )
+
+    argparser.add_argument(
+        '--similarity',
+        type=float,
+        default=None,
+        help=(
+            "Also merge definitions whose text is at least this similar "
+            "(0 to 1, e.g. 0.9).  Implies --merged."
+        ),
     )
 
     return argparser
 
 
+def validate_args(argparser: argparse.ArgumentParser, args: argparse.Namespace):
+    if args.format in export.FILE_FORMATS and args.output is None:
+        argparser.error(f"--format {args.format} requires --output")
+    if not args.sort and not args.from_sources:
+        argparser.error("--no-sort requires --from-sources")
+
+
 def dump(defn: Definition, format: str) -> str:
     if format == "json":
-        return json.dumps(dataclasses.asdict(defn), sort_keys=True)
+        return json.dumps(defn.to_dict(), sort_keys=True)
     elif format == "html":
         def _td(text: str, escape: bool = True) -> str:
             if escape:
@@ -70,11 +138,72 @@ def format_footer(format: str) -> str:
     return ""
 
 
-def main(format: str = "json"):
-    def by_name(defn: Definition):
-        return (defn.name.lower(), defn.source)
-
-    print(format_header(format))
-    for item in sorted(load_packaged_data(), key=by_name):
-        print(dump(item, format))
-    print(format_footer(format))
+def write_lines(lines: Iterable[str], fp: TextIO, chunk_size: int = 1000) -> None:
+    """Write ``lines`` to ``fp``, joining them into chunks of ``chunk_size``."""
+    lines = iter(lines)
+    while True:
+        chunk = list(itertools.islice(lines, chunk_size))
+        if not chunk:
+            break
+        fp.write("\n".join(chunk) + "\n")
+
+
+def iter_definitions(
+    rebuild: bool = False,
+    from_sources: bool = False,
+    sort: bool = True,
+    merged: bool = False,
+    similarity: Optional[float] = None,
+) -> Iterable[Definition]:
+    if from_sources:
+        from ..packaged import iter_packaged_data
+        definitions = iter_packaged_data(sort_key=by_name if sort else None)
+    else:
+        # The database is stored in sorted order
+        definitions = stream_database(rebuild=rebuild)
+
+    if merged or similarity is not None:
+        # Merging preserves order of first appearance
+        return merge_definitions(definitions, similarity=similarity)
+    return definitions
+
+
+def write_definitions(definitions: Iterable[Definition], format: str, fp: TextIO) -> None:
+    if format in export.TEXT_FORMATS:
+        export.TEXT_FORMATS[format](definitions, fp)
+        return
+
+    lines = itertools.chain(
+        [format_header(format)],
+        (dump(item, format) for item in definitions),
+        [format_footer(format)],
+    )
+    write_lines(lines, fp)
+
+
+def main(
+    format: str = "json",
+    output: Optional[str] = None,
+    rebuild: bool = False,
+    from_sources: bool = False,
+    sort: bool = True,
+    merged: bool = False,
+    similarity: Optional[float] = None,
+    fp: Optional[TextIO] = None,
+):
+    definitions = iter_definitions(
+        rebuild=rebuild,
+        from_sources=from_sources,
+        sort=sort,
+        merged=merged,
+        similarity=similarity,
+    )
+    if format in export.FILE_FORMATS:
+        if output is None:
+            raise ValueError(f"An output filename is required for format {format!r}")
+        export.FILE_FORMATS[format](definitions, pathlib.Path(output))
+    elif output is not None:
+        with open(output, "wt", encoding="utf-8", newline="") as output_fp:
+            write_definitions(definitions, format, output_fp)
+    else:
+        write_definitions(definitions, format, fp or sys.stdout)
@@ -0,0 +1,96 @@
+"""
+`lclsspeak ingest` will extract acronyms from a directory of documents.
+
+DOCX, PDF, and HTML documents are scanned for acronym tables and "X = Y"
+definitions.  Results are written as CSV in the format of the packaged
+from_doc_tables.csv.  Interrupted runs resume where they left off unless
+--restart is given.
+"""
+
+import argparse
+import logging
+import pathlib
+import time
+from typing import Optional
+
+from .. import ingest
+
+DESCRIPTION = __doc__
+
+logger = logging.getLogger(__name__)
+
+
+def build_arg_parser(argparser=None):
+    if argparser is None:
+        argparser = argparse.ArgumentParser()
+
+    argparser.description = DESCRIPTION
+    argparser.formatter_class = argparse.RawTextHelpFormatter
+
+    argparser.add_argument(
+        'directory',
+        type=str,
+        help="The directory of documents, which is searched recursively.",
+    )
+
+    argparser.add_argument(
+        '--output', '-o',
+        type=str,
+        required=True,
+        help="The CSV file to write.",
+    )
+
+    argparser.add_argument(
+        '--state',
+        type=str,
+        default=None,
+        help=(
+            "The progress journal used to resume interrupted runs. "
+            f"Defaults to the output filename with {ingest.STATE_SUFFIX}."
+        ),
+    )
+
+    argparser.add_argument(
+        '--restart',
+        action="store_true",
+        help="Ignore the progress of any earlier run.",
+    )
+
+    argparser.add_argument(
+        '--max-workers',
+        type=int,
+        default=None,
+        help="The number of worker processes (0 to work in this process).",
+    )
+
+    return argparser
+
+
+def main(
+    directory: str,
+    output: str,
+    state: Optional[str] = None,
+    restart: bool = False,
+    max_workers: Optional[int] = None,
+):
+    output = pathlib.Path(output)
+    state = pathlib.Path(state or output.with_name(output.name + ingest.STATE_SUFFIX))
+    if restart and state.exists():
+        state.unlink()
+
+    documents = ingest.find_documents(pathlib.Path(directory))
+    logger.info("Found %d documents in %s", len(documents), directory)
+    t0 = time.monotonic()
+
+    def progress(completed: int, total: int, document: pathlib.Path):
+        elapsed = time.monotonic() - t0
+        logger.info("[%d/%d, %.0f s] %s", completed, total, elapsed, document.name)
+
+    count = ingest.ingest(
+        documents,
+        output,
+        state_path=state,
+        max_workers=max_workers,
+        progress=progress,
+    )
+    logger.info("Wrote %d acronyms to %s", count, output)
@@ -0,0 +1,80 @@
+"""
+`lclsspeak lookup` will look up the definitions of one or more acronyms.
+
+Names are matched case-insensitively across all sources.  With no names (or
+"-") given, names are read from standard input, one per line.
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from ..definition import Definition
+from ..index import load_name_index
+
+DESCRIPTION = __doc__
+
+logger = logging.getLogger(__name__)
+
+
+def build_arg_parser(argparser=None):
+    if argparser is None:
+        argparser = argparse.ArgumentParser()
+
+    argparser.description = DESCRIPTION
+    argparser.formatter_class = argparse.RawTextHelpFormatter
+
+    argparser.add_argument(
+        'names',
+        nargs="*",
+        help="Acronyms to look up.",
+    )
+
+    argparser.add_argument(
+        '--format',
+        type=str,
+        default="text",
+        choices=("text", "json"),
+    )
+
+    return argparser
+
+
+def format_result(name: str, definitions: list[Definition], format: str) -> str:
+    if format == "json":
+        return json.dumps(
+            {
+                "name": name,
+                "definitions": [defn.to_dict() for defn in definitions],
+            },
+            sort_keys=True,
+        )
+    if format == "text":
+        return "\n".join(
+            f"{defn.name}: {defn.definition.strip()} ({defn.source})"
+            for defn in definitions
+        )
+
+    raise ValueError(f"Unsupported format: {format}")
+
+
+def _get_names(names: list[str]):
+    for name in names or ["-"]:
+        if name == "-":
+            for line in sys.stdin:
+                if line.strip():
+                    yield line.strip()
+        else:
+            yield name
+
+
+def main(names: list[str], format: str = "text"):
+    index = load_name_index()
+    for name in _get_names(names):
+        definitions = index.lookup(name)
+        if not definitions:
+            logger.warning("No definitions found for %r", name)
+            if format == "text":
+                continue
+        print(format_result(name, definitions, format))
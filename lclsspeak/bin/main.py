@@ -6,17 +6,34 @@ Try:
 """
 
 import argparse
-import asyncio
+import functools
 import importlib
 import logging
-from inspect import iscoroutinefunction
+import sys
+from typing import Optional
 
 import lclsspeak
+from lclsspeak import util
 
 DESCRIPTION = __doc__
 
 
-MODULES = ("dump", )
+MODULES = (
+    "annotate",
+    "build",
+    "dump",
+    "ingest",
+    "lookup",
+    "reverse",
+    "search",
+    "serve",
+    "update",
+)
+
+# Subcommand modules are only imported once selected, so that their
+# dependencies do not slow down startup for unrelated commands (or --help).
+for _module in MODULES:
+    DESCRIPTION += f'\n    $ lclsspeak {_module} --help'
 
 
 def _try_import(module):
@@ -24,36 +41,13 @@ def _try_import(module):
     return importlib.import_module(relative_module, 'lclsspeak.bin')
 
 
-def _build_commands():
-    global DESCRIPTION
-    result = {}
-    unavailable = []
-
-    for module in sorted(MODULES):
-        try:
-            mod = _try_import(module)
-        except Exception as ex:
-            unavailable.append((module, ex))
-        else:
-            result[module] = (mod.build_arg_parser, mod.main)
-            DESCRIPTION += f'\n    $ lclsspeak {module} --help'
-
-    if unavailable:
-        DESCRIPTION += '\n\n'
-
-        for module, ex in unavailable:
-            DESCRIPTION += (
-                f'\nWARNING: "lclsspeak {module}" is unavailable due to:'
-                f'\n\t{ex.__class__.__name__}: {ex}'
-            )
-
-    return result
-
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser, fully configuring only ``command``.
 
-COMMANDS = _build_commands()
-
-
-def main():
+    Other subcommands are registered as placeholders which do not require
+    their modules to be imported.
+    """
     top_parser = argparse.ArgumentParser(
         prog='lclsspeak',
         description=DESCRIPTION,
@@ -74,24 +68,70 @@ def main():
         help='Python logging level (e.g. DEBUG, INFO, WARNING)'
     )
 
+    top_parser.add_argument(
+        '--html-parser',
+        default=None,
+        choices=list(util.HTML_PARSERS),
+        help=f'The HTML parser for scraping sources (default: {util.HTML_PARSER})'
+    )
+
     subparsers = top_parser.add_subparsers(help='Possible subcommands')
-    for command_name, (build_func, main) in COMMANDS.items():
+    for command_name in MODULES:
+        if command_name != command:
+            sub = subparsers.add_parser(command_name, add_help=False)
+            sub.set_defaults(command=command_name)
+            continue
+
+        try:
+            mod = _try_import(command_name)
+        except Exception as ex:
+            top_parser.error(
+                f'"lclsspeak {command_name}" is unavailable due to:'
+                f'\n\t{ex.__class__.__name__}: {ex}'
+            )
         sub = subparsers.add_parser(command_name)
-        build_func(sub)
-        sub.set_defaults(func=main)
+        mod.build_arg_parser(sub)
+        sub.set_defaults(func=mod.main)
+        # Optionally, reject combinations of arguments as usage errors
+        validate_args = getattr(mod, "validate_args", None)
+        if validate_args is not None:
+            sub.set_defaults(validate_args=functools.partial(validate_args, sub))
 
-    args = top_parser.parse_args()
+    return top_parser
+
+
+def _get_command(argv: list[str]) -> Optional[str]:
+    """Determine the selected subcommand without importing any of them."""
+    args, _ = _build_parser().parse_known_args(argv)
+    return getattr(args, 'command', None)
+
+
+def main(argv: Optional[list[str]] = None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    top_parser = _build_parser(command=_get_command(argv))
+    args = top_parser.parse_args(argv)
     kwargs = vars(args)
+    validate_args = kwargs.pop('validate_args', None)
+    if validate_args is not None:
+        validate_args(args)
     log_level = kwargs.pop('log_level')
+    html_parser = kwargs.pop('html_parser')
+    if html_parser is not None:
+        util.HTML_PARSER = html_parser
 
     logger = logging.getLogger('lclsspeak')
     logger.setLevel(log_level)
     logging.basicConfig()
 
     if hasattr(args, 'func'):
+        from inspect import iscoroutinefunction
+
         func = kwargs.pop('func')
         logger.debug('%s(**%r)', func.__name__, kwargs)
         if iscoroutinefunction(func):
+            import asyncio
             asyncio.run(func(**kwargs))
         else:
             func(**kwargs)
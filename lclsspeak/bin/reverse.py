@@ -0,0 +1,82 @@
+"""
+`lclsspeak reverse` will find acronyms by the words in their definitions.
+
+For example, "lclsspeak reverse gas monitor" finds acronyms meaning "gas
+monitor".
+"""
+
+import argparse
+import json
+
+from ..fulltext import FullTextResult, load_fulltext_index
+
+DESCRIPTION = __doc__
+
+
+def build_arg_parser(argparser=None):
+    if argparser is None:
+        argparser = argparse.ArgumentParser()
+
+    argparser.description = DESCRIPTION
+    argparser.formatter_class = argparse.RawTextHelpFormatter
+
+    argparser.add_argument(
+        'query',
+        nargs="+",
+        help="Words to search for.",
+    )
+
+    argparser.add_argument(
+        '--limit',
+        type=int,
+        default=10,
+        help="Maximum number of definitions to return.",
+    )
+
+    argparser.add_argument(
+        '--no-stem',
+        dest="stem",
+        action="store_false",
+        help="Match words exactly, rather than ignoring plurals.",
+    )
+
+    argparser.add_argument(
+        '--keep-stop-words',
+        dest="stop_words",
+        action="store_false",
+        help="Do not ignore common words such as 'the' and 'of'.",
+    )
+
+    argparser.add_argument(
+        '--format',
+        type=str,
+        default="text",
+        choices=("text", "json"),
+    )
+
+    return argparser
+
+
+def format_result(result: FullTextResult, format: str) -> str:
+    defn = result.definition
+    if format == "json":
+        return json.dumps(
+            {"score": result.score, "definition": defn.to_dict()},
+            sort_keys=True,
+        )
+    if format == "text":
+        return f"{defn.name}: {defn.definition.strip()} ({defn.source})"
+
+    raise ValueError(f"Unsupported format: {format}")
+
+
+def main(
+    query: list[str],
+    limit: int = 10,
+    stem: bool = True,
+    stop_words: bool = True,
+    format: str = "text",
+):
+    index = load_fulltext_index(stem=stem, stop_words=stop_words)
+    for result in index.search(" ".join(query), limit=limit):
+        print(format_result(result, format))
@@ -0,0 +1,90 @@
+"""
+`lclsspeak search` will search for acronyms by name prefix or by spelling.
+
+Results are ranked with an exact match first, then names starting with the
+query, then names within a small edit distance of the query.
+"""
+
+import argparse
+import json
+
+from ..index import load_name_index
+from ..search import SearchEngine, SearchResult
+
+DESCRIPTION = __doc__
+
+
+def build_arg_parser(argparser=None):
+    if argparser is None:
+        argparser = argparse.ArgumentParser()
+
+    argparser.description = DESCRIPTION
+    argparser.formatter_class = argparse.RawTextHelpFormatter
+
+    argparser.add_argument(
+        'query',
+        type=str,
+        help="Full or partial acronym name.",
+    )
+
+    argparser.add_argument(
+        '--limit',
+        type=int,
+        default=10,
+        help="Maximum number of names to return.",
+    )
+
+    argparser.add_argument(
+        '--max-distance',
+        type=int,
+        default=1,
+        help="Maximum edit distance for fuzzy matches.",
+    )
+
+    argparser.add_argument(
+        '--no-fuzzy',
+        dest="fuzzy",
+        action="store_false",
+        help="Only return exact and prefix matches.",
+    )
+
+    argparser.add_argument(
+        '--format',
+        type=str,
+        default="text",
+        choices=("text", "json"),
+    )
+
+    return argparser
+
+
+def format_result(result: SearchResult, format: str) -> str:
+    if format == "json":
+        return json.dumps(
+            {
+                "name": result.name,
+                "match": result.match,
+                "distance": result.distance,
+                "definitions": [defn.to_dict() for defn in result.definitions],
+            },
+            sort_keys=True,
+        )
+    if format == "text":
+        return "\n".join(
+            f"{defn.name}: {defn.definition.strip()} ({defn.source})"
+            for defn in result.definitions
+        )
+
+    raise ValueError(f"Unsupported format: {format}")
+
+
+def main(
+    query: str,
+    limit: int = 10,
+    max_distance: int = 1,
+    fuzzy: bool = True,
+    format: str = "text",
+):
+    engine = SearchEngine(load_name_index(), max_distance=max_distance)
+    for result in engine.search(query, limit=limit, fuzzy=fuzzy):
+        print(format_result(result, format))
@@ -0,0 +1,63 @@
+"""
+`lclsspeak serve` will serve acronym lookups over HTTP with JSON responses.
+
+The database is loaded and indexed once, and reloaded when its sources
+change.  Endpoints:
+
+    GET /health
+    GET /lookup?name=XTES&name=GMD
+    GET /search?q=GMDD&limit=10
+    GET /reverse?q=gas+monitor&limit=10
+"""
+
+import argparse
+
+from ..server import LookupServer
+
+DESCRIPTION = __doc__
+
+
+def build_arg_parser(argparser=None):
+    if argparser is None:
+        argparser = argparse.ArgumentParser()
+
+    argparser.description = DESCRIPTION
+    argparser.formatter_class = argparse.RawTextHelpFormatter
+
+    argparser.add_argument(
+        '--host',
+        type=str,
+        default="127.0.0.1",
+    )
+
+    argparser.add_argument(
+        '--port',
+        type=int,
+        default=8080,
+    )
+
+    argparser.add_argument(
+        '--unix-socket',
+        type=str,
+        default=None,
+        help="Listen on this Unix socket path instead of TCP.",
+    )
+
+    argparser.add_argument(
+        '--reload-interval',
+        type=float,
+        default=5.0,
+        help="Seconds between checks for changed data (0 to disable).",
+    )
+
+    return argparser
+
+
+async def main(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    unix_socket=None,
+    reload_interval: float = 5.0,
+):
+    server = LookupServer(reload_interval=reload_interval)
+    await server.serve_forever(host=host, port=port, unix_socket=unix_socket)
@@ -0,0 +1,94 @@
+"""
+`lclsspeak update` will download all remote sources to their cached files.
+
+Sources are fetched concurrently and only replaced if they changed.
+Confluence pages require the CONFLUENCE_TOKEN environment variable.
+"""
+
+import argparse
+import logging
+import sys
+from typing import Union
+
+from .. import packaged, remote
+
+DESCRIPTION = __doc__
+
+logger = logging.getLogger(__name__)
+
+
+def build_arg_parser(argparser=None):
+    if argparser is None:
+        argparser = argparse.ArgumentParser()
+
+    argparser.description = DESCRIPTION
+    argparser.formatter_class = argparse.RawTextHelpFormatter
+
+    argparser.add_argument(
+        '--max-workers',
+        type=int,
+        default=8,
+        help="The maximum number of concurrent downloads.",
+    )
+
+    argparser.add_argument(
+        '--max-per-host',
+        type=int,
+        default=2,
+        help="The maximum number of concurrent downloads from one host.",
+    )
+
+    argparser.add_argument(
+        '--timeout',
+        type=float,
+        default=remote.DEFAULT_TIMEOUT,
+        help="Connection and read timeout, in seconds.",
+    )
+
+    argparser.add_argument(
+        '--retries',
+        type=int,
+        default=2,
+        help="Retries for connection errors, timeouts, and server errors.",
+    )
+
+    return argparser
+
+
+def format_result(
+    request: remote.FetchRequest,
+    result: Union[remote.FetchResult, Exception],
+) -> str:
+    if isinstance(result, Exception):
+        return f"{request.name}: failed ({type(result).__name__}: {result})"
+    status = "updated" if result.changed else "unchanged"
+    return (
+        f"{request.name}: {status} ({result.bytes_transferred} bytes in "
+        f"{result.elapsed:.2f} s, HTTP {result.status_code})"
+    )
+
+
+def main(
+    max_workers: int = 8,
+    max_per_host: int = 2,
+    timeout: float = remote.DEFAULT_TIMEOUT,
+    retries: int = 2,
+):
+    fetch_requests = packaged.get_fetch_requests()
+    results = remote.fetch_all(
+        fetch_requests,
+        max_workers=max_workers,
+        max_per_host=max_per_host,
+        timeout=timeout,
+        retries=retries,
+    )
+    for request, result in zip(fetch_requests, results):
+        print(format_result(request, result))
+
+    total = sum(
+        result.bytes_transferred for result in results
+        if not isinstance(result, Exception)
+    )
+    print(f"Transferred {total} bytes from {len(fetch_requests)} sources")
+    if any(isinstance(result, Exception) for result in results):
+        sys.exit(1)
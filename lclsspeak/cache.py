@@ -0,0 +1,161 @@
+"""
+A persistent cache of parsed definitions for each source.
+
+Entries are keyed by a fingerprint of everything that determines a source's
+definitions: the parser code, the source configuration, and the contents of
+its cached file.  When one source changes, only that source is parsed again
+when the database is rebuilt.  Entries are stored as JSON lines in
+``util.CACHE_PATH / "sources"``.
+"""
+from __future__ import annotations
+
+import dataclasses
+import enum
+import hashlib
+import json
+import logging
+import pathlib
+import re
+from typing import Any, Callable, Iterable, Optional
+
+from . import util
+from .definition import Definition
+
+logger = logging.getLogger(__name__)
+
+#: Bump this when the on-disk format changes.
+CACHE_VERSION = 1
+CACHE_DIRECTORY = "sources"
+#: Attributes which do not affect the parsed definitions.
+IGNORED_ATTRIBUTES = frozenset({"token"})
+
+
+def get_cache_path() -> pathlib.Path:
+    return util.CACHE_PATH / CACHE_DIRECTORY
+
+
+def get_config_repr(obj: Any) -> str:
+    """
+    A stable representation of a source configuration.
+
+    Dataclass fields starting with an underscore (memoized data) and those in
+    ``IGNORED_ATTRIBUTES`` are skipped, as are the directories of paths.
+    Functions are represented by name.
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        fields = ", ".join(
+            f"{field.name}={get_config_repr(getattr(obj, field.name))}"
+            for field in dataclasses.fields(obj)
+            if not field.name.startswith("_") and field.name not in IGNORED_ATTRIBUTES
+        )
+        return f"{type(obj).__name__}({fields})"
+    if isinstance(obj, enum.Enum):
+        return repr(obj.value)
+    if isinstance(obj, pathlib.PurePath):
+        return repr(obj.name)
+    if isinstance(obj, re.Pattern):
+        return f"re.compile({obj.pattern!r}, {obj.flags})"
+    if callable(obj) and hasattr(obj, "__qualname__"):
+        # Function code is covered by ``get_code_fingerprint``
+        return f"{obj.__module__}.{obj.__qualname__}"
+    if isinstance(obj, (list, tuple)):
+        return "[" + ", ".join(get_config_repr(item) for item in obj) + "]"
+    if isinstance(obj, dict):
+        return "{" + ", ".join(
+            f"{get_config_repr(key)}: {get_config_repr(value)}"
+            for key, value in obj.items()
+        ) + "}"
+    return repr(obj)
+
+
+def get_code_fingerprint() -> str:
+    """Fingerprint the modules holding the parsing code."""
+    from .database import PARSER_MODULES
+
+    hasher = hashlib.sha256()
+    for module in PARSER_MODULES:
+        hasher.update((util.MODULE_PATH / module).read_bytes())
+    return hasher.hexdigest()
+
+
+def get_fingerprint(config: Any, files: Iterable[pathlib.Path]) -> str:
+    """
+    Fingerprint a source by its configuration and input files.
+
+    Parameters
+    ----------
+    config : object
+        The source configuration; see ``get_config_repr``.
+    files : iterable of pathlib.Path
+        The files which the source is parsed from.
+    """
+    hasher = hashlib.sha256(f"lclsspeak-source-{CACHE_VERSION}".encode())
+    hasher.update(get_code_fingerprint().encode("utf-8"))
+    hasher.update(util.get_html_parser().encode("utf-8"))
+    hasher.update(get_config_repr(config).encode("utf-8"))
+    for fn in files:
+        hasher.update(pathlib.Path(fn).read_bytes())
+    return hasher.hexdigest()
+
+
+def _get_entry_path(fingerprint: str) -> pathlib.Path:
+    return get_cache_path() / f"{fingerprint}.jsonl"
+
+
+def has_entry(fingerprint: str) -> bool:
+    return _get_entry_path(fingerprint).exists()
+
+
+def read_entry(fingerprint: str) -> Optional[list[Definition]]:
+    """Read cached definitions, or None if there are none."""
+    try:
+        with open(_get_entry_path(fingerprint), "rt", encoding="utf-8") as fp:
+            return [Definition.from_dict(json.loads(line)) for line in fp]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, TypeError) as ex:
+        logger.warning("Ignoring unreadable cache entry %s: %s", fingerprint, ex)
+        return None
+
+
+def write_entry(fingerprint: str, definitions: Iterable[Definition]) -> None:
+    path = _get_entry_path(fingerprint)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with util.atomic_write(path, "wt", encoding="utf-8") as fp:
+            for defn in definitions:
+                fp.write(json.dumps(defn.to_dict()) + "\n")
+    except OSError as ex:
+        logger.warning("Unable to write the source cache: %s", ex)
+
+
+def load_cached(
+    fingerprint: str, loader: Callable[[], Iterable[Definition]]
+) -> list[Definition]:
+    """Load definitions from the cache, or by way of ``loader`` on a miss."""
+    definitions = read_entry(fingerprint)
+    if definitions is not None:
+        logger.debug("Source cache hit: %s", fingerprint)
+        return definitions
+
+    definitions = list(loader())
+    write_entry(fingerprint, definitions)
+    return definitions
+
+
+def prune(keep: Iterable[str]) -> int:
+    """Remove all cache entries other than ``keep``, returning the number removed."""
+    keep = {_get_entry_path(fingerprint).name for fingerprint in keep}
+    removed = 0
+    try:
+        entries = list(get_cache_path().glob("*.jsonl"))
+    except OSError:
+        return 0
+    for path in entries:
+        if path.name not in keep:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            removed += 1
+    return removed
@@ -0,0 +1,188 @@
+"""
+A compiled, on-disk snapshot of all packaged acronym definitions.
+
+Parsing the packaged HTML and CSV sources takes several seconds.  The result
+is stored as JSON lines in ``util.CACHE_PATH``: a header line with the format
+version and a fingerprint of the inputs, followed by one definition per line.
+The snapshot is rebuilt automatically when any of the source files or the
+parser modules change; only sources which changed are parsed again (see
+``cache``).  Definitions are stored sorted by name (see
+``definition.by_name``) so that they may be streamed in order.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import pathlib
+from typing import Generator, Iterable, Optional
+
+from . import util
+from .definition import Definition, by_name
+
+logger = logging.getLogger(__name__)
+
+#: Bump this when the on-disk format changes.
+DATABASE_VERSION = 2
+DATABASE_FILENAME = "lclsspeak.jsonl"
+
+#: Files in ``util.DATA_PATH`` with these suffixes are parser inputs.
+DATA_SUFFIXES = (".csv", ".docx", ".html")
+#: Modules which hold parsing code or source configuration.
+PARSER_MODULES = ("definition.py", "htmlscan.py", "packaged.py", "slacspeak.py")
+
+
+class DatabaseError(Exception):
+    ...
+
+
+def get_database_path() -> pathlib.Path:
+    return util.CACHE_PATH / DATABASE_FILENAME
+
+
+def get_source_files() -> list[pathlib.Path]:
+    """All files which the packaged definitions are parsed from."""
+    files = [
+        fn for fn in util.DATA_PATH.iterdir()
+        if fn.is_file() and fn.suffix.lower() in DATA_SUFFIXES
+    ]
+    return sorted(files) + [util.get_slacspeak_path()]
+
+
+def get_fingerprint() -> str:
+    """
+    Fingerprint the database inputs.
+
+    This covers the contents of every source file along with the modules
+    holding the parser implementation and configuration, the HTML parser in
+    use, and the pandoc version if there are documents to convert.
+    """
+    hasher = hashlib.sha256(f"lclsspeak-database-{DATABASE_VERSION}".encode())
+    hasher.update(util.get_html_parser().encode("utf-8"))
+    parser_files = [util.MODULE_PATH / module for module in PARSER_MODULES]
+    source_files = get_source_files()
+    for fn in parser_files + source_files:
+        hasher.update(fn.name.encode("utf-8"))
+        hasher.update(fn.read_bytes())
+    if any(fn.suffix.lower() == ".docx" for fn in source_files):
+        from .pandoc import get_pandoc_version
+        hasher.update(get_pandoc_version().encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _load_definitions(parallel: Optional[str] = None) -> list[Definition]:
+    from . import cache
+    from .packaged import get_fingerprints, iter_packaged_data
+
+    definitions = list(iter_packaged_data(sort_key=by_name, parallel=parallel))
+    # Parsed sources are cached individually; drop those no longer in use
+    removed = cache.prune(get_fingerprints())
+    if removed:
+        logger.debug("Removed %d outdated source cache entries", removed)
+    return definitions
+
+
+def write_database(
+    definitions: Iterable[Definition],
+    fingerprint: str,
+    path: Optional[pathlib.Path] = None,
+) -> pathlib.Path:
+    """Write ``definitions`` to ``path``, replacing any existing file."""
+    path = pathlib.Path(path or get_database_path())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    header = {"version": DATABASE_VERSION, "fingerprint": fingerprint}
+
+    # Write to a temporary file first so that readers never see a partial
+    # database.
+    with util.atomic_write(path, "wt", encoding="utf-8") as fp:
+        fp.write(json.dumps(header) + "\n")
+        for defn in definitions:
+            fp.write(json.dumps(defn.to_dict()) + "\n")
+    return path
+
+
+def read_database_header(path: Optional[pathlib.Path] = None) -> dict:
+    path = pathlib.Path(path or get_database_path())
+    with open(path, "rt", encoding="utf-8") as fp:
+        header = json.loads(fp.readline() or "{}")
+    if header.get("version") != DATABASE_VERSION:
+        raise DatabaseError(
+            f"Unsupported database version in {path}: {header.get('version')}"
+        )
+    return header
+
+
+def iter_database(path: Optional[pathlib.Path] = None) -> Generator[Definition, None, None]:
+    """Read definitions from the database at ``path`` without validation."""
+    path = pathlib.Path(path or get_database_path())
+    with open(path, "rt", encoding="utf-8") as fp:
+        fp.readline()  # header
+        for line in fp:
+            yield Definition.from_dict(json.loads(line))
+
+
+def is_database_current(path: Optional[pathlib.Path] = None) -> bool:
+    try:
+        header = read_database_header(path)
+    except (OSError, ValueError, DatabaseError):
+        return False
+    return header.get("fingerprint") == get_fingerprint()
+
+
+def build_database(
+    path: Optional[pathlib.Path] = None,
+    parallel: Optional[str] = None,
+) -> list[Definition]:
+    """
+    Parse all packaged sources and write the compiled database.
+
+    Parameters
+    ----------
+    path : pathlib.Path, optional
+        The database path.  Defaults to one in ``util.CACHE_PATH``.
+    parallel : {"process", "thread"}, optional
+        Parse sources concurrently; see ``packaged.iter_packaged_data``.
+    """
+    fingerprint = get_fingerprint()
+    definitions = _load_definitions(parallel=parallel)
+    try:
+        path = write_database(definitions, fingerprint, path=path)
+    except OSError as ex:
+        logger.warning("Unable to write the acronym database: %s", ex)
+    else:
+        logger.debug("Wrote %d definitions to %s", len(definitions), path)
+    return definitions
+
+
+def stream_database(
+    path: Optional[pathlib.Path] = None,
+    rebuild: bool = False,
+) -> Generator[Definition, None, None]:
+    """
+    Iterate over all packaged definitions in the compiled database, by name.
+
+    Unlike ``load_database``, an up-to-date database is read lazily.
+    """
+    if not rebuild and is_database_current(path):
+        yield from iter_database(path)
+        return
+
+    logger.info("Building the acronym database; this may take a moment...")
+    yield from build_database(path)
+
+
+def load_database(
+    path: Optional[pathlib.Path] = None,
+    rebuild: bool = False,
+) -> list[Definition]:
+    """
+    Load all packaged definitions from the compiled database.
+
+    Parameters
+    ----------
+    path : pathlib.Path, optional
+        The database path.  Defaults to one in ``util.CACHE_PATH``.
+    rebuild : bool, optional
+        Rebuild the database even if it is up-to-date.
+    """
+    return list(stream_database(path, rebuild=rebuild))
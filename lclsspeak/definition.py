@@ -1,6 +1,8 @@
+from __future__ import annotations
+
 import dataclasses
 import enum
-from typing import Optional
+from typing import Any, Optional
 
 
 @dataclasses.dataclass(frozen=True)
@@ -23,6 +25,39 @@ class Definition:
     def valid(self) -> bool:
         return bool(self.name and self.definition and self.source)
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Equivalent to ``dataclasses.asdict``, without its recursive deep copy.
+
+        The returned dictionary shares its list and dictionary values with this
+        Definition.
+        """
+        url = self.url
+        return {
+            "name": self.name,
+            "definition": self.definition,
+            "source": self.source,
+            "url": {"url": url.url, "text": url.text} if url is not None else None,
+            "alternates": self.alternates,
+            "tags": self.tags,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_dict(cls, dct: dict[str, Any]) -> Definition:
+        """Create a Definition from the output of ``to_dict``."""
+        dct = dict(dct)
+        url = dct.pop("url", None)
+        return cls(
+            url=URL(**url) if url is not None else None,
+            **dct
+        )
+
+
+def by_name(defn: Definition) -> tuple[str, str]:
+    """Sort key for definitions: case-insensitive name, then source."""
+    return (defn.name.lower(), defn.source)
+
 
 class StandardTag(str, enum.Enum):
     slacspeak = "slacspeak"
@@ -0,0 +1,203 @@
+"""
+Bulk exporters for acronym definitions.
+
+Definitions are serialized in batches using ``Definition.to_dict`` or plain
+attribute access, avoiding the per-record deep copy of
+``dataclasses.asdict``.
+"""
+from __future__ import annotations
+
+import contextlib
+import csv
+import itertools
+import json
+import pathlib
+import sqlite3
+from typing import Callable, Generator, Iterable, TextIO
+
+from . import util
+from .definition import Definition
+from .mapped import write_mapped_index
+
+#: The number of definitions serialized at once.
+BATCH_SIZE = 1000
+
+CSV_COLUMNS = (
+    "name",
+    "definition",
+    "source",
+    "url",
+    "url_text",
+    "alternates",
+    "tags",
+    "metadata",
+)
+#: Delimiter for list values (alternates, tags) in flat formats.
+LIST_DELIMITER = "; "
+
+
+def batched(
+    definitions: Iterable[Definition], batch_size: int = BATCH_SIZE
+) -> Generator[list[Definition], None, None]:
+    definitions = iter(definitions)
+    while True:
+        batch = list(itertools.islice(definitions, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _to_flat_row(defn: Definition) -> tuple[str, ...]:
+    url = defn.url
+    return (
+        defn.name,
+        defn.definition,
+        defn.source,
+        url.url if url is not None else "",
+        url.text if url is not None else "",
+        LIST_DELIMITER.join(defn.alternates or []),
+        LIST_DELIMITER.join(str(tag) for tag in defn.tags),
+        json.dumps(defn.metadata, sort_keys=True) if defn.metadata else "",
+    )
+
+
+def write_ndjson(
+    definitions: Iterable[Definition], fp: TextIO, batch_size: int = BATCH_SIZE
+) -> None:
+    """Write one compact JSON object per line."""
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    for batch in batched(definitions, batch_size):
+        fp.write("".join(encode(defn.to_dict()) + "\n" for defn in batch))
+
+
+def write_csv(
+    definitions: Iterable[Definition], fp: TextIO, batch_size: int = BATCH_SIZE
+) -> None:
+    """
+    Write a CSV file with a header row.
+
+    Alternates and tags are joined with ``LIST_DELIMITER`` and metadata is
+    JSON-encoded.
+    """
+    writer = csv.writer(fp)
+    writer.writerow(CSV_COLUMNS)
+    for batch in batched(definitions, batch_size):
+        writer.writerows(_to_flat_row(defn) for defn in batch)
+
+
+def write_parquet(
+    definitions: Iterable[Definition],
+    path: pathlib.Path,
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """
+    Write an Apache Parquet file (requires ``pyarrow``).
+
+    Alternates and tags are stored as lists of strings and metadata is
+    JSON-encoded.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("pyarrow is required to export Parquet files") from None
+
+    string = pa.string()
+    schema = pa.schema(
+        [
+            ("name", string),
+            ("definition", string),
+            ("source", string),
+            ("url", string),
+            ("url_text", string),
+            ("alternates", pa.list_(string)),
+            ("tags", pa.list_(string)),
+            ("metadata", string),
+        ]
+    )
+    with util.atomic_replace(path) as temp_path, pq.ParquetWriter(
+        str(temp_path), schema
+    ) as writer:
+        for batch in batched(definitions, batch_size):
+            urls = [defn.url for defn in batch]
+            columns = [
+                [defn.name for defn in batch],
+                [defn.definition for defn in batch],
+                [defn.source for defn in batch],
+                [url.url if url is not None else None for url in urls],
+                [url.text if url is not None else None for url in urls],
+                [defn.alternates for defn in batch],
+                [[str(tag) for tag in defn.tags] for defn in batch],
+                [
+                    json.dumps(defn.metadata, sort_keys=True) if defn.metadata else None
+                    for defn in batch
+                ],
+            ]
+            writer.write_batch(pa.record_batch(columns, schema=schema))
+
+
+def write_sqlite(
+    definitions: Iterable[Definition],
+    path: pathlib.Path,
+    batch_size: int = BATCH_SIZE,
+) -> None:
+    """
+    Write a SQLite database with a single ``definitions`` table.
+
+    Any existing file at ``path`` is replaced once the database is complete.
+    Alternates, tags, and metadata are JSON-encoded.  Names are indexed
+    case-insensitively.
+    """
+    # Build the database in a temporary file, so that an interrupted export
+    # leaves any existing file as-is
+    with util.atomic_replace(path) as temp_path, contextlib.closing(
+        sqlite3.connect(str(temp_path))
+    ) as conn, conn:
+        conn.execute(
+            """
+            CREATE TABLE definitions (
+                name TEXT NOT NULL,
+                definition TEXT NOT NULL,
+                source TEXT NOT NULL,
+                url TEXT,
+                url_text TEXT,
+                alternates TEXT,
+                tags TEXT,
+                metadata TEXT
+            )
+            """
+        )
+        for batch in batched(definitions, batch_size):
+            conn.executemany(
+                "INSERT INTO definitions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        defn.name,
+                        defn.definition,
+                        defn.source,
+                        defn.url.url if defn.url is not None else None,
+                        defn.url.text if defn.url is not None else None,
+                        json.dumps(defn.alternates) if defn.alternates else None,
+                        json.dumps(defn.tags),
+                        json.dumps(defn.metadata, sort_keys=True),
+                    )
+                    for defn in batch
+                ),
+            )
+        conn.execute(
+            "CREATE INDEX definitions_name ON definitions (name COLLATE NOCASE)"
+        )
+
+
+#: Formats written to a text stream.
+TEXT_FORMATS: dict[str, Callable[[Iterable[Definition], TextIO], None]] = {
+    "csv": write_csv,
+    "ndjson": write_ndjson,
+}
+
+#: Formats written to a file path.
+FILE_FORMATS: dict[str, Callable[[Iterable[Definition], pathlib.Path], None]] = {
+    "mapped": write_mapped_index,
+    "parquet": write_parquet,
+    "sqlite": write_sqlite,
+}
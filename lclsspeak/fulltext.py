@@ -0,0 +1,226 @@
+"""
+Full-text search over definition bodies, for reverse lookups by meaning.
+
+Definitions, tags, and metadata values are tokenized into an inverted index
+mapping each term to the documents (definitions) containing it.  Queries are
+ranked with BM25 and only visit the postings of the query terms.  The index
+refers to definitions by their position in the compiled database and is
+persisted next to it.
+"""
+from __future__ import annotations
+
+import dataclasses
+import heapq
+import json
+import logging
+import math
+import pathlib
+import re
+from typing import Iterable, Optional
+
+from . import util
+from .definition import Definition
+
+logger = logging.getLogger(__name__)
+
+#: Bump this when the on-disk format changes.
+FULLTEXT_VERSION = 1
+FULLTEXT_FILENAME = "fulltext.json"
+
+STOP_WORDS = frozenset(
+    """
+    a an and are as at be by for from has in is it its of on or that the this
+    to was were which will with
+    """.split()
+)
+
+_token_re = re.compile(r"\w+")
+
+
+def stem_token(token: str) -> str:
+    """A light plural-stripping stemmer (Harman's "S" stemmer)."""
+    if len(token) <= 3:
+        return token
+    if token.endswith("ies") and not token.endswith(("eies", "aies")):
+        return token[:-3] + "y"
+    if token.endswith("es") and not token.endswith(("aes", "ees", "oes")):
+        return token[:-1]
+    if token.endswith("s") and not token.endswith(("us", "ss")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str, stem: bool = True, stop_words: bool = True) -> list[str]:
+    tokens = _token_re.findall(text.casefold())
+    if stop_words:
+        tokens = [token for token in tokens if token not in STOP_WORDS]
+    if stem:
+        tokens = [stem_token(token) for token in tokens]
+    return tokens
+
+
+def get_document_text(defn: Definition) -> str:
+    """The text of a definition which is indexed for full-text search."""
+    parts = [defn.definition]
+    parts.extend(str(tag) for tag in defn.tags)
+    for value in defn.metadata.values():
+        if isinstance(value, str):
+            parts.append(value)
+    return "\n".join(parts)
+
+
+@dataclasses.dataclass
+class FullTextResult:
+    definition: Definition
+    score: float
+
+
+@dataclasses.dataclass
+class FullTextIndex:
+    definitions: list[Definition]
+    stem: bool = True
+    stop_words: bool = True
+    #: BM25 term frequency saturation.
+    k1: float = 1.2
+    #: BM25 document length normalization.
+    b: float = 0.75
+    #: term -> flattened [document, term frequency, ...] pairs
+    postings: Optional[dict[str, list[int]]] = dataclasses.field(default=None, repr=False)
+    lengths: Optional[list[int]] = dataclasses.field(default=None, repr=False)
+
+    def __post_init__(self):
+        if self.postings is None or self.lengths is None:
+            self._build()
+        elif len(self.lengths) != len(self.definitions):
+            raise ValueError("The index does not match the provided definitions")
+        self._average_length = sum(self.lengths) / max(len(self.lengths), 1)
+
+    def _build(self) -> None:
+        self.postings = {}
+        self.lengths = []
+        for doc, defn in enumerate(self.definitions):
+            tokens = tokenize(
+                get_document_text(defn), stem=self.stem, stop_words=self.stop_words
+            )
+            self.lengths.append(len(tokens))
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, count in counts.items():
+                self.postings.setdefault(token, []).extend((doc, count))
+
+    @property
+    def settings(self) -> dict:
+        return {"stem": self.stem, "stop_words": self.stop_words}
+
+    def search(self, query: str, limit: Optional[int] = 10) -> list[FullTextResult]:
+        """Find definitions matching ``query``, best match first."""
+        num_documents = len(self.lengths)
+        scores = {}
+        for token in set(tokenize(query, stem=self.stem, stop_words=self.stop_words)):
+            posting = self.postings.get(token, [])
+            frequency = len(posting) // 2
+            if not frequency:
+                continue
+            idf = math.log(1 + (num_documents - frequency + 0.5) / (frequency + 0.5))
+            for idx in range(0, len(posting), 2):
+                doc, count = posting[idx], posting[idx + 1]
+                norm = 1 - self.b + self.b * self.lengths[doc] / self._average_length
+                score = idf * count * (self.k1 + 1) / (count + self.k1 * norm)
+                scores[doc] = scores.get(doc, 0.0) + score
+
+        if limit is None:
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        else:
+            ranked = heapq.nsmallest(
+                limit, scores.items(), key=lambda item: (-item[1], item[0])
+            )
+        return [
+            FullTextResult(definition=self.definitions[doc], score=score)
+            for doc, score in ranked
+        ]
+
+    def save(self, path: pathlib.Path, fingerprint: str) -> None:
+        """Save the index for the definitions identified by ``fingerprint``."""
+        path = pathlib.Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": FULLTEXT_VERSION,
+            "fingerprint": fingerprint,
+            "settings": self.settings,
+            "lengths": self.lengths,
+            "postings": self.postings,
+        }
+        with util.atomic_write(path, "wt", encoding="utf-8") as fp:
+            json.dump(data, fp)
+
+    @classmethod
+    def load(
+        cls,
+        path: pathlib.Path,
+        definitions: list[Definition],
+        fingerprint: str,
+        stem: bool = True,
+        stop_words: bool = True,
+    ) -> Optional[FullTextIndex]:
+        """
+        Load a saved index, if it matches ``fingerprint`` and the settings.
+        """
+        try:
+            with open(path, "rt", encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+        settings = {"stem": stem, "stop_words": stop_words}
+        if (
+            data.get("version") != FULLTEXT_VERSION
+            or data.get("fingerprint") != fingerprint
+            or data.get("settings") != settings
+        ):
+            return None
+        return cls(
+            definitions=definitions,
+            postings=data["postings"],
+            lengths=data["lengths"],
+            **settings,
+        )
+
+
+def get_fulltext_path() -> pathlib.Path:
+    return util.CACHE_PATH / FULLTEXT_FILENAME
+
+
+def load_fulltext_index(
+    definitions: Optional[Iterable[Definition]] = None,
+    stem: bool = True,
+    stop_words: bool = True,
+) -> FullTextIndex:
+    """
+    Get a full-text index, by default of the compiled database.
+
+    The index of the compiled database is cached on disk alongside it and
+    rebuilt only when the database changes.
+    """
+    if definitions is not None:
+        return FullTextIndex(list(definitions), stem=stem, stop_words=stop_words)
+
+    from . import database
+    definitions = database.load_database()
+    if not database.is_database_current():
+        # The database could not be written; skip caching
+        return FullTextIndex(definitions, stem=stem, stop_words=stop_words)
+
+    fingerprint = database.get_fingerprint()
+
+    path = get_fulltext_path()
+    index = FullTextIndex.load(
+        path, definitions, fingerprint, stem=stem, stop_words=stop_words
+    )
+    if index is None:
+        index = FullTextIndex(definitions, stem=stem, stop_words=stop_words)
+        try:
+            index.save(path, fingerprint)
+        except OSError as ex:
+            logger.warning("Unable to write the full-text index: %s", ex)
+    return index
@@ -0,0 +1,79 @@
+"""
+Fast, text-level extraction of HTML fragments ahead of parsing.
+
+Confluence pages are mostly scripts, styles, and navigation.  Where only
+certain elements (e.g., tables) are of interest, ``extract_fragments`` finds
+them with a regular expression scan and only those fragments need to be
+parsed into a tree.
+"""
+from __future__ import annotations
+
+import re
+from typing import Sequence
+
+#: Elements whose content is not markup.
+RAW_TEXT_ELEMENTS = ("script", "style", "textarea")
+
+_tag_re = re.compile(r"<!--|<(/?)([a-zA-Z][a-zA-Z0-9]*)(?=[\s/>])")
+
+
+def _find_end(html: str, substring: str, pos: int) -> int:
+    """The position after ``substring``, or the end of ``html`` if not found."""
+    idx = html.find(substring, pos)
+    return len(html) if idx == -1 else idx + len(substring)
+
+
+def extract_fragments(html: str, tags: Sequence[str]) -> list[str]:
+    """
+    Get the source of each outermost element in ``tags``, in document order.
+
+    Comments and the content of script, style, and textarea elements are
+    skipped.  An element left open at the end of the document extends to the
+    end.
+
+    Parameters
+    ----------
+    html : str
+        The document source.
+    tags : sequence of str
+        Tag names to extract, e.g. ``["table"]``.
+    """
+    tags = {tag.lower() for tag in tags}
+    lowered = None
+    fragments = []
+    depth = 0
+    start = 0
+    pos = 0
+    while True:
+        match = _tag_re.search(html, pos)
+        if match is None:
+            break
+
+        if match.group(0) == "<!--":
+            pos = _find_end(html, "-->", match.end())
+            continue
+
+        closing, name = match.group(1), match.group(2).lower()
+        pos = match.end()
+        if not closing and name in RAW_TEXT_ELEMENTS:
+            if lowered is None:
+                lowered = html.lower()
+            pos = _find_end(lowered, f"</{name}", pos)
+            continue
+
+        if name not in tags:
+            continue
+
+        if not closing:
+            if depth == 0:
+                start = match.start()
+            depth += 1
+        elif depth > 0:
+            depth -= 1
+            if depth == 0:
+                pos = _find_end(html, ">", pos)
+                fragments.append(html[start:pos])
+
+    if depth > 0:
+        fragments.append(html[start:])
+    return fragments
@@ -0,0 +1,67 @@
+"""
+In-memory indexes over acronym definitions.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import Iterable, Optional
+
+from .definition import Definition
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize an acronym name for lookup purposes.
+
+    Names are case-folded and stripped of surrounding whitespace and the
+    ``_-`` prefixes removed by ``packaged.fixer_remove_prefixes``.
+    """
+    return name.strip().lstrip("_-").strip().casefold()
+
+
+@dataclasses.dataclass
+class NameIndex:
+    """A hash index of normalized names and alternates to definitions."""
+    definitions: list[Definition] = dataclasses.field(default_factory=list)
+    _index: dict[str, list[Definition]] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        definitions, self.definitions = self.definitions, []
+        for defn in definitions:
+            self.add(defn)
+
+    def add(self, defn: Definition) -> None:
+        self.definitions.append(defn)
+        keys = {normalize_name(defn.name)}
+        keys.update(normalize_name(alternate) for alternate in defn.alternates or [])
+        for key in keys:
+            if key:
+                self._index.setdefault(key, []).append(defn)
+
+    def lookup(self, name: str) -> list[Definition]:
+        """Find all definitions matching ``name`` across all sources."""
+        return list(self._index.get(normalize_name(name), []))
+
+    def lookup_many(self, names: Iterable[str]) -> dict[str, list[Definition]]:
+        """Find definitions for each of ``names``, keyed by the given name."""
+        return {name: self.lookup(name) for name in names}
+
+    def keys(self) -> Iterable[str]:
+        """All normalized names in the index."""
+        return self._index.keys()
+
+    def __contains__(self, name: str) -> bool:
+        return normalize_name(name) in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def load_name_index(definitions: Optional[Iterable[Definition]] = None) -> NameIndex:
+    """Build a name index, by default from the compiled database."""
+    if definitions is None:
+        from .database import load_database
+        definitions = load_database()
+    return NameIndex(list(definitions))
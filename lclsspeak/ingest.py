@@ -0,0 +1,351 @@
+"""
+Bulk extraction of acronyms from released documents.
+
+Documents (DOCX, PDF, and HTML) are scanned for acronym tables and
+"X = Y" definitions in a pool of worker processes.  The results are written
+in the schema of the packaged ``from_doc_tables.csv``::
+
+    Acronym,Definition,Source(s)
+    GMD,Gas Monitor Detector,XTES_Energy_Monitors_FRS.pdf page 2
+
+Progress is journaled to a state file as each document completes, so that
+an interrupted run resumes where it left off.  PDF support requires
+``pypdf``.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import csv
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import pathlib
+import re
+from typing import Callable, Generator, Iterable, Optional
+
+import bs4
+
+from . import pandoc, util
+from .packaged import _init_worker, get_html_text_from_tag
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("Acronym", "Definition", "Source(s)")
+DOCUMENT_SUFFIXES = (".docx", ".htm", ".html", ".pdf")
+STATE_SUFFIX = ".ingest.jsonl"
+#: The longest acronym considered.
+MAX_NAME_LENGTH = 20
+
+_name_header_re = re.compile(r"acronym|abbreviation|term|symbol", re.IGNORECASE)
+_definition_header_re = re.compile(r"definition|description|meaning", re.IGNORECASE)
+_equals_re = re.compile(
+    r"^\s*(?P<name>[^=\s][^=]{0,%d}?)\s*=\s*(?P<definition>.+?)\s*$" % MAX_NAME_LENGTH
+)
+#: PDF text lines of the form "ACRONYM   Some Definition"
+_line_re = re.compile(r"^\s*(?P<name>\S{1,%d})\s+(?P<definition>\S.+?)\s*$" % MAX_NAME_LENGTH)
+_word_re = re.compile(r"[A-Za-z0-9]+")
+
+#: (Acronym, Definition, Source(s))
+Row = tuple[str, str, str]
+ProgressCallback = Callable[[int, int, pathlib.Path], None]
+
+
+def is_acronym(name: str) -> bool:
+    """Does ``name`` look like an acronym (e.g., "GMD", "1oo2", "(X)GMD")?"""
+    if not name or len(name) > MAX_NAME_LENGTH or " " in name.strip():
+        return False
+    return sum(char.isupper() or char.isdigit() for char in name) >= 2
+
+
+def initials_match(name: str, definition: str) -> bool:
+    """
+    Are the letters of ``name`` the initials of words in ``definition``?
+
+    Letters must appear in order, though words may be skipped ("of", "the").
+    """
+    letters = [char for char in name.lower() if char.isalpha()]
+    initials = iter(word[0].lower() for word in _word_re.findall(definition))
+    return bool(letters) and all(letter in initials for letter in letters)
+
+
+def _clean(text: str) -> str:
+    return " ".join(text.replace("\xa0", " ").split())
+
+
+def _make_row(name: str, definition: str, source: str) -> Optional[Row]:
+    name, definition = _clean(name), _clean(definition)
+    if not is_acronym(name) or not definition or definition == name:
+        return None
+    return (name, definition, source)
+
+
+def _get_table_columns(header: list[str]) -> Optional[tuple[int, int]]:
+    names = [idx for idx, text in enumerate(header) if _name_header_re.search(text)]
+    definitions = [
+        idx for idx, text in enumerate(header) if _definition_header_re.search(text)
+    ]
+    if names and definitions:
+        return names[0], definitions[0]
+    return None
+
+
+def extract_html_rows(html: str, source: str) -> Generator[Row, None, None]:
+    """
+    Extract acronyms from HTML tables and "X = Y" text.
+
+    Tables are used if they have acronym and definition columns by header, or
+    if they have two columns of which most rows are an acronym followed by a
+    definition (as with tables converted from documents).
+    """
+    soup = bs4.BeautifulSoup(html, util.get_html_parser())
+    for table in soup.find_all("table"):
+        rows = [
+            [get_html_text_from_tag(cell) for cell in row.find_all(["td", "th"])]
+            for row in table.find_all("tr")
+        ]
+        rows = [row for row in rows if row]
+        if not rows:
+            continue
+
+        columns = _get_table_columns(rows[0])
+        if columns is not None:
+            rows = rows[1:]
+        elif all(len(row) == 2 for row in rows) and (
+            sum(is_acronym(row[0]) for row in rows) > len(rows) / 2
+        ):
+            columns = (0, 1)
+        else:
+            continue
+
+        name_column, definition_column = columns
+        for row in rows:
+            if len(row) > max(columns):
+                result = _make_row(row[name_column], row[definition_column], source)
+                if result is not None:
+                    yield result
+        table.decompose()
+
+    for tag in soup.find_all(["p", "li"]):
+        match = _equals_re.match(get_html_text_from_tag(tag))
+        if match is not None:
+            result = _make_row(match["name"], match["definition"], source)
+            if result is not None:
+                yield result
+
+
+def extract_text_rows(text: str, source: str) -> Generator[Row, None, None]:
+    """
+    Extract acronyms from plain text, line by line.
+
+    Lines of the form "X = Y" are always used; "X Y" lines only if the
+    acronym matches the initials of the definition.
+    """
+    for line in text.splitlines():
+        match = _equals_re.match(line)
+        if match is None:
+            match = _line_re.match(line)
+            if match is None or not initials_match(match["name"], match["definition"]):
+                continue
+        result = _make_row(match["name"], match["definition"], source)
+        if result is not None:
+            yield result
+
+
+def _iter_pdf_pages(path: pathlib.Path) -> Generator[tuple[int, str], None, None]:
+    try:
+        import pypdf
+    except ImportError:
+        raise RuntimeError("pypdf is required to ingest PDF files") from None
+
+    reader = pypdf.PdfReader(str(path))
+    for page_number, page in enumerate(reader.pages, 1):
+        yield page_number, page.extract_text() or ""
+
+
+def extract_document(path: pathlib.Path) -> list[Row]:
+    """Extract acronym rows from one document."""
+    path = pathlib.Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".pdf":
+        rows = []
+        for page_number, text in _iter_pdf_pages(path):
+            rows.extend(extract_text_rows(text, f"{path.name} page {page_number}"))
+        return rows
+    if suffix == ".docx":
+        return list(extract_html_rows(pandoc.convert_cached(path, "docx"), path.name))
+    if suffix in (".htm", ".html"):
+        html = path.read_text(encoding="utf-8", errors="replace")
+        return list(extract_html_rows(html, path.name))
+    raise ValueError(f"Unsupported document type: {path}")
+
+
+def find_documents(directory: pathlib.Path) -> list[pathlib.Path]:
+    """All supported documents in ``directory`` and its subdirectories."""
+    return sorted(
+        path for path in pathlib.Path(directory).rglob("*")
+        if path.is_file() and path.suffix.lower() in DOCUMENT_SUFFIXES
+    )
+
+
+def _hash_file(path: pathlib.Path) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+@dataclasses.dataclass
+class IngestState:
+    """
+    A journal of ingested documents, one JSON object per line.
+
+    Documents are identified by content hash, so renamed or moved files are
+    not ingested twice, while changed files are ingested again.
+    """
+    path: pathlib.Path
+    #: document hash -> rows
+    completed: dict[str, list[Row]] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> IngestState:
+        state = cls(path=pathlib.Path(path))
+        try:
+            fp = open(path, "rb")
+        except FileNotFoundError:
+            return state
+
+        with fp:
+            offset = 0
+            for line in fp:
+                if not line.endswith(b"\n"):
+                    # Interrupted while writing the last entry; drop it so
+                    # that new entries start on a line of their own
+                    logger.debug("Truncating the incomplete entry in %s", path)
+                    os.truncate(path, offset)
+                    break
+                offset += len(line)
+                try:
+                    entry = json.loads(line)
+                    if "rows" in entry:
+                        rows = [tuple(row) for row in entry["rows"]]
+                        state.completed[entry["sha256"]] = rows
+                except (ValueError, TypeError, KeyError) as ex:
+                    # A damaged entry only means its document is ingested again
+                    logger.warning(
+                        "Skipping an unreadable entry in %s: %s: %s",
+                        path, type(ex).__name__, ex,
+                    )
+        return state
+
+    def record(
+        self,
+        document: pathlib.Path,
+        sha256: str,
+        rows: Optional[list[Row]] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record a document as ingested, or failed if ``error`` is given."""
+        entry = {"document": str(document), "sha256": sha256}
+        if error is not None:
+            entry["error"] = error
+        else:
+            entry["rows"] = rows
+            self.completed[sha256] = rows
+        with open(self.path, "at", encoding="utf-8") as fp:
+            fp.write(json.dumps(entry) + "\n")
+            fp.flush()
+            os.fsync(fp.fileno())
+
+
+def _extract_worker(path: pathlib.Path) -> list[Row]:
+    return extract_document(path)
+
+
+def write_rows(rows: Iterable[Row], path: pathlib.Path) -> int:
+    """Write unique rows sorted by acronym, returning the number written."""
+    rows = sorted(set(rows), key=lambda row: (row[0].casefold(), row))
+    with util.atomic_write(path, "wt", encoding="utf-8", newline="") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(COLUMNS)
+        writer.writerows(rows)
+    return len(rows)
+
+
+def ingest(
+    documents: list[pathlib.Path],
+    output: pathlib.Path,
+    state_path: Optional[pathlib.Path] = None,
+    max_workers: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """
+    Extract acronyms from ``documents`` into the CSV file ``output``.
+
+    Parameters
+    ----------
+    documents : list of pathlib.Path
+        The documents to ingest; see ``find_documents``.
+    output : pathlib.Path
+        The CSV file to write, once all documents are processed.
+    state_path : pathlib.Path, optional
+        The journal used to resume an interrupted run.  Defaults to
+        ``output`` with the suffix ``.ingest.jsonl``.
+    max_workers : int, optional
+        The number of worker processes.  0 extracts in this process.
+    progress : callable, optional
+        Called with (completed, total, document) as each document finishes.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    output = pathlib.Path(output)
+    state = IngestState.load(state_path or output.with_name(output.name + STATE_SUFFIX))
+    hashes = {document: _hash_file(document) for document in documents}
+    pending = [
+        document for document in documents if hashes[document] not in state.completed
+    ]
+    total = len(documents)
+    completed = total - len(pending)
+    if completed:
+        logger.info("Resuming: %d of %d documents already ingested", completed, total)
+
+    def finish(document: pathlib.Path, get_rows: Callable[[], list[Row]]) -> None:
+        nonlocal completed
+        try:
+            rows = get_rows()
+        except Exception as ex:
+            logger.warning("Failed to ingest %s: %s: %s", document, type(ex).__name__, ex)
+            state.record(document, hashes[document], error=f"{type(ex).__name__}: {ex}")
+        else:
+            state.record(document, hashes[document], rows=rows)
+        completed += 1
+        if progress is not None:
+            progress(completed, total, document)
+
+    if max_workers == 0:
+        for document in pending:
+            finish(document, lambda: extract_document(document))
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(util.HTML_PARSER, util.CACHE_PATH),
+        ) as executor:
+            futures = {
+                executor.submit(_extract_worker, document): document
+                for document in pending
+            }
+            for future in concurrent.futures.as_completed(futures):
+                finish(futures[future], future.result)
+
+    rows = (
+        row
+        for document in documents
+        for row in state.completed.get(hashes[document], [])
+    )
+    return write_rows(rows, output)
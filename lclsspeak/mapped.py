@@ -0,0 +1,267 @@
+"""
+A read-only name index in a single memory-mapped file.
+
+Each process that builds a ``NameIndex`` holds a private copy of every
+definition.  A ``MappedIndex`` instead looks names up directly in a file
+mapped into memory, so that processes share its pages through the operating
+system's page cache and open it without parsing anything.
+
+The file is laid out as follows, with all integers little-endian:
+
+* A header (see ``_HEADER``) with the format version, the fingerprint of the
+  database it was built from, the numbers of definitions and keys, and the
+  positions of the tables below.
+* The definition table: ``num_definitions + 1`` uint64 file positions of
+  each definition record.
+* The key table: ``num_keys + 1`` uint64 file positions of each key.  Keys
+  are normalized names (see ``index.normalize_name``) sorted by their UTF-8
+  encoding, so they may be binary searched.
+* The posting table: ``num_keys + 1`` uint32 positions in the postings.
+* The postings: uint32 definition numbers for each key, in definition order.
+* The keys, UTF-8 encoded, followed by the definitions as compact JSON.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import mmap
+import pathlib
+import struct
+from typing import Any, Generator, Iterable, Optional
+
+from . import util
+from .definition import Definition
+from .index import normalize_name
+
+logger = logging.getLogger(__name__)
+
+#: Bump this when the on-disk format changes.
+MAPPED_VERSION = 1
+MAPPED_FILENAME = "lclsspeak.idx"
+MAGIC = b"LCLSIDX\0"
+
+#: magic, version, fingerprint, num_definitions, num_keys, and the positions
+#: of the definition, key, and posting tables and the postings.
+_HEADER = struct.Struct("<8sI64sIIQQQQ")
+
+
+class MappedIndexError(Exception):
+    ...
+
+
+def get_mapped_index_path() -> pathlib.Path:
+    return util.CACHE_PATH / MAPPED_FILENAME
+
+
+def _pack(format: str, values: list[int]) -> bytes:
+    return struct.pack(f"<{len(values)}{format}", *values)
+
+
+def write_mapped_index(
+    definitions: Iterable[Definition],
+    path: pathlib.Path,
+    fingerprint: str = "",
+) -> None:
+    """
+    Write ``definitions`` and their name index to ``path``.
+
+    Any existing file at ``path`` is replaced.
+
+    Parameters
+    ----------
+    definitions : iterable of Definition
+        The definitions to index.
+    path : pathlib.Path
+        The index filename.
+    fingerprint : str, optional
+        Identifies the definitions, e.g., ``database.get_fingerprint()``.
+    """
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    records = []
+    postings: dict[bytes, list[int]] = {}
+    for idx, defn in enumerate(definitions):
+        records.append(encode(defn.to_dict()).encode("utf-8"))
+        keys = {normalize_name(defn.name)}
+        keys.update(normalize_name(alternate) for alternate in defn.alternates or [])
+        for key in keys:
+            if key:
+                postings.setdefault(key.encode("utf-8"), []).append(idx)
+
+    keys = sorted(postings)
+    definition_table = _HEADER.size
+    key_table = definition_table + 8 * (len(records) + 1)
+    posting_table = key_table + 8 * (len(keys) + 1)
+    posting_start = posting_table + 4 * (len(keys) + 1)
+    blob_start = posting_start + 4 * sum(len(ids) for ids in postings.values())
+
+    key_positions = [blob_start]
+    for key in keys:
+        key_positions.append(key_positions[-1] + len(key))
+    record_positions = [key_positions[-1]]
+    for record in records:
+        record_positions.append(record_positions[-1] + len(record))
+    posting_positions = [0]
+    for key in keys:
+        posting_positions.append(posting_positions[-1] + len(postings[key]))
+
+    header = _HEADER.pack(
+        MAGIC,
+        MAPPED_VERSION,
+        fingerprint.encode("ascii"),
+        len(records),
+        len(keys),
+        definition_table,
+        key_table,
+        posting_table,
+        posting_start,
+    )
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with util.atomic_write(path, "wb") as fp:
+        fp.write(header)
+        fp.write(_pack("Q", record_positions))
+        fp.write(_pack("Q", key_positions))
+        fp.write(_pack("I", posting_positions))
+        for key in keys:
+            fp.write(_pack("I", postings[key]))
+        fp.writelines(keys)
+        fp.writelines(records)
+
+
+@dataclasses.dataclass
+class MappedIndex:
+    """
+    Definitions looked up by name with a binary search of a mapped file.
+
+    Supports the lookup methods of ``NameIndex``.  Definitions are decoded on
+    each lookup, and may be modified without affecting the index.
+    """
+    path: pathlib.Path
+    fingerprint: str = dataclasses.field(init=False)
+    num_definitions: int = dataclasses.field(init=False)
+    num_keys: int = dataclasses.field(init=False)
+    _mmap: mmap.mmap = dataclasses.field(init=False, repr=False)
+    _tables: tuple[int, int, int, int] = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.path = pathlib.Path(self.path)
+        with open(self.path, "rb") as fp:
+            try:
+                self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise MappedIndexError(f"Empty index file: {self.path}") from None
+
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise MappedIndexError(f"Truncated index file: {self.path}")
+
+        magic, version, fingerprint, num_definitions, num_keys, *tables = (
+            _HEADER.unpack_from(self._mmap, 0)
+        )
+        if magic != MAGIC or version != MAPPED_VERSION:
+            self.close()
+            raise MappedIndexError(
+                f"Unsupported index file {self.path}: {magic!r} version {version}"
+            )
+        self.fingerprint = fingerprint.rstrip(b"\0").decode("ascii")
+        self.num_definitions = num_definitions
+        self.num_keys = num_keys
+        self._tables = tuple(tables)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> MappedIndex:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _get_key(self, idx: int) -> bytes:
+        start, end = struct.unpack_from("<QQ", self._mmap, self._tables[1] + 8 * idx)
+        return self._mmap[start:end]
+
+    def _find_key(self, key: bytes) -> Optional[int]:
+        lo, hi = 0, self.num_keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._get_key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.num_keys and self._get_key(lo) == key:
+            return lo
+        return None
+
+    def get(self, idx: int) -> Definition:
+        """Decode the definition numbered ``idx``."""
+        if not 0 <= idx < self.num_definitions:
+            raise IndexError("MappedIndex definition out of range")
+        start, end = struct.unpack_from("<QQ", self._mmap, self._tables[0] + 8 * idx)
+        return Definition.from_dict(json.loads(self._mmap[start:end]))
+
+    def lookup(self, name: str) -> list[Definition]:
+        """Find all definitions matching ``name`` across all sources."""
+        key_idx = self._find_key(normalize_name(name).encode("utf-8"))
+        if key_idx is None:
+            return []
+        start, end = struct.unpack_from("<II", self._mmap, self._tables[2] + 4 * key_idx)
+        ids = struct.unpack_from(f"<{end - start}I", self._mmap, self._tables[3] + 4 * start)
+        return [self.get(idx) for idx in ids]
+
+    def lookup_many(self, names: Iterable[str]) -> dict[str, list[Definition]]:
+        """Find definitions for each of ``names``, keyed by the given name."""
+        return {name: self.lookup(name) for name in names}
+
+    def keys(self) -> Generator[str, None, None]:
+        """All normalized names in the index, in sorted order."""
+        for idx in range(self.num_keys):
+            yield self._get_key(idx).decode("utf-8")
+
+    def __iter__(self) -> Generator[Definition, None, None]:
+        for idx in range(self.num_definitions):
+            yield self.get(idx)
+
+    def __contains__(self, name: str) -> bool:
+        return self._find_key(normalize_name(name).encode("utf-8")) is not None
+
+    def __len__(self) -> int:
+        return self.num_keys
+
+
+def load_mapped_index(
+    path: Optional[pathlib.Path] = None,
+    rebuild: bool = False,
+) -> MappedIndex:
+    """
+    Open the mapped index of the compiled database.
+
+    The index is (re)written from the database if it is missing or out of
+    date, after which other processes open it without reading the database.
+
+    Parameters
+    ----------
+    path : pathlib.Path, optional
+        The index path.  Defaults to one in ``util.CACHE_PATH``.
+    rebuild : bool, optional
+        Rebuild the database and index even if they are up-to-date.
+    """
+    from . import database
+
+    path = pathlib.Path(path or get_mapped_index_path())
+    fingerprint = database.get_fingerprint()
+    if not rebuild:
+        try:
+            index = MappedIndex(path)
+        except (OSError, MappedIndexError):
+            pass
+        else:
+            if index.fingerprint == fingerprint:
+                return index
+            index.close()
+
+    logger.debug("Writing the mapped index to %s", path)
+    definitions = database.load_database(rebuild=rebuild)
+    write_mapped_index(definitions, path, fingerprint=fingerprint)
+    return MappedIndex(path)
@@ -0,0 +1,139 @@
+"""
+Merging of duplicate definitions across sources.
+
+The same acronym is often defined by several sources with identical or
+nearly identical text (e.g., "Accelerator Control Room" and "accelerator
+control room.").  ``merge_definitions`` groups definitions by normalized name
+and, within each group, collapses definitions by a hash of their normalized
+text.  Optionally, definitions which are merely similar are merged as well.
+
+A merged definition takes its text, source, and URL from the first definition
+of its kind, and lists every contributing source under
+``metadata["sources"]``.
+"""
+from __future__ import annotations
+
+import dataclasses
+import difflib
+import re
+from typing import Any, Iterable, Optional
+
+from .definition import Definition
+from .index import normalize_name
+
+_non_word_re = re.compile(r"[\W_]+")
+
+
+def normalize_definition(text: str) -> str:
+    """
+    Normalize definition text for comparison purposes.
+
+    Text is case-folded, punctuation removed, and whitespace collapsed.
+    """
+    return " ".join(_non_word_re.sub(" ", text.casefold()).split())
+
+
+def _is_similar(first: str, second: str, similarity: float) -> bool:
+    matcher = difflib.SequenceMatcher(None, first, second, autojunk=False)
+    # Cheaper upper bounds first
+    return (
+        matcher.real_quick_ratio() >= similarity
+        and matcher.quick_ratio() >= similarity
+        and matcher.ratio() >= similarity
+    )
+
+
+def _get_provenance(defn: Definition) -> dict[str, Any]:
+    url = defn.url
+    return {
+        "source": defn.source,
+        "url": {"url": url.url, "text": url.text} if url is not None else None,
+        "definition": defn.definition,
+    }
+
+
+@dataclasses.dataclass
+class _MergedEntry:
+    """Definitions merged into one, along with its normalized text."""
+    text: str
+    members: list[Definition] = dataclasses.field(default_factory=list)
+
+    def to_definition(self) -> Definition:
+        first = self.members[0]
+        if len(self.members) == 1:
+            return first
+
+        alternates = {}
+        tags = {}
+        metadata = dict(first.metadata)
+        for defn in self.members:
+            alternates.update(dict.fromkeys(defn.alternates or []))
+            tags.update(dict.fromkeys(defn.tags))
+            for key, value in defn.metadata.items():
+                metadata.setdefault(key, value)
+
+        metadata["sources"] = [_get_provenance(defn) for defn in self.members]
+        return dataclasses.replace(
+            first,
+            alternates=list(alternates) or first.alternates,
+            tags=list(tags),
+            metadata=metadata,
+        )
+
+
+def merge_definitions(
+    definitions: Iterable[Definition],
+    similarity: Optional[float] = None,
+) -> list[Definition]:
+    """
+    Merge duplicate definitions of the same name.
+
+    Definitions are grouped by ``index.normalize_name`` and merged when their
+    ``normalize_definition`` text is equal, which takes time linear in the
+    number of definitions.  Input definitions are not modified.
+
+    Parameters
+    ----------
+    definitions : iterable of Definition
+        The definitions to merge.
+    similarity : float, optional
+        Also merge definitions whose normalized text has a
+        ``difflib.SequenceMatcher`` ratio of at least this value (0 to 1)
+        with that of an earlier definition of the same name.  Names rarely
+        have more than a handful of definitions, so this remains close to
+        linear in practice.
+
+    Returns
+    -------
+    list of Definition
+        The merged definitions, in order of first appearance.  Definitions
+        that were not merged are returned as-is.
+    """
+    if similarity is not None and not 0.0 < similarity <= 1.0:
+        raise ValueError(f"similarity must be in (0, 1]; got {similarity}")
+
+    entries: list[_MergedEntry] = []
+    # normalized name -> normalized text -> entry
+    groups: dict[str, dict[str, _MergedEntry]] = {}
+    for defn in definitions:
+        group = groups.setdefault(normalize_name(defn.name), {})
+        text = normalize_definition(defn.definition)
+        entry = group.get(text)
+        if entry is None and similarity is not None:
+            entry = next(
+                (
+                    candidate for candidate in group.values()
+                    if _is_similar(text, candidate.text, similarity)
+                ),
+                None,
+            )
+            if entry is not None:
+                # Later text of this form goes straight to the entry
+                group[text] = entry
+        if entry is None:
+            entry = _MergedEntry(text=text)
+            group[text] = entry
+            entries.append(entry)
+        entry.members.append(defn)
+
+    return [entry.to_definition() for entry in entries]
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
+import concurrent.futures
+import csv
 import dataclasses
-import io
+import heapq
 import logging
 import pathlib
 import re
-import subprocess
-from typing import Any, Callable, Generator, Optional
+from typing import (TYPE_CHECKING, Any, Callable, Generator, Iterable, Optional,
+                    Sequence, Union)
 
 import bs4
-import pandas as pd
-import requests
 
-from . import slacspeak, util
+if TYPE_CHECKING:
+    # pandas is only imported as needed, as it is slow to import
+    import pandas as pd
+
+from . import cache, htmlscan, pandoc, remote, slacspeak, util
 from .definition import URL, Definition
 
 logger = logging.getLogger(__name__)
@@ -54,6 +58,28 @@ def _append_data(existing: str | list[str], value: str, delimiter: str = "\n") -
     return delimiter.join((existing.rstrip(), value))
 
 
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return False
+
+    import pandas as pd
+    return pd.api.types.is_scalar(value) and bool(pd.isna(value))
+
+
+def _append_data_columns(
+    existing: pd.Series, values: pd.Series, present: pd.Series
+) -> pd.Series:
+    """Vectorized ``_append_data`` for string values, where ``present``."""
+    values = values.str.strip()
+    appended = existing.where(
+        existing == "",
+        existing.str.rstrip() + "\n" + values,
+    ).where(existing != "", values)
+    return appended.where(present, existing)
+
+
 @dataclasses.dataclass
 class NamedData:
     column_to_key: dict[str, str]
@@ -68,7 +94,7 @@ class NamedData:
         }
         for col, key in self.column_to_key.items():
             value = row.get(col, None)
-            if value is not None:
+            if not _is_missing(value):
                 value = str(value)
                 if key == "metadata":
                     data["metadata"][col] = value
@@ -81,9 +107,59 @@ class NamedData:
     def map_series_to_definition(self, row: pd.Series) -> Definition:
         return self.map_dict_to_definition(dict(row))
 
-    def map_to_definitions(self, df: pd.DataFrame) -> list[Definition]:
+    def map_rows_to_definitions(self, df: pd.DataFrame) -> list[Definition]:
+        """Map each row of ``df`` to a Definition, one row at a time."""
         return [self.map_series_to_definition(row) for _, row in df.iterrows()]
 
+    def map_to_definitions(self, df: pd.DataFrame) -> list[Definition]:
+        """
+        Map each row of ``df`` to a Definition.
+
+        The text fields are computed a column at a time across the whole frame
+        and Definitions are only created at the end.  The result is identical
+        to ``map_rows_to_definitions``.
+        """
+        import pandas as pd
+
+        num_rows = len(df)
+        empty = pd.Series([""] * num_rows, index=df.index, dtype=object)
+        text = {"name": empty, "definition": empty, "source": empty}
+        tags = [[] for _ in range(num_rows)]
+        metadata = [{"source_columns": []} for _ in range(num_rows)]
+
+        for col, key in self.column_to_key.items():
+            if col not in df.columns:
+                continue
+
+            column = df[col]
+            present = column.notna()
+            values = column.astype(str).astype(object)
+            present_rows = present.to_numpy().nonzero()[0]
+            if key == "metadata":
+                for row, value in zip(present_rows, values.iloc[present_rows]):
+                    metadata[row][col] = value
+                continue
+
+            if key == "tags":
+                for row, value in zip(present_rows, values.iloc[present_rows]):
+                    tags[row].append(value.strip())
+            else:
+                text[key] = _append_data_columns(
+                    text.get(key, empty), values, present
+                )
+            for row in present_rows:
+                metadata[row]["source_columns"].append(col)
+
+        columns = {key: value.tolist() for key, value in text.items()}
+        return [
+            Definition(
+                tags=tags[row],
+                metadata=metadata[row],
+                **{key: value[row] for key, value in columns.items()},
+            )
+            for row in range(num_rows)
+        ]
+
 
 @dataclasses.dataclass
 class DataSource:
@@ -93,15 +169,79 @@ class DataSource:
     def data(self):
         return self.load()
 
-    def load(self, use_cache: bool = True) -> list[Definition]:
+    @property
+    def remote_url(self) -> Optional[str]:
+        """The URL the cached file is downloaded from, if it may be."""
+        return None
+
+    def get_fetch_request(self) -> Optional[remote.FetchRequest]:
+        """How to download the source, if it may be."""
+        if self.remote_url is None:
+            return None
+        return remote.FetchRequest(
+            name=self.url.text, url=self.remote_url, path=self.cached
+        )
+
+    def refresh(self, **kwargs) -> Optional[remote.FetchResult]:
+        """
+        Download the source to its cached file, if it changed remotely.
+
+        Keyword arguments are passed to ``remote.fetch``.  Returns None for
+        sources which are only available locally.
+        """
+        request = self.get_fetch_request()
+        if request is None:
+            return None
+        return remote.fetch(request.url, request.path, token=request.token, **kwargs)
+
+    def get_fingerprint(self) -> str:
+        """Fingerprint the configuration and cached file; see ``cache``."""
+        return cache.get_fingerprint(self, [self.cached])
+
+    def load(self, use_cache: bool = True, persistent: bool = True) -> list[Definition]:
+        """
+        Load definitions from the cached file.
+
+        Parameters
+        ----------
+        use_cache : bool, optional
+            If False, first refresh the cached file from the remote source.
+            Definitions are only parsed again if it changed.
+        persistent : bool, optional
+            Reuse definitions parsed by an earlier process, if the source is
+            unchanged.  See ``cache``.
+        """
+        if not use_cache:
+            result = self.refresh()
+            if result is not None and result.changed:
+                self._data = None
         if self._data is None:
-            self._data = list(self._load(use_cache=use_cache))
+            if persistent:
+                self._data = cache.load_cached(self.get_fingerprint(), self._load)
+            else:
+                self._data = list(self._load())
         return self._data
 
-    def _load(self, use_cache: bool = True) -> list[Definition]:
+    def _load(self) -> Iterable[Definition]:
         raise NotImplementedError
 
 
+def read_csv_rows(
+    fp: Iterable[str], delimiter: str = ","
+) -> Generator[dict[str, str], None, None]:
+    """
+    Read rows of a CSV file with a header as dictionaries.
+
+    As with ``pandas.read_csv``, empty values are omitted.
+    """
+    for row in csv.DictReader(fp, delimiter=delimiter):
+        yield {
+            key: value
+            for key, value in row.items()
+            if key is not None and value
+        }
+
+
 @dataclasses.dataclass
 class CsvData(DataSource):
     cached: pathlib.Path
@@ -110,20 +250,50 @@ class CsvData(DataSource):
     encoding: str = "utf-8"
     _data: Optional[list[Definition]] = None
     delimiter: str = ","
+    #: "csv" to stream rows with the standard library or "pandas".  Either
+    #: way, every cell is text and only empty cells are missing: values such
+    #: as "NA" (an acronym) or "N/A" are kept as-is, and numbers unformatted.
+    backend: str = "csv"
+    #: Where to download the CSV from, if ``url`` is not the file itself.
+    download_url: Optional[str] = None
 
     # @property
     # def source(self) -> str:
     #     return self.url.text
 
-    def _load(self, use_cache: bool = True) -> list[Definition]:
-        if use_cache:
-            with open(self.cached, "rt", encoding=self.encoding) as fp:
-                source = fp.read()
+    @property
+    def remote_url(self) -> Optional[str]:
+        return self.download_url
+
+    def _map_with_csv(self) -> Generator[Definition, None, None]:
+        with open(self.cached, "rt", encoding=self.encoding, newline="") as fp:
+            for row in read_csv_rows(fp, delimiter=self.delimiter):
+                yield self.mapping.map_dict_to_definition(row)
+
+    def _map_with_pandas(self) -> list[Definition]:
+        import pandas as pd
+
+        with open(self.cached, "rt", encoding=self.encoding) as fp:
+            # Match the csv backend, rather than pandas' type inference and
+            # its default NA values
+            df = pd.read_csv(
+                fp,
+                delimiter=self.delimiter,
+                dtype=str,
+                keep_default_na=False,
+                na_values=[""],
+            )
+        return self.mapping.map_to_definitions(df)
+
+    def _load(self) -> Generator[Definition, None, None]:
+        if self.backend == "csv":
+            definitions = self._map_with_csv()
+        elif self.backend == "pandas":
+            definitions = self._map_with_pandas()
         else:
-            source = requests.get(self.url.url).text
+            raise ValueError(f"Unsupported CSV backend: {self.backend!r}")
 
-        df = pd.read_csv(io.StringIO(source), delimiter=self.delimiter)
-        for defn in self.mapping.map_to_definitions(df):
+        for defn in definitions:
             if not defn.source:
                 # Some source is required
                 defn.source = self.url.text
@@ -146,6 +316,58 @@ def _default_fixers() -> list[Fixer]:
     return [fixer_remove_prefixes]
 
 
+def _tag_matches(
+    tag: bs4.element.Tag, name: Union[str, Sequence[str]], attrs: dict[str, str]
+) -> bool:
+    names = [name] if isinstance(name, str) else name
+    if tag.name not in names:
+        return False
+    for attr, value in attrs.items():
+        actual = tag.get(attr)
+        if isinstance(actual, list):
+            if value not in actual and value != " ".join(actual):
+                return False
+        elif actual != value:
+            return False
+    return True
+
+
+@dataclasses.dataclass
+class HtmlSection:
+    """
+    A section of an already-parsed document: the elements following a
+    section header, up to the next header.
+
+    This supports enough of the ``bs4.element.Tag`` interface for extractors,
+    without re-parsing the section.
+    """
+    title: str
+    elements: list[bs4.element.PageElement]
+
+    def find_all(
+        self, name: Union[str, Sequence[str]], attrs: Optional[dict[str, str]] = None
+    ) -> list[bs4.element.Tag]:
+        """Find elements by tag name, or any of a list of names, as in bs4."""
+        attrs = attrs or {}
+        results = []
+        for element in self.elements:
+            if isinstance(element, bs4.element.Tag):
+                if _tag_matches(element, name, attrs):
+                    results.append(element)
+                results.extend(element.find_all(name, attrs))
+        return results
+
+
+#: An HTML document, either as source code or already parsed.
+HtmlSource = Union[bs4.element.Tag, HtmlSection, str]
+
+
+def _to_soup(source: HtmlSource, parser: Optional[str] = None) -> bs4.element.Tag | HtmlSection:
+    if isinstance(source, str):
+        return bs4.BeautifulSoup(source, util.get_html_parser(parser))
+    return source
+
+
 @dataclasses.dataclass
 class HtmlTable:
     mapping: NamedData
@@ -153,11 +375,8 @@ class HtmlTable:
     class_: Optional[str] = None
     fixers: list[Fixer] = dataclasses.field(default_factory=_default_fixers)
 
-    def extract(self, source: bs4.BeautifulSoup | str) -> Generator[Definition, None, None]:
-        if isinstance(source, bs4.BeautifulSoup):
-            soup = source
-        else:
-            soup = bs4.BeautifulSoup(source, "html.parser")
+    def extract(self, source: HtmlSource) -> Generator[Definition, None, None]:
+        soup = _to_soup(source)
         attrs = {}
         source = "html_table"
         if self.id:
@@ -179,59 +398,142 @@ class HtmlTable:
 
 
 class SourceScraper:
-    def scrape(self, source: bs4.BeautifulSoup | str) -> Generator[Definition, None, None]:
+    def scrape(self, source: HtmlSource) -> Generator[Definition, None, None]:
         raise NotImplementedError
 
 
+def _collect_required_literals(parsed, sre_parse, literals: list[str]) -> None:
+    for op, arg in parsed:
+        if op is sre_parse.LITERAL:
+            literals.append(chr(arg))
+        elif op is sre_parse.SUBPATTERN:
+            _, add_flags, _, subpattern = arg
+            if not add_flags & re.IGNORECASE:
+                _collect_required_literals(subpattern, sre_parse, literals)
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            min_count, _, subpattern = arg
+            if min_count >= 1:
+                _collect_required_literals(subpattern, sre_parse, literals)
+
+
+def get_required_literals(regex: re.Pattern) -> str:
+    """
+    Characters which appear in any match of ``regex``.
+
+    Only literals outside of alternations and optional parts are found, so
+    this may be incomplete, but never wrong.  The analysis relies on the
+    internal ``re`` parser; should that change, no literals are found and
+    scraping is unaffected other than being slower.
+    """
+    try:
+        try:
+            from re import _parser as sre_parse
+        except ImportError:  # Python < 3.11
+            import sre_parse
+
+        parsed = sre_parse.parse(regex.pattern, regex.flags)
+        if not isinstance(regex.pattern, str) or parsed.state.flags & re.IGNORECASE:
+            return ""
+        literals = []
+        _collect_required_literals(parsed, sre_parse, literals)
+    except Exception:
+        # tests/test_packaged.py checks that this does not happen for the
+        # packaged patterns
+        logger.warning("Unable to analyze regex %s", regex, exc_info=True)
+        return ""
+    return "".join(sorted(set(literals)))
+
+
+@dataclasses.dataclass(frozen=True)
+class _RegexPlan:
+    regex: re.Pattern
+    #: Skip text missing any of these characters, which cannot match.
+    required: str
+    #: (group name, is a Definition field)
+    groups: tuple[tuple[str, bool], ...]
+    default_source: str
+
+    @classmethod
+    def from_regex(cls, regex: re.Pattern) -> _RegexPlan:
+        fields = {field.name for field in dataclasses.fields(Definition)}
+        return cls(
+            regex=regex,
+            required=get_required_literals(regex),
+            groups=tuple((name, name in fields) for name in regex.groupindex),
+            default_source=f"regex_scraper_{regex}",
+        )
+
+    def scan(self, text: str) -> Generator[Definition, None, None]:
+        for char in self.required:
+            if char not in text:
+                return
+
+        for match in self.regex.finditer(text):
+            info = {}
+            metadata = {}
+            for name, is_field in self.groups:
+                value = match.group(name)
+                if value is None:
+                    continue
+                if is_field:
+                    info[name] = value.strip()
+                else:
+                    metadata[name] = value.strip()
+
+            if metadata:
+                info["metadata"] = metadata
+            if "source" not in info:
+                info["source"] = self.default_source
+
+            defn = Definition(**info)
+            if defn.valid:
+                yield defn
+
+
 @dataclasses.dataclass
 class RegexHtmlScraper(SourceScraper):
     tags: list[str]
     regexes: list[re.Pattern]
+    _plans: Optional[list[_RegexPlan]] = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
 
-    def scrape(self, source: bs4.BeautifulSoup | str) -> Generator[Definition, None, None]:
-        if isinstance(source, bs4.BeautifulSoup):
-            soup = source
-        else:
-            soup = bs4.BeautifulSoup(source, "html.parser")
-        valid_keys = set(Definition.__annotations__)
-        for tag in self.tags:
-            for element in soup.find_all(tag):
+    def _get_plans(self) -> list[_RegexPlan]:
+        if self._plans is None:
+            self._plans = [_RegexPlan.from_regex(regex) for regex in self.regexes]
+        return self._plans
+
+    def scrape(self, source: HtmlSource) -> Generator[Definition, None, None]:
+        soup = _to_soup(source)
+        plans = self._get_plans()
+        # Find all tags in one pass, while keeping the results ordered by tag
+        # and then by position in the document
+        by_tag = {tag: [] for tag in self.tags}
+        for element in soup.find_all(list(by_tag)):
+            by_tag[element.name].append(element)
+
+        for elements in by_tag.values():
+            for element in elements:
                 text = get_html_text_from_tag(element)
-                for regex in self.regexes:
-                    for match in regex.finditer(text):
-                        info = match.groupdict()
-                        metadata = {}
-                        for key, value in list(info.items()):
-                            value = value.strip()
-                            if key not in valid_keys:
-                                info.pop(key)
-                                metadata[key] = value
-                            else:
-                                info[key] = value
-
-                        if "source" not in info:
-                            info["source"] = f"regex_scraper_{regex}"
-
-                        defn = Definition(**info)
-                        if defn.valid:
-                            yield defn
+                for plan in plans:
+                    yield from plan.scan(text)
 
 
 def split_html_by_section(
-    soup: bs4.BeautifulSoup, tag: str
-) -> Generator[tuple[str, bs4.BeautifulSoup], None, None]:
+    soup: bs4.element.Tag, tag: str
+) -> Generator[tuple[str, HtmlSection], None, None]:
     headers = soup.find_all(tag)
     if not headers:
         return
 
     for header in headers:
-        buffer = []
+        elements = []
         header_text = get_html_text_from_tag(header)
         for sibling in header.next_siblings:
             if sibling.name and sibling.name.lower() == tag:
                 break
-            buffer.append(str(sibling))
-        yield header_text, bs4.BeautifulSoup("".join(buffer))
+            elements.append(sibling)
+        yield header_text, HtmlSection(title=header_text, elements=elements)
 
 
 @dataclasses.dataclass
@@ -242,18 +544,15 @@ class SectionScraper(SourceScraper):
         default_factory=lambda: list(["h1"])
     )
 
-    def scrape(self, source: bs4.BeautifulSoup | str) -> Generator[Definition, None, None]:
-        if isinstance(source, bs4.BeautifulSoup):
-            soup = source
-        else:
-            soup = bs4.BeautifulSoup(source, "html.parser")
+    def scrape(self, source: HtmlSource) -> Generator[Definition, None, None]:
+        soup = _to_soup(source)
         for section_tag in self.section_tags:
-            for title, section_soup in split_html_by_section(soup, section_tag):
+            for title, section in split_html_by_section(soup, section_tag):
                 if title not in self.section_names and title.lower() not in self.section_names:
                     continue
 
                 for table in self.tables or []:
-                    yield from table.extract(section_soup)
+                    yield from table.extract(section)
 
 
 @dataclasses.dataclass
@@ -264,18 +563,39 @@ class WebsiteData(DataSource):
     scrapers: Optional[list[SourceScraper]] = None
     _data: Optional[list[Definition]] = None
     encoding: str = "utf-8"
+    #: The BeautifulSoup parser for this source; see ``util.get_html_parser``.
+    parser: Optional[str] = None
+    #: Only parse these elements (e.g., ["table"]), found by a quick scan of
+    #: the source; see ``htmlscan.extract_fragments``.
+    parse_only: Optional[list[str]] = None
 
     @property
     def source(self) -> str:
         return self.url.text
 
-    def _load(self, use_cache: bool = True) -> Generator[Definition, None, None]:
-        if use_cache:
-            with open(self.cached, "rt", encoding=self.encoding) as fp:
-                source = fp.read()
-        else:
-            # TODO: token Authorization: Bearer (token)
-            source = requests.get(self.url.url).text
+    def _parse(self, source: str) -> bs4.BeautifulSoup:
+        """Parse the document once, to be shared by all tables and scrapers."""
+        if self.parse_only:
+            source = "\n".join(htmlscan.extract_fragments(source, self.parse_only))
+        return bs4.BeautifulSoup(source, util.get_html_parser(self.parser))
+
+    @property
+    def remote_url(self) -> Optional[str]:
+        return self.url.url
+
+    def get_fetch_request(self) -> Optional[remote.FetchRequest]:
+        request = super().get_fetch_request()
+        if request is None or self.token is None:
+            return request
+        if not self.token:
+            # Without the token, we'd get a login page instead
+            logger.warning("Skipping %s: no access token is configured", request.name)
+            return None
+        return dataclasses.replace(request, token=self.token)
+
+    def _load(self) -> Generator[Definition, None, None]:
+        with open(self.cached, "rt", encoding=self.encoding) as fp:
+            source = self._parse(fp.read())
 
         for table in self.tables or []:
             for defn in table.extract(source):
@@ -300,22 +620,23 @@ class PandocData(WebsiteData):
         return self.url.text
 
     def _convert_to_html(self) -> str:
-        raw_html_bytes = subprocess.check_output(
-            [
-                "pandoc",
-                "-f",
-                self.input_format,
-                "-t",
-                "html",
-                str(self.cached.resolve()),
-            ]
+        return pandoc.convert_cached(self.cached, self.input_format)
+
+    def get_fingerprint(self) -> str:
+        # The definitions also depend on the pandoc version
+        return cache.get_fingerprint(
+            [self, pandoc.get_pandoc_version()], [self.cached]
         )
-        return raw_html_bytes.decode("utf-8")
 
-    def _load(self, use_cache: bool = True) -> Generator[Definition, None, None]:
-        if self._html_data is None or not use_cache:
+    @property
+    def remote_url(self) -> Optional[str]:
+        # Documents are only available locally
+        return None
+
+    def _load(self) -> Generator[Definition, None, None]:
+        if self._html_data is None:
             self._html_data = self._convert_to_html()
-        source = self._html_data
+        source = self._parse(self._html_data)
 
         for table in self.tables or []:
             for defn in table.extract(source):
@@ -335,6 +656,10 @@ _packaged_data: list[DataSource] = [
             text="Naming Convention Constituent Component Mnemonics (CCC) spreadsheet",
         ),
         cached=util.DATA_PATH / "pcds_ccc.csv",
+        download_url=(
+            "https://docs.google.com/spreadsheets/d/"
+            "1SeQhfwZ6O-wg8tyr_MCQZY1boJC-6j3N6EzexfZB-AU/export?format=csv"
+        ),
         mapping=NamedData(
             column_to_key={
                 "ccc": "name",
@@ -378,6 +703,7 @@ _external_data: list[DataSource] = [
         ),
         cached=util.DATA_PATH / "LCLS+Naming+Conventions.html",
         token=util.CONFLUENCE_TOKEN,
+        parse_only=["table"],
         tables=[
             HtmlTable(
                 mapping=NamedData(
@@ -416,6 +742,7 @@ _external_data: list[DataSource] = [
         ),
         cached=util.DATA_PATH / "MODS+Nomenclature.html",
         token=util.CONFLUENCE_TOKEN,
+        parse_only=["table"],
         tables=[
             HtmlTable(
                 mapping=NamedData(
@@ -441,6 +768,7 @@ _external_data: list[DataSource] = [
         ),
         cached=util.DATA_PATH / "Acronyms+that+are+commonly+encountered.html",
         token=util.CONFLUENCE_TOKEN,
+        parse_only=["ul", "ol"],
         scrapers=[
             RegexHtmlScraper(
                 tags=["li"],
@@ -488,12 +816,148 @@ def _add_packaged_docx_files():
             _packaged_data.append(source)
 
 
-def load_packaged_data() -> list[Definition]:
-    return [
-        item
-        for pkg in _packaged_data + _external_data
-        for item in pkg.load(use_cache=True)
-    ] + slacspeak.get_packaged_slacspeak()
+_executors = {
+    "process": concurrent.futures.ProcessPoolExecutor,
+    "thread": concurrent.futures.ThreadPoolExecutor,
+}
+
+
+def _get_slacspeak_fingerprint() -> str:
+    return cache.get_fingerprint("slacspeak", [util.get_slacspeak_path()])
+
+
+def _load_slacspeak() -> list[Definition]:
+    return cache.load_cached(
+        _get_slacspeak_fingerprint(), slacspeak.get_packaged_slacspeak
+    )
+
+
+def _load_source(source: DataSource) -> list[Definition]:
+    return source.load(use_cache=True)
+
+
+def _convert_documents(
+    sources: list[DataSource], max_workers: Optional[int] = None
+) -> None:
+    """Convert documents which need parsing with concurrent pandoc processes."""
+    to_convert = [
+        pkg for pkg in sources
+        if isinstance(pkg, PandocData)
+        and pkg._data is None
+        and pkg._html_data is None
+        and not cache.has_entry(pkg.get_fingerprint())
+    ]
+    by_format = {}
+    for pkg in to_convert:
+        by_format.setdefault(pkg.input_format, []).append(pkg)
+
+    for input_format, pkgs in by_format.items():
+        html = pandoc.convert_many(
+            [pkg.cached for pkg in pkgs], input_format, max_workers=max_workers
+        )
+        for pkg, html_data in zip(pkgs, html):
+            pkg._html_data = html_data
+
+
+def _init_worker(html_parser: str, cache_path: pathlib.Path) -> None:
+    # Settings changed at runtime (e.g., by --html-parser) are not inherited
+    # by worker processes which are spawned rather than forked
+    util.HTML_PARSER = html_parser
+    util.CACHE_PATH = cache_path
+
+
+def _get_executor(
+    parallel: str, max_workers: Optional[int] = None
+) -> concurrent.futures.Executor:
+    try:
+        executor_cls = _executors[parallel]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported parallel mode: {parallel!r} (options: {list(_executors)})"
+        ) from None
+    return executor_cls(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(util.HTML_PARSER, util.CACHE_PATH),
+    )
+
+
+def _iter_packaged_runs(
+    parallel: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> Generator[Iterable[Definition], None, None]:
+    sources = _packaged_data + _external_data
+    if parallel is None:
+        _convert_documents(sources, max_workers=max_workers)
+        for pkg in sources:
+            yield pkg.load(use_cache=True)
+        yield _load_slacspeak()
+        return
+
+    with _get_executor(parallel, max_workers=max_workers) as executor:
+        futures = [executor.submit(_load_source, pkg) for pkg in sources]
+        slacspeak_future = executor.submit(_load_slacspeak)
+        # Yield in source order, regardless of completion order
+        for pkg, future in zip(sources, futures):
+            # Keep the results, which are not shared with worker processes
+            pkg._data = future.result()
+            yield pkg._data
+        yield slacspeak_future.result()
+
+
+def iter_packaged_data(
+    sort_key: Optional[Callable[[Definition], Any]] = None,
+    parallel: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> Generator[Definition, None, None]:
+    """
+    Iterate over definitions from all packaged sources, one source at a time.
+
+    Parameters
+    ----------
+    sort_key : callable, optional
+        If given, each source is sorted individually and the sorted runs are
+        merged.  Ties keep the source order, matching a stable sort of the
+        full list.
+    parallel : {"process", "thread"}, optional
+        Load sources concurrently in a pool of processes or threads.  Results
+        are always in source order.
+    max_workers : int, optional
+        The maximum number of workers for ``parallel``.
+    """
+    runs = _iter_packaged_runs(parallel=parallel, max_workers=max_workers)
+    if sort_key is None:
+        for run in runs:
+            yield from run
+        return
+
+    runs = [sorted(run, key=sort_key) for run in runs]
+    yield from heapq.merge(*runs, key=sort_key)
+
+
+def get_fingerprints() -> list[str]:
+    """Fingerprints of all packaged sources, as used by ``cache``."""
+    fingerprints = [pkg.get_fingerprint() for pkg in _packaged_data + _external_data]
+    fingerprints.append(_get_slacspeak_fingerprint())
+    return fingerprints
+
+
+def get_fetch_requests() -> list[remote.FetchRequest]:
+    """All remote sources, including slacspeak, which may be downloaded."""
+    requests = [
+        request
+        for request in (pkg.get_fetch_request() for pkg in _packaged_data + _external_data)
+        if request is not None
+    ]
+    requests.append(slacspeak.get_fetch_request())
+    return requests
+
+
+def load_packaged_data(
+    parallel: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> list[Definition]:
+    return list(iter_packaged_data(parallel=parallel, max_workers=max_workers))
 
 
 _add_packaged_docx_files()
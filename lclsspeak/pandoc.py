@@ -0,0 +1,99 @@
+"""
+Document conversion with pandoc, cached on disk.
+
+Converted HTML is stored in ``util.CACHE_PATH / "pandoc"``, addressed by a
+hash of the input file, the input format, and the pandoc version.  Converting
+the same document again, even from another process, reads the cached HTML.
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import functools
+import hashlib
+import logging
+import pathlib
+import subprocess
+from typing import Optional, Sequence
+
+from . import util
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRECTORY = "pandoc"
+PANDOC_EXECUTABLE = "pandoc"
+
+
+@functools.lru_cache(maxsize=None)
+def get_pandoc_version(executable: str = PANDOC_EXECUTABLE) -> str:
+    """The pandoc version string, or an empty string if it is not installed."""
+    try:
+        output = subprocess.check_output([executable, "--version"])
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    return output.decode("utf-8", "replace").splitlines()[0].strip()
+
+
+def get_cache_path() -> pathlib.Path:
+    return util.CACHE_PATH / CACHE_DIRECTORY
+
+
+def get_cache_key(path: pathlib.Path, input_format: str = "docx") -> str:
+    hasher = hashlib.sha256(get_pandoc_version().encode("utf-8"))
+    hasher.update(input_format.encode("utf-8"))
+    hasher.update(pathlib.Path(path).read_bytes())
+    return hasher.hexdigest()
+
+
+def convert(path: pathlib.Path, input_format: str = "docx") -> str:
+    """Convert the document at ``path`` to HTML with pandoc."""
+    raw_html_bytes = subprocess.check_output(
+        [
+            PANDOC_EXECUTABLE,
+            "-f",
+            input_format,
+            "-t",
+            "html",
+            str(pathlib.Path(path).resolve()),
+        ]
+    )
+    return raw_html_bytes.decode("utf-8")
+
+
+def convert_cached(path: pathlib.Path, input_format: str = "docx") -> str:
+    """Convert the document at ``path`` to HTML, reusing any cached result."""
+    cache_file = get_cache_path() / f"{get_cache_key(path, input_format)}.html"
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        ...
+    except OSError as ex:
+        logger.warning("Unable to read cached conversion %s: %s", cache_file, ex)
+
+    html = convert(path, input_format)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with util.atomic_write(cache_file, "wt", encoding="utf-8") as fp:
+            fp.write(html)
+    except OSError as ex:
+        logger.warning("Unable to cache the conversion of %s: %s", path, ex)
+    return html
+
+
+def convert_many(
+    paths: Sequence[pathlib.Path],
+    input_format: str = "docx",
+    max_workers: Optional[int] = None,
+) -> list[str]:
+    """
+    Convert several documents to HTML, running pandoc processes concurrently.
+
+    Results are in the order of ``paths``.
+    """
+    if len(paths) <= 1:
+        return [convert_cached(path, input_format) for path in paths]
+
+    # Each conversion waits on a subprocess, so threads are sufficient
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(functools.partial(convert_cached, input_format=input_format), paths)
+        )
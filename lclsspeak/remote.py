@@ -0,0 +1,263 @@
+"""
+Conditional HTTP downloads of remote sources into their cached files.
+
+Each cached file may have a ``<name>.http.json`` file next to it holding the
+``ETag`` and ``Last-Modified`` headers of the response it came from.  These
+are sent back on the next request, so that an unchanged source costs a
+``304 Not Modified`` response rather than a full download and re-parse.
+"""
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import logging
+import pathlib
+import threading
+import time
+import urllib.parse
+from typing import TYPE_CHECKING, Optional, Union
+
+from . import util
+
+if TYPE_CHECKING:
+    # requests is only imported as needed, as it is slow to import
+    import requests
+
+logger = logging.getLogger(__name__)
+
+METADATA_SUFFIX = ".http.json"
+DEFAULT_TIMEOUT = 30.0
+#: HTTP status codes which are worth retrying.
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_sessions = threading.local()
+
+
+def get_session() -> requests.Session:
+    """
+    The session of the calling thread, which pools connections across
+    requests.
+
+    ``requests.Session`` is not thread-safe, so each thread (e.g., each
+    worker of ``fetch_all``) gets its own.
+    """
+    session = getattr(_sessions, "session", None)
+    if session is None:
+        import requests
+        session = _sessions.session = requests.Session()
+    return session
+
+
+@dataclasses.dataclass(frozen=True)
+class FetchRequest:
+    """A remote source to be downloaded to its cached file."""
+    name: str
+    url: str
+    path: pathlib.Path
+    token: Optional[str] = None
+
+
+@dataclasses.dataclass
+class FetchResult:
+    url: str
+    path: pathlib.Path
+    #: True if the cached file was created or its contents changed.
+    changed: bool
+    status_code: int
+    #: The size of the response body.
+    bytes_transferred: int = 0
+    elapsed: float = 0.0
+    attempts: int = 1
+
+
+def get_metadata_path(path: pathlib.Path) -> pathlib.Path:
+    path = pathlib.Path(path)
+    return path.with_name(path.name + METADATA_SUFFIX)
+
+
+def read_metadata(path: pathlib.Path) -> dict[str, str]:
+    """Read the HTTP metadata stored for the cached file at ``path``."""
+    try:
+        with open(get_metadata_path(path), "rt", encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_metadata(path: pathlib.Path, metadata: dict[str, str]) -> None:
+    with util.atomic_write(get_metadata_path(path), "wt", encoding="utf-8") as fp:
+        json.dump(metadata, fp, indent=2, sort_keys=True)
+
+
+def _sha256(path: pathlib.Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def fetch(
+    url: str,
+    path: pathlib.Path,
+    token: Optional[str] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    session: Optional[requests.Session] = None,
+) -> FetchResult:
+    """
+    Download ``url`` to ``path`` if it has changed.
+
+    Parameters
+    ----------
+    url : str
+        The URL to download.
+    path : pathlib.Path
+        The cached file, which is replaced atomically if the content changed.
+    token : str, optional
+        A bearer token for the Authorization header.
+    timeout : float, optional
+        Timeout in seconds for connecting and for each read.
+    session : requests.Session, optional
+        Defaults to the session of this thread from ``get_session``.
+    """
+    path = pathlib.Path(path)
+    session = session or get_session()
+    headers = {}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+
+    metadata = read_metadata(path)
+    if path.exists() and metadata.get("url") == url:
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        if metadata.get("last_modified"):
+            headers["If-Modified-Since"] = metadata["last_modified"]
+
+    t0 = time.monotonic()
+    response = session.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        logger.debug("%s is unchanged (304)", url)
+        return FetchResult(
+            url=url,
+            path=path,
+            changed=False,
+            status_code=response.status_code,
+            elapsed=time.monotonic() - t0,
+        )
+
+    response.raise_for_status()
+    content = response.content
+    digest = hashlib.sha256(content).hexdigest()
+    # Servers which ignore the conditional headers may still send identical
+    # content.  Compare against the file itself, which may have been removed
+    # or modified since it was downloaded.
+    changed = digest != _sha256(path)
+    if changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with util.atomic_write(path, "wb") as fp:
+            fp.write(content)
+
+    _write_metadata(
+        path,
+        {
+            "url": url,
+            "etag": response.headers.get("ETag", ""),
+            "last_modified": response.headers.get("Last-Modified", ""),
+            "sha256": digest,
+        },
+    )
+    logger.debug("%s: %s (%d bytes)", url, "changed" if changed else "unchanged", len(content))
+    return FetchResult(
+        url=url,
+        path=path,
+        changed=changed,
+        status_code=response.status_code,
+        bytes_transferred=len(content),
+        elapsed=time.monotonic() - t0,
+    )
+
+
+def _is_retryable(ex: Exception) -> bool:
+    import requests
+
+    if isinstance(ex, requests.HTTPError):
+        return ex.response is not None and ex.response.status_code in RETRY_STATUS_CODES
+    return isinstance(ex, (requests.ConnectionError, requests.Timeout))
+
+
+def fetch_with_retries(
+    request: FetchRequest,
+    retries: int = 2,
+    backoff: float = 1.0,
+    **kwargs,
+) -> FetchResult:
+    """
+    Fetch ``request``, retrying connection errors, timeouts and server errors.
+
+    The delay between attempts starts at ``backoff`` seconds and doubles each
+    time.  Keyword arguments are passed to ``fetch``.
+    """
+    t0 = time.monotonic()
+    for attempt in range(retries + 1):
+        try:
+            result = fetch(request.url, request.path, token=request.token, **kwargs)
+        except Exception as ex:
+            if attempt == retries or not _is_retryable(ex):
+                raise
+            delay = backoff * 2 ** attempt
+            logger.warning(
+                "Failed to fetch %s (%s); retrying in %.1f s", request.name, ex, delay
+            )
+            time.sleep(delay)
+        else:
+            result.attempts = attempt + 1
+            result.elapsed = time.monotonic() - t0
+            return result
+
+
+def fetch_all(
+    fetch_requests: list[FetchRequest],
+    max_workers: int = 8,
+    max_per_host: int = 2,
+    **kwargs,
+) -> list[Union[FetchResult, Exception]]:
+    """
+    Fetch all ``requests`` concurrently in a thread pool.
+
+    Parameters
+    ----------
+    fetch_requests : list of FetchRequest
+        The sources to fetch.
+    max_workers : int, optional
+        The maximum number of concurrent downloads.
+    max_per_host : int, optional
+        The maximum number of concurrent downloads from any one host.
+    **kwargs :
+        Passed to ``fetch_with_retries``.
+
+    Returns
+    -------
+    list
+        The result, or the exception raised, for each request in order.
+    """
+    host_limits = collections.defaultdict(lambda: threading.BoundedSemaphore(max_per_host))
+    for request in fetch_requests:
+        # Create the semaphores up front, as defaultdict is not thread-safe
+        host_limits[urllib.parse.urlsplit(request.url).netloc]
+
+    def fetch_one(request: FetchRequest) -> FetchResult:
+        with host_limits[urllib.parse.urlsplit(request.url).netloc]:
+            return fetch_with_retries(request, **kwargs)
+
+    results = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fetch_one, request) for request in fetch_requests]
+        for request, future in zip(fetch_requests, futures):
+            try:
+                results.append(future.result())
+            except Exception as ex:
+                logger.debug("Failed to fetch %s", request.name, exc_info=True)
+                results.append(ex)
+    return results
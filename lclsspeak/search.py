@@ -0,0 +1,165 @@
+"""
+Prefix and fuzzy search over acronym names.
+
+Prefix queries use a sorted list of normalized names and binary search.  Fuzzy
+queries use a symmetric-delete index: every name is stored under all strings
+reachable by deleting up to ``max_distance`` characters, so that candidates
+for a query are found with a handful of hash lookups rather than by comparing
+against every name.  Candidates are then verified by edit distance.
+"""
+from __future__ import annotations
+
+import bisect
+import dataclasses
+import itertools
+from typing import Optional
+
+from .definition import Definition
+from .index import NameIndex, normalize_name
+
+
+@dataclasses.dataclass
+class SearchResult:
+    #: The normalized name which matched.
+    name: str
+    #: One of "exact", "prefix", or "fuzzy".
+    match: str
+    #: The edit distance between the query and name.
+    distance: int
+    definitions: list[Definition]
+
+
+def edit_distance(a: str, b: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein distance between ``a`` and ``b``.
+
+    If ``max_distance`` is given, computation stops early once the distance is
+    known to exceed it and ``max_distance + 1`` is returned.
+    """
+    if max_distance is not None and abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    if len(a) < len(b):
+        a, b = b, a
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(
+                min(
+                    previous[j] + 1,
+                    current[j - 1] + 1,
+                    previous[j - 1] + (char_a != char_b),
+                )
+            )
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    return previous[-1]
+
+
+def get_deletes(word: str, max_distance: int) -> set[str]:
+    """All strings formed by deleting up to ``max_distance`` characters."""
+    deletes = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {
+            candidate[:idx] + candidate[idx + 1:]
+            for candidate in frontier
+            for idx in range(len(candidate))
+        }
+        deletes |= frontier
+    return deletes
+
+
+@dataclasses.dataclass
+class SearchEngine:
+    index: NameIndex
+    #: The largest edit distance supported by fuzzy queries.
+    max_distance: int = 1
+    #: Names longer than this are not indexed for fuzzy matching.
+    max_fuzzy_length: int = 24
+    _names: list[str] = dataclasses.field(default_factory=list, init=False, repr=False)
+    _deletes: dict[str, list[str]] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        self._names = sorted(self.index.keys())
+        for name in self._names:
+            if len(name) > self.max_fuzzy_length:
+                continue
+            for delete in get_deletes(name, self.max_distance):
+                self._deletes.setdefault(delete, []).append(name)
+
+    def _result(self, name: str, match: str, distance: int) -> SearchResult:
+        return SearchResult(
+            name=name,
+            match=match,
+            distance=distance,
+            definitions=self.index.lookup(name),
+        )
+
+    def prefix(self, query: str, limit: Optional[int] = 10) -> list[SearchResult]:
+        """Find names starting with ``query``, in lexicographic order."""
+        query = normalize_name(query)
+        start = bisect.bisect_left(self._names, query)
+        results = []
+        for name in itertools.islice(self._names, start, None):
+            if not name.startswith(query) or (limit is not None and len(results) >= limit):
+                break
+            match = "exact" if name == query else "prefix"
+            results.append(self._result(name, match, len(name) - len(query)))
+        return results
+
+    def fuzzy(
+        self,
+        query: str,
+        max_distance: Optional[int] = None,
+        limit: Optional[int] = 10,
+    ) -> list[SearchResult]:
+        """Find names within ``max_distance`` edits of ``query``, closest first."""
+        query = normalize_name(query)
+        if max_distance is None:
+            max_distance = self.max_distance
+        elif max_distance > self.max_distance:
+            raise ValueError(
+                f"max_distance must be at most {self.max_distance} for this engine"
+            )
+
+        distances = {}
+        for delete in get_deletes(query, max_distance):
+            for name in self._deletes.get(delete, []):
+                if name not in distances:
+                    distances[name] = edit_distance(query, name, max_distance)
+
+        matches = sorted(
+            (distance, name)
+            for name, distance in distances.items()
+            if distance <= max_distance
+        )
+        return [
+            self._result(name, "exact" if distance == 0 else "fuzzy", distance)
+            for distance, name in matches[:limit]
+        ]
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = 10,
+        fuzzy: bool = True,
+        max_distance: Optional[int] = None,
+    ) -> list[SearchResult]:
+        """
+        Search for ``query``, ranking an exact match first, followed by prefix
+        matches and then fuzzy matches by increasing edit distance.
+        """
+        results = self.prefix(query, limit=limit)
+        if fuzzy and (limit is None or len(results) < limit):
+            seen = {result.name for result in results}
+            for result in self.fuzzy(query, max_distance=max_distance, limit=None):
+                if limit is not None and len(results) >= limit:
+                    break
+                if result.name not in seen:
+                    results.append(result)
+        return results
@@ -0,0 +1,325 @@
+"""
+A long-running lookup server with the acronym database held in memory.
+
+The server speaks a minimal subset of HTTP/1.1 with JSON responses, over TCP
+or a Unix socket.  Endpoints::
+
+    GET /health
+    GET /lookup?name=XTES&name=GMD
+    GET /search?q=GMDD&limit=10&fuzzy=1
+    GET /reverse?q=gas+monitor&limit=10
+
+The data and its indexes are held in a single ``ServerState``.  When the
+database inputs change, a new state is built in a worker thread and swapped
+in; requests already in progress keep the state they started with.
+"""
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import logging
+import urllib.parse
+from typing import Any, Callable, Optional
+
+from .definition import Definition
+from .fulltext import FullTextIndex
+from .index import NameIndex
+from .search import SearchEngine, SearchResult
+
+logger = logging.getLogger(__name__)
+
+_reasons = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+class RequestError(Exception):
+    def __init__(self, message: str, status: int = 400):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclasses.dataclass
+class ServerState:
+    definitions: list[Definition]
+    names: NameIndex
+    search: SearchEngine
+    fulltext: FullTextIndex
+    fingerprint: Optional[str] = None
+
+    @classmethod
+    def from_definitions(
+        cls,
+        definitions: list[Definition],
+        fingerprint: Optional[str] = None,
+        fulltext: Optional[FullTextIndex] = None,
+    ) -> ServerState:
+        names = NameIndex(definitions)
+        return cls(
+            definitions=definitions,
+            names=names,
+            search=SearchEngine(names),
+            fulltext=fulltext or FullTextIndex(definitions),
+            fingerprint=fingerprint,
+        )
+
+
+def load_state() -> ServerState:
+    """Load the compiled database and build all indexes."""
+    from . import database
+    from .fulltext import load_fulltext_index
+
+    # Fingerprint the inputs first: should they change while loading, the
+    # next check will see a different fingerprint and reload again
+    fingerprint = database.get_fingerprint()
+    fulltext = load_fulltext_index()
+    return ServerState.from_definitions(
+        fulltext.definitions,
+        fingerprint=fingerprint,
+        fulltext=fulltext,
+    )
+
+
+def _definition_to_dict(defn: Definition) -> dict[str, Any]:
+    return defn.to_dict()
+
+
+def _search_result_to_dict(result: SearchResult) -> dict[str, Any]:
+    return {
+        "name": result.name,
+        "match": result.match,
+        "distance": result.distance,
+        "definitions": [_definition_to_dict(defn) for defn in result.definitions],
+    }
+
+
+def _get_param(params: dict[str, list[str]], key: str) -> str:
+    try:
+        return params[key][0]
+    except (KeyError, IndexError):
+        raise RequestError(f"Missing required parameter: {key}")
+
+
+def _get_int_param(params: dict[str, list[str]], key: str, default: int) -> int:
+    if key not in params:
+        return default
+    try:
+        return int(params[key][0])
+    except ValueError:
+        raise RequestError(f"Invalid integer for {key}: {params[key][0]!r}")
+
+
+def handle_request(state: ServerState, target: str) -> dict[str, Any]:
+    """Handle a request for ``target`` (path and query string)."""
+    url = urllib.parse.urlsplit(target)
+    params = urllib.parse.parse_qs(url.query)
+    if url.path == "/health":
+        return {
+            "status": "ok",
+            "definitions": len(state.definitions),
+            "fingerprint": state.fingerprint,
+        }
+    if url.path == "/lookup":
+        names = params.get("name", [])
+        if not names:
+            raise RequestError("Missing required parameter: name")
+        return {
+            "results": {
+                name: [_definition_to_dict(defn) for defn in definitions]
+                for name, definitions in state.names.lookup_many(names).items()
+            }
+        }
+    if url.path == "/search":
+        try:
+            results = state.search.search(
+                _get_param(params, "q"),
+                limit=_get_int_param(params, "limit", 10),
+                fuzzy=bool(_get_int_param(params, "fuzzy", 1)),
+                max_distance=_get_int_param(params, "max_distance", state.search.max_distance),
+            )
+        except ValueError as ex:
+            raise RequestError(str(ex))
+        return {"results": [_search_result_to_dict(result) for result in results]}
+    if url.path == "/reverse":
+        results = state.fulltext.search(
+            _get_param(params, "q"),
+            limit=_get_int_param(params, "limit", 10),
+        )
+        return {
+            "results": [
+                {"score": result.score, "definition": _definition_to_dict(result.definition)}
+                for result in results
+            ]
+        }
+    raise RequestError(f"Unknown endpoint: {url.path}", status=404)
+
+
+class LookupServer:
+    """
+    Serve lookups over HTTP/JSON from a warm in-memory state.
+
+    Parameters
+    ----------
+    loader : callable, optional
+        Returns a new ``ServerState``.  Defaults to ``load_state``.
+    get_fingerprint : callable, optional
+        Returns a fingerprint of the data; a change triggers a reload.
+        Defaults to ``database.get_fingerprint`` when ``loader`` is not
+        specified.
+    reload_interval : float, optional
+        Seconds between checks for changed data.  0 disables hot reloading.
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[], ServerState]] = None,
+        get_fingerprint: Optional[Callable[[], str]] = None,
+        reload_interval: float = 5.0,
+        request_timeout: float = 10.0,
+    ):
+        if loader is None:
+            from .database import get_fingerprint as default_get_fingerprint
+            loader = load_state
+            get_fingerprint = get_fingerprint or default_get_fingerprint
+
+        self.loader = loader
+        self.get_fingerprint = get_fingerprint
+        self.reload_interval = reload_interval
+        self.request_timeout = request_timeout
+        self.state: Optional[ServerState] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+        self._reload_lock: Optional[asyncio.Lock] = None
+        self._watch_task: Optional[asyncio.Task] = None
+
+    async def reload(self) -> ServerState:
+        """Load a new state in a worker thread and swap it in."""
+        if self._reload_lock is None:
+            self._reload_lock = asyncio.Lock()
+        async with self._reload_lock:
+            loop = asyncio.get_running_loop()
+            state = await loop.run_in_executor(None, self.loader)
+            self.state = state
+            logger.info("Loaded %d definitions", len(state.definitions))
+            return state
+
+    async def check_for_changes(self) -> bool:
+        """Reload the state if the data fingerprint changed."""
+        if self.get_fingerprint is None:
+            return False
+
+        loop = asyncio.get_running_loop()
+        fingerprint = await loop.run_in_executor(None, self.get_fingerprint)
+        if self.state is not None and fingerprint == self.state.fingerprint:
+            return False
+
+        logger.info("Data changed; reloading")
+        await self.reload()
+        return True
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.reload_interval)
+            try:
+                await self.check_for_changes()
+            except Exception:
+                logger.exception("Failed to reload data")
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> tuple[str, str]:
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        while (await reader.readline()).strip():
+            # Headers are not used
+            ...
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            raise RequestError(f"Malformed request line: {request_line!r}")
+        return method, target
+
+    async def _close(self, writer: asyncio.StreamWriter) -> None:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            # The client went away first
+            ...
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # Hold on to the state for this request, in case of a reload
+        state = self.state
+        try:
+            method, target = await asyncio.wait_for(
+                self._read_request(reader), self.request_timeout
+            )
+            if method != "GET":
+                raise RequestError(f"Unsupported method: {method}", status=405)
+            status, response = 200, handle_request(state, target)
+        except RequestError as ex:
+            status, response = ex.status, {"error": str(ex)}
+        except asyncio.TimeoutError:
+            await self._close(writer)
+            return
+        except Exception as ex:
+            logger.exception("Request failed")
+            status, response = 500, {"error": f"{type(ex).__name__}: {ex}"}
+
+        body = json.dumps(response).encode("utf-8")
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {_reasons.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: close\r\n\r\n"
+            ).encode("latin-1") + body
+        )
+        try:
+            await writer.drain()
+        finally:
+            await self._close(writer)
+
+    async def start(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        unix_socket: Optional[str] = None,
+    ) -> asyncio.AbstractServer:
+        """Load the data and start listening."""
+        if self.state is None:
+            await self.reload()
+
+        if unix_socket:
+            self.server = await asyncio.start_unix_server(
+                self._handle_connection, path=unix_socket
+            )
+        else:
+            self.server = await asyncio.start_server(
+                self._handle_connection, host=host, port=port
+            )
+
+        if self.reload_interval > 0 and self.get_fingerprint is not None:
+            self._watch_task = asyncio.create_task(self._watch())
+        return self.server
+
+    async def stop(self) -> None:
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def serve_forever(self, **kwargs) -> None:
+        server = await self.start(**kwargs)
+        for sock in server.sockets:
+            logger.info("Listening on %s", sock.getsockname())
+        try:
+            await server.serve_forever()
+        finally:
+            await self.stop()
@@ -1,10 +1,11 @@
 import dataclasses
-from typing import Optional
+import html.parser
+import pathlib
+from typing import Generator, Iterable, Optional, Union
 
 import bs4
-import requests
 
-from . import util
+from . import remote, util
 from .definition import URL, Definition, StandardTag
 
 SLACSPEAK_URL = "https://www.slac.stanford.edu/history/slacspeak/"
@@ -18,40 +19,147 @@ class _ParserState:
     dd: Optional[str] = None
     dt: Optional[str] = None
 
+    def add(self, tag: str, text: str) -> Optional[Definition]:
+        """Add a term or definition, returning a Definition once paired."""
+        setattr(self, tag, text)
+        if not (self.dd and self.dt):
+            return None
 
-def parse_slacspeak(source: str) -> list[Definition]:
+        defn = Definition(
+            name=self.dt,
+            definition=self.dd,
+            source="slacspeak",
+            tags=[StandardTag.slacspeak],
+            url=URL(
+                url="https://www.slac.stanford.edu/history/slacspeak/",
+                text="slacspeak",
+            )
+        )
+        self.dd = None
+        self.dt = None
+        return defn
+
+
+def parse_slacspeak(source: str, parser: Optional[str] = None) -> list[Definition]:
     definitions = []
 
-    soup = bs4.BeautifulSoup(source, "html.parser")
+    soup = bs4.BeautifulSoup(source, util.get_html_parser(parser))
     content, = soup.find_all("div", id="maincontent")
     entries = content.find_all(name=("dd", "dt"))
 
     state = _ParserState()
     for entry in entries:
-        setattr(state, entry.name.lower(), entry.text)
-        if state.dd and state.dt:
-            definitions.append(
-                Definition(
-                    name=state.dt,
-                    definition=state.dd,
-                    source="slacspeak",
-                    tags=[StandardTag.slacspeak],
-                    url=URL(
-                        url="https://www.slac.stanford.edu/history/slacspeak/",
-                        text="slacspeak",
-                    )
-                ),
-            )
-            state.dd = None
-            state.dt = None
+        defn = state.add(entry.name.lower(), entry.text)
+        if defn is not None:
+            definitions.append(defn)
     return definitions
 
 
+class SlacspeakStreamParser(html.parser.HTMLParser):
+    """
+    An event-driven slacspeak parser which does not build a document tree.
+
+    Terms (``<dt>``) and definitions (``<dd>``) in the main content are paired
+    up as they close, and the resulting Definitions are queued in
+    ``definitions``.  As in lxml, an unclosed ``<dt>`` or ``<dd>`` is closed
+    by the next ``<dt>``/``<dd>`` or the end of its list.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.definitions: list[Definition] = []
+        self._state = _ParserState()
+        # Depth of <div> nesting in the main content (0 when outside of it)
+        self._content_depth = 0
+        self._entry_tag: Optional[str] = None
+        self._entry_text: list[str] = []
+
+    def _close_entry(self) -> None:
+        if self._entry_tag is None:
+            return
+
+        defn = self._state.add(self._entry_tag, "".join(self._entry_text))
+        if defn is not None:
+            self.definitions.append(defn)
+        self._entry_tag = None
+        self._entry_text.clear()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]) -> None:
+        if tag == "div":
+            if self._content_depth:
+                self._content_depth += 1
+            elif ("id", "maincontent") in attrs:
+                self._content_depth = 1
+        elif self._content_depth and tag in ("dd", "dt"):
+            self._close_entry()
+            self._entry_tag = tag
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "div" and self._content_depth:
+            self._content_depth -= 1
+            if not self._content_depth:
+                self._close_entry()
+        elif tag in ("dd", "dt", "dl"):
+            self._close_entry()
+
+    def handle_data(self, data: str) -> None:
+        if self._entry_tag is not None:
+            self._entry_text.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._close_entry()
+
+
+def iter_slacspeak(
+    source: Union[str, Iterable[str]],
+) -> Generator[Definition, None, None]:
+    """
+    Parse slacspeak incrementally, yielding Definitions as they are found.
+
+    Parameters
+    ----------
+    source : str or iterable of str
+        The full page source, or chunks of it (e.g., from an open file).
+    """
+    if isinstance(source, str):
+        source = [source]
+
+    parser = SlacspeakStreamParser()
+    for chunk in source:
+        parser.feed(chunk)
+        yield from parser.definitions
+        parser.definitions.clear()
+
+    parser.close()
+    yield from parser.definitions
+    parser.definitions.clear()
+
+
+def get_fetch_request() -> remote.FetchRequest:
+    return remote.FetchRequest(
+        name="slacspeak", url=SLACSPEAK_URL, path=util.get_slacspeak_download_path()
+    )
+
+
+def refresh_slacspeak(**kwargs) -> remote.FetchResult:
+    """
+    Download slacspeak to the cache directory, if it changed.
+
+    Keyword arguments are passed to ``remote.fetch``.
+    """
+    return remote.fetch(SLACSPEAK_URL, util.get_slacspeak_download_path(), **kwargs)
+
+
 def get_slacspeak() -> list[Definition]:
-    return parse_slacspeak(requests.get(SLACSPEAK_URL).text)
+    """Refresh slacspeak from the website and parse it."""
+    refresh_slacspeak()
+    return get_packaged_slacspeak(util.get_slacspeak_download_path())
 
 
-def get_packaged_slacspeak() -> list[Definition]:
-    with open(util.TESTS_PATH / "slacspeak.html", encoding="ISO-8859-1") as fp:
-        speak = fp.read()
-    return parse_slacspeak(speak)
+def get_packaged_slacspeak(path: Optional[pathlib.Path] = None) -> list[Definition]:
+    """
+    Parse slacspeak from ``path``, by default from ``util.get_slacspeak_path``.
+    """
+    with open(path or util.get_slacspeak_path(), encoding="ISO-8859-1") as fp:
+        return list(iter_slacspeak(iter(lambda: fp.read(65536), "")))
@@ -0,0 +1,147 @@
+"""
+Compact, columnar storage of acronym definitions.
+
+Holding every ``Definition`` as a separate object costs an instance
+dictionary, a ``URL``, a tag list, and a metadata dictionary per entry, along
+with a copy of strings repeated across entries (sources, tags, URLs).  A
+``DefinitionStore`` instead keeps one list per field, with repeated values
+interned in shared tables, and materializes ``Definition`` objects on demand.
+"""
+from __future__ import annotations
+
+import array
+import dataclasses
+import sys
+from typing import (Generator, Generic, Hashable, Iterable, Optional, TypeVar,
+                    Union)
+
+from .definition import URL, Definition
+
+T = TypeVar("T", bound=Hashable)
+
+#: Marks a missing URL in ``DefinitionStore.urls``.
+NO_URL = -1
+
+
+@dataclasses.dataclass
+class InternTable(Generic[T]):
+    """Shared storage for repeated values, referred to by index."""
+    values: list[T] = dataclasses.field(default_factory=list)
+    _ids: dict[T, int] = dataclasses.field(default_factory=dict, repr=False)
+
+    def add(self, value: T) -> int:
+        try:
+            return self._ids[value]
+        except KeyError:
+            self._ids[value] = len(self.values)
+            self.values.append(value)
+            return len(self.values) - 1
+
+    def find_id(self, value: T) -> Optional[int]:
+        return self._ids.get(value)
+
+    def __getitem__(self, idx: int) -> T:
+        return self.values[idx]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+def _intern_str(value: str) -> str:
+    # Subclasses (e.g., StandardTag) cannot be interned
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclasses.dataclass
+class DefinitionStore:
+    """
+    Definitions stored by column.
+
+    Indexing or iterating yields new ``Definition`` objects, which may be
+    modified without affecting the store.
+    """
+    names: list[str] = dataclasses.field(default_factory=list)
+    definitions: list[str] = dataclasses.field(default_factory=list)
+    #: Indices into ``source_table``.
+    sources: array.array = dataclasses.field(default_factory=lambda: array.array("l"))
+    #: Indices into ``url_table``, or ``NO_URL``.
+    urls: array.array = dataclasses.field(default_factory=lambda: array.array("l"))
+    #: Indices into ``tag_table``, where each entry is a tuple of tags.
+    tags: array.array = dataclasses.field(default_factory=lambda: array.array("l"))
+    #: Alternates and metadata are rare, so are stored by definition index.
+    alternates: dict[int, tuple[str, ...]] = dataclasses.field(default_factory=dict)
+    metadata: dict[int, dict[str, str]] = dataclasses.field(default_factory=dict)
+    source_table: InternTable[str] = dataclasses.field(default_factory=InternTable)
+    url_table: InternTable[URL] = dataclasses.field(default_factory=InternTable)
+    tag_table: InternTable[tuple[str, ...]] = dataclasses.field(default_factory=InternTable)
+
+    @classmethod
+    def from_definitions(cls, definitions: Iterable[Definition]) -> DefinitionStore:
+        store = cls()
+        store.extend(definitions)
+        return store
+
+    def append(self, defn: Definition) -> None:
+        idx = len(self.names)
+        self.names.append(defn.name)
+        self.definitions.append(defn.definition)
+        self.sources.append(self.source_table.add(_intern_str(defn.source)))
+        self.urls.append(NO_URL if defn.url is None else self.url_table.add(defn.url))
+        self.tags.append(
+            self.tag_table.add(tuple(_intern_str(tag) for tag in defn.tags))
+        )
+        if defn.alternates is not None:
+            self.alternates[idx] = tuple(defn.alternates)
+        if defn.metadata:
+            self.metadata[idx] = {
+                _intern_str(key): value for key, value in defn.metadata.items()
+            }
+
+    def extend(self, definitions: Iterable[Definition]) -> None:
+        for defn in definitions:
+            self.append(defn)
+
+    def get(self, idx: int) -> Definition:
+        """Materialize the definition at ``idx``."""
+        url = self.urls[idx]
+        alternates = self.alternates.get(idx)
+        return Definition(
+            name=self.names[idx],
+            definition=self.definitions[idx],
+            source=self.source_table[self.sources[idx]],
+            url=None if url == NO_URL else self.url_table[url],
+            alternates=None if alternates is None else list(alternates),
+            tags=list(self.tag_table[self.tags[idx]]),
+            metadata=dict(self.metadata.get(idx, {})),
+        )
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Definition, list[Definition]]:
+        if isinstance(idx, slice):
+            return [self.get(i) for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("DefinitionStore index out of range")
+        return self.get(idx)
+
+    def __iter__(self) -> Generator[Definition, None, None]:
+        for idx in range(len(self)):
+            yield self.get(idx)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def find(self, source: str) -> Generator[Definition, None, None]:
+        """Materialize only the definitions from ``source``."""
+        source_id = self.source_table.find_id(source)
+        if source_id is None:
+            return
+        for idx, value in enumerate(self.sources):
+            if value == source_id:
+                yield self.get(idx)
+
+
+def load_store(rebuild: bool = False) -> DefinitionStore:
+    """Load the compiled database into a ``DefinitionStore``."""
+    from .database import stream_database
+    return DefinitionStore.from_definitions(stream_database(rebuild=rebuild))
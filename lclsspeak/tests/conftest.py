@@ -0,0 +1,20 @@
+import pytest
+
+from .. import util
+
+
+@pytest.fixture(autouse=True, scope="session")
+def session_cache_path(tmp_path_factory):
+    """Keep artifacts built by module-scoped fixtures out of the user's cache."""
+    path = tmp_path_factory.mktemp("session-cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(util, "CACHE_PATH", path)
+        yield path
+
+
+@pytest.fixture(autouse=True)
+def cache_path(monkeypatch, tmp_path_factory):
+    """Keep compiled artifacts out of the user's cache directory."""
+    path = tmp_path_factory.mktemp("cache")
+    monkeypatch.setattr(util, "CACHE_PATH", path)
+    return path
@@ -0,0 +1,32 @@
+"""Import-time measurements shared by the test suite and benchmarks."""
+import subprocess
+import sys
+from typing import Optional
+
+from .. import util
+
+
+def get_import_times(
+    args: list[str], env: Optional[dict[str, str]] = None
+) -> dict[str, int]:
+    """
+    Run ``lclsspeak *args`` with ``-X importtime``.
+
+    Returns a dictionary of module name to cumulative import time in
+    microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "lclsspeak", *args],
+        capture_output=True,
+        check=True,
+        cwd=util.MODULE_PATH.parent,
+        env=env,
+        universal_newlines=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        times[module.strip()] = int(cumulative)
+    return times
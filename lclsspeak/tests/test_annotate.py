@@ -0,0 +1,72 @@
+import io
+
+from .. import annotate
+from ..bin import annotate as annotate_cli
+from ..definition import Definition
+
+DEFINITIONS = [
+    Definition(name="XTES", definition="X-ray Transport and Experimental Systems", source="a"),
+    Definition(name="GMD", definition="Gas Monitor Detector", source="a"),
+    Definition(name="GMD", definition="Gas monitor detector.", source="b"),
+    Definition(name="_IT", definition="Information Technology", source="a"),
+    Definition(name="LCLS", definition="Linac Coherent Light Source", source="c"),
+    Definition(name="LCLS-II", definition="LCLS upgrade", source="c"),
+    Definition(name="AC_PLC", definition="Access Control PLC", source="c"),
+    Definition(name="Beam Shut Off Ion Chamber", definition="BSOIC", source="c"),
+]
+
+
+def test_tokenize():
+    assert list(annotate.tokenize("MR1L0:XTES_GMD-1 (LCLS)")) == [
+        ("MR1L0", 0, 5),
+        ("XTES", 6, 10),
+        ("GMD", 11, 14),
+        ("1", 15, 16),
+        ("(LCLS)", 17, 23),
+    ]
+
+
+def test_annotate():
+    annotator = annotate.load_annotator(DEFINITIONS)
+    annotations = annotator.annotate("MR1L0:XTES:GMD and (LCLS). IT, it")
+    assert [
+        (item.token, item.start, item.end, [defn.source for defn in item.definitions])
+        for item in annotations
+    ] == [
+        ("XTES", 6, 10, ["a"]),
+        # Duplicates across sources are merged
+        ("GMD", 11, 14, ["a"]),
+        ("LCLS", 20, 24, ["c"]),
+        ("IT", 27, 29, ["a"]),
+    ]
+
+    # The longest name of one or more tokens is used
+    text = "LCLS-II AC_PLC:STATE (Beam Shut Off Ion Chamber) Beam Shut LCLS-"
+    assert [(item.token, item.start, item.end) for item in annotator.annotate(text)] == [
+        ("LCLS-II", 0, 7),
+        ("AC_PLC", 8, 14),
+        ("Beam Shut Off Ion Chamber", 22, 47),
+        ("LCLS", 59, 63),
+    ]
+
+    annotator = annotate.load_annotator(DEFINITIONS, ignore_case=True)
+    assert [item.token for item in annotator.annotate("it gmd")] == ["it", "gmd"]
+
+
+def test_annotate_cli(monkeypatch):
+    monkeypatch.setattr(
+        annotate_cli, "load_annotator",
+        lambda ignore_case: annotate.load_annotator(DEFINITIONS, ignore_case=ignore_case),
+    )
+    monkeypatch.setattr("sys.stdin", io.StringIO("XTES:GMD:XTES\nnothing here\n"))
+    fp = io.StringIO()
+    flushed = []
+    fp.flush = lambda: flushed.append(fp.getvalue().count("\n"))
+    annotate_cli.main(text=[], fp=fp)
+    # Each line is flushed as soon as it is annotated
+    assert flushed == [1, 2]
+    assert fp.getvalue().splitlines() == [
+        "XTES:GMD:XTES\tXTES: X-ray Transport and Experimental Systems; "
+        "GMD: Gas Monitor Detector",
+        "nothing here",
+    ]
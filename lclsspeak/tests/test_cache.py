@@ -0,0 +1,60 @@
+import dataclasses
+import shutil
+
+from .. import cache, database, packaged
+
+
+def test_config_repr_is_stable():
+    for pkg in packaged._packaged_data + packaged._external_data:
+        config = cache.get_config_repr(pkg)
+        assert " at 0x" not in config
+        # Memoized data and credentials are not part of the configuration
+        assert "_data" not in config
+        assert "token" not in config
+        assert cache.get_config_repr(dataclasses.replace(pkg, _data=[])) == config
+
+
+def test_unchanged_source_not_parsed(monkeypatch, tmp_path, cache_path):
+    pkg = packaged._external_data[0]
+    cached = tmp_path / pkg.cached.name
+    shutil.copy(pkg.cached, cached)
+    source = dataclasses.replace(pkg, cached=cached, _data=None)
+    expected = source.load()
+    assert len(list(cache.get_cache_path().iterdir())) == 1
+
+    parsed = []
+
+    def counting_load(self):
+        parsed.append(self)
+        return original_load(self)
+
+    original_load = packaged.WebsiteData._load
+    monkeypatch.setattr(packaged.WebsiteData, "_load", counting_load)
+
+    # A new process would have no memoized data
+    assert dataclasses.replace(source, _data=None).load() == expected
+    assert not parsed
+
+    # Other configurations and contents are separate entries
+    dataclasses.replace(source, parser="html.parser", _data=None).load()
+    assert len(parsed) == 1
+    cached.write_text(cached.read_text() + "<p>Updated</p>")
+    dataclasses.replace(source, _data=None).load()
+    assert len(parsed) == 2
+    dataclasses.replace(source, _data=None).load(persistent=False)
+    assert len(parsed) == 3
+
+
+def test_build_prunes_entries(monkeypatch, cache_path):
+    for pkg in packaged._packaged_data + packaged._external_data:
+        monkeypatch.setattr(pkg, "_data", None)
+
+    cache.write_entry("outdated", [])
+    definitions = database.build_database()
+    entries = {path.stem for path in cache.get_cache_path().iterdir()}
+    assert entries == set(packaged.get_fingerprints())
+
+    # A build from the cache gives identical results
+    for pkg in packaged._packaged_data + packaged._external_data:
+        pkg._data = None
+    assert database.build_database() == definitions
@@ -0,0 +1,31 @@
+import os
+
+import pytest
+
+from .. import database
+from .importtime import get_import_times
+
+#: Modules which must not be imported just to start the command-line tool.
+HEAVY_MODULES = ("asyncio", "bs4", "lxml", "pandas", "requests")
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        pytest.param(["--version"], id="version"),
+        pytest.param(["--help"], id="help"),
+        pytest.param(["lookup", "--help"], id="lookup-help"),
+        pytest.param(["annotate", "--help"], id="annotate-help"),
+    ],
+)
+def test_startup_imports(args):
+    imported = set(get_import_times(args))
+    assert not imported & set(HEAVY_MODULES)
+
+
+def test_warm_lookup_imports(cache_path):
+    database.build_database()
+    env = {**os.environ, "LCLSSPEAK_CACHE_PATH": str(cache_path)}
+    imported = set(get_import_times(["lookup", "XTES"], env=env))
+    assert "lclsspeak.database" in imported
+    assert not imported & set(HEAVY_MODULES)
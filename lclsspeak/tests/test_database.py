@@ -0,0 +1,39 @@
+import dataclasses
+
+import pytest
+
+from .. import database, util
+
+
+@pytest.fixture(scope="module")
+def database_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("cache") / database.DATABASE_FILENAME
+    database.build_database(path)
+    return path
+
+
+def test_database_roundtrip(database_path):
+    assert database.is_database_current(database_path)
+    definitions = database.load_database(database_path)
+    assert len(definitions) > 1000
+    assert definitions == database._load_definitions()
+
+
+def test_database_fingerprint(monkeypatch, tmp_path):
+    fingerprint = database.get_fingerprint()
+    assert fingerprint == database.get_fingerprint()
+
+    source = tmp_path / "extra.csv"
+    source.write_text("Acronym,Definition\n")
+    monkeypatch.setattr(util, "DATA_PATH", tmp_path)
+    assert database.get_fingerprint() != fingerprint
+
+
+def test_database_stale(database_path, tmp_path):
+    stale = tmp_path / database.DATABASE_FILENAME
+    defn = next(database.iter_database(database_path))
+    database.write_database([defn], "stale", path=stale)
+    assert not database.is_database_current(stale)
+    assert list(database.iter_database(stale)) == [dataclasses.replace(defn)]
+    assert len(database.load_database(stale)) > 1
+    assert database.is_database_current(stale)
@@ -0,0 +1,51 @@
+import io
+
+import pytest
+
+from ..bin import dump
+from ..bin.main import main as cli_main
+from ..definition import Definition
+
+
+def test_write_lines():
+    fp = io.StringIO()
+    dump.write_lines((str(idx) for idx in range(25)), fp, chunk_size=10)
+    assert fp.getvalue() == "".join(f"{idx}\n" for idx in range(25))
+
+
+def test_dump_from_sources():
+    sorted_fp = io.StringIO()
+    dump.main(format="html", from_sources=True, fp=sorted_fp)
+    unsorted_fp = io.StringIO()
+    dump.main(format="html", from_sources=True, sort=False, fp=unsorted_fp)
+
+    sorted_lines = sorted_fp.getvalue().splitlines()
+    unsorted_lines = unsorted_fp.getvalue().splitlines()
+    assert sorted_lines[0].startswith("<table>")
+    assert sorted_lines[-1] == "</tbody></table>"
+    assert sorted(sorted_lines) == sorted(unsorted_lines)
+    assert sorted_lines != unsorted_lines
+
+
+def test_similarity_implies_merged(monkeypatch):
+    definitions = [
+        Definition(name="ACR", definition="Accelerator Control Room", source="a"),
+        Definition(name="ACR", definition="Accelerator Control Rooms", source="b"),
+    ]
+    monkeypatch.setattr(dump, "stream_database", lambda rebuild: iter(definitions))
+    assert len(list(dump.iter_definitions())) == 2
+    assert len(list(dump.iter_definitions(similarity=0.9))) == 1
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["--format", "sqlite"], "--format sqlite requires --output"),
+        (["--no-sort"], "--no-sort requires --from-sources"),
+    ],
+)
+def test_usage_errors(capsys, args, message):
+    with pytest.raises(SystemExit) as ex:
+        cli_main(["dump", *args])
+    assert ex.value.code == 2
+    assert message in capsys.readouterr().err
@@ -0,0 +1,102 @@
+import csv
+import dataclasses
+import io
+import json
+import sqlite3
+
+import pytest
+
+from .. import export
+from ..definition import URL, Definition, StandardTag
+
+DEFINITIONS = [
+    Definition(
+        name="GMD",
+        definition="Gas Monitor Detector",
+        source="test",
+        url=URL(url="https://example.com", text="example"),
+        tags=[StandardTag.slacspeak, "detector"],
+        metadata={"Hutch": "TMO"},
+    ),
+    Definition(
+        name="XTES",
+        definition="X-ray Transport, and Experimental Systems",
+        source="test",
+        alternates=["XTS"],
+    ),
+]
+
+
+def test_to_dict():
+    for defn in DEFINITIONS:
+        assert defn.to_dict() == dataclasses.asdict(defn)
+        assert Definition.from_dict(defn.to_dict()) == defn
+
+
+def test_batched():
+    batches = list(export.batched(range(5), batch_size=2))
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+def test_ndjson():
+    fp = io.StringIO()
+    export.write_ndjson(DEFINITIONS, fp, batch_size=1)
+    lines = fp.getvalue().splitlines()
+    assert [Definition.from_dict(json.loads(line)) for line in lines] == DEFINITIONS
+
+
+def test_csv():
+    fp = io.StringIO()
+    export.write_csv(DEFINITIONS, fp)
+    fp.seek(0)
+    rows = list(csv.DictReader(fp))
+    assert tuple(rows[0]) == export.CSV_COLUMNS
+    assert rows[0]["tags"] == "slacspeak; detector"
+    assert rows[0]["url_text"] == "example"
+    assert json.loads(rows[0]["metadata"]) == {"Hutch": "TMO"}
+    assert rows[1]["definition"] == "X-ray Transport, and Experimental Systems"
+    assert rows[1]["alternates"] == "XTS"
+
+
+def test_sqlite(tmp_path):
+    path = tmp_path / "definitions.sqlite"
+    export.write_sqlite(DEFINITIONS, path, batch_size=1)
+    # Existing files are replaced
+    export.write_sqlite(DEFINITIONS, path)
+    conn = sqlite3.connect(str(path))
+    try:
+        rows = conn.execute(
+            "SELECT name, tags FROM definitions WHERE name = 'gmd' COLLATE NOCASE"
+        ).fetchall()
+        count, = conn.execute("SELECT COUNT(*) FROM definitions").fetchone()
+    finally:
+        conn.close()
+    assert rows == [("GMD", '["slacspeak", "detector"]')]
+    assert count == 2
+
+
+def test_sqlite_interrupted(tmp_path):
+    path = tmp_path / "definitions.sqlite"
+    export.write_sqlite(DEFINITIONS, path)
+    contents = path.read_bytes()
+
+    def interrupted():
+        yield DEFINITIONS[0]
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        export.write_sqlite(interrupted(), path, batch_size=1)
+    # The existing export is intact, and no temporary files remain
+    assert path.read_bytes() == contents
+    assert [fn.name for fn in tmp_path.iterdir()] == ["definitions.sqlite"]
+
+
+def test_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "definitions.parquet"
+    export.write_parquet(DEFINITIONS, path, batch_size=1)
+    table = pq.read_table(str(path)).to_pylist()
+    assert [row["name"] for row in table] == ["GMD", "XTES"]
+    assert table[0]["tags"] == ["slacspeak", "detector"]
+    assert table[1]["alternates"] == ["XTS"]
+    assert table[1]["url"] is None
@@ -0,0 +1,72 @@
+import pytest
+
+from ..definition import Definition
+from ..fulltext import FullTextIndex, stem_token, tokenize
+
+
+@pytest.fixture
+def definitions() -> list[Definition]:
+    return [
+        Definition(name="GMD", definition="Gas Monitor Detector", source="test"),
+        Definition(name="GEM", definition="Gas Energy Monitors in the FEE", source="test"),
+        Definition(
+            name="XTES",
+            definition="X-ray Transport and Experimental Systems",
+            source="test",
+            tags=["transport"],
+        ),
+        Definition(
+            name="VGC",
+            definition="Vacuum Gate valve",
+            source="test",
+            metadata={"Hutch": "TMO", "source_columns": ["name"]},
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    "token, expected",
+    [
+        ("monitors", "monitor"),
+        ("batteries", "battery"),
+        ("boxes", "boxe"),
+        ("gas", "gas"),
+        ("class", "class"),
+        ("status", "status"),
+    ],
+)
+def test_stem_token(token, expected):
+    assert stem_token(token) == expected
+
+
+def test_tokenize():
+    assert tokenize("The Gas Monitors") == ["gas", "monitor"]
+    assert tokenize("The Gas Monitors", stem=False, stop_words=False) == [
+        "the",
+        "gas",
+        "monitors",
+    ]
+
+
+def test_search(definitions):
+    index = FullTextIndex(definitions)
+    results = index.search("gas monitor")
+    assert [result.definition.name for result in results] == ["GMD", "GEM"]
+    assert results[0].score > results[1].score
+
+    assert [result.definition.name for result in index.search("tmo")] == ["VGC"]
+    assert [result.definition.name for result in index.search("transport")] == ["XTES"]
+    assert index.search("the") == []
+    assert len(index.search("gas", limit=1)) == 1
+
+
+def test_save_load(definitions, tmp_path):
+    path = tmp_path / "fulltext.json"
+    index = FullTextIndex(definitions)
+    index.save(path, "fingerprint")
+
+    loaded = FullTextIndex.load(path, definitions, "fingerprint")
+    assert loaded is not None
+    assert loaded.search("gas monitor") == index.search("gas monitor")
+    assert FullTextIndex.load(path, definitions, "other") is None
+    assert FullTextIndex.load(path, definitions, "fingerprint", stem=False) is None
@@ -0,0 +1,32 @@
+from ..htmlscan import extract_fragments
+
+DOCUMENT = """
+<html><head>
+<script>var html = "<table><tr><td>not this</td></tr></table>";</script>
+<style>table { color: red; }</style>
+</head><body>
+<!-- <table>commented out</table> -->
+<TABLE class="outer"><tr><td><table><tr><td>nested</td></tr></table></td></tr></TABLE>
+<p>between</p><tbody-like>x</tbody-like>
+<table id="second"><tr><td>second</td></tr></table>
+<ul><li>one<li>two</ul>
+"""
+
+
+def test_extract_fragments():
+    assert extract_fragments(DOCUMENT, ["table"]) == [
+        '<TABLE class="outer"><tr><td>'
+        '<table><tr><td>nested</td></tr></table>'
+        '</td></tr></TABLE>',
+        '<table id="second"><tr><td>second</td></tr></table>',
+    ]
+    assert extract_fragments(DOCUMENT, ["ul", "p"]) == [
+        "<p>between</p>",
+        "<ul><li>one<li>two</ul>",
+    ]
+
+
+def test_extract_unclosed():
+    assert extract_fragments("<p>a<table><tr><td>b", ["table"]) == ["<table><tr><td>b"]
+    assert extract_fragments("<!-- <table>", ["table"]) == []
+    assert extract_fragments("<script><table>", ["table"]) == []
@@ -0,0 +1,35 @@
+from ..definition import Definition
+from ..index import NameIndex, normalize_name
+
+
+def _defn(name: str, definition: str = "definition", **kwargs) -> Definition:
+    return Definition(name=name, definition=definition, source="test", **kwargs)
+
+
+def test_normalize_name():
+    assert normalize_name("XTES") == "xtes"
+    assert normalize_name(" _-XTES ") == "xtes"
+    assert normalize_name("Straße") == normalize_name("STRASSE")
+
+
+def test_name_index():
+    index = NameIndex(
+        [
+            _defn("GMD", "Gas Monitor Detector"),
+            _defn("gmd", "Gas-Monitor Detector", alternates=["GasMon"]),
+            _defn("XTES", "X-ray Transport and Experimental Systems"),
+        ]
+    )
+    assert len(index) == 3
+    assert "_gmd" in index
+    assert [defn.definition for defn in index.lookup("Gmd")] == [
+        "Gas Monitor Detector",
+        "Gas-Monitor Detector",
+    ]
+    assert index.lookup("gasmon") == index.lookup("GMD")[1:]
+    assert index.lookup("unknown") == []
+
+    results = index.lookup_many(["xtes", "unknown"])
+    assert list(results) == ["xtes", "unknown"]
+    assert results["xtes"][0].name == "XTES"
+    assert results["unknown"] == []
@@ -0,0 +1,139 @@
+import concurrent.futures
+import csv
+import functools
+import multiprocessing
+
+import pytest
+
+from .. import ingest, util
+
+DOCUMENT = """
+<h1>Acronyms</h1>
+<table>
+<tr><th>Acronym</th><th>Definition</th></tr>
+<tr><td>GMD</td><td>Gas Monitor Detector</td></tr>
+<tr><td>not an acronym</td><td>Ignored</td></tr>
+</table>
+<table>
+<tr><td>XTES</td><td>X-ray Transport and Experimental Systems</td></tr>
+<tr><td>1oo2</td><td>One out of Two</td></tr>
+</table>
+<table>
+<tr><td>Budget</td><td>$5</td></tr>
+</table>
+<p>KB = Kirkpatrick-Baez</p>
+<p>Note that a = b</p>
+"""
+
+PDF_PAGES = [
+    "Introduction\nThe CDR describes everything.",
+    "LCLS   Linac Coherent Light Source\nSome text   Not Accepted\nRF = Radio Frequency",
+]
+
+
+def test_extract_html_rows():
+    assert list(ingest.extract_html_rows(DOCUMENT, "doc.html")) == [
+        ("GMD", "Gas Monitor Detector", "doc.html"),
+        ("XTES", "X-ray Transport and Experimental Systems", "doc.html"),
+        ("1oo2", "One out of Two", "doc.html"),
+        ("KB", "Kirkpatrick-Baez", "doc.html"),
+    ]
+
+
+def test_initials_match():
+    assert ingest.initials_match("LCLS", "Linac Coherent Light Source")
+    assert ingest.initials_match("(X)GMD", "(X-ray) Gas Monitor Detector")
+    assert ingest.initials_match("DOE", "Department of Energy")
+    assert not ingest.initials_match("Some", "text Not Accepted")
+
+
+def test_extract_pdf(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        ingest, "_iter_pdf_pages", lambda path: enumerate(PDF_PAGES, 1)
+    )
+    assert ingest.extract_document(tmp_path / "CDR.pdf") == [
+        ("LCLS", "Linac Coherent Light Source", "CDR.pdf page 2"),
+        ("RF", "Radio Frequency", "CDR.pdf page 2"),
+    ]
+
+
+def _make_documents(path, count):
+    path.mkdir()
+    for idx in range(count):
+        (path / f"doc{idx}.html").write_text(
+            DOCUMENT.replace("GMD", f"GMD{idx}"), encoding="utf-8"
+        )
+    (path / "notes.txt").write_text("ignored")
+    return ingest.find_documents(path)
+
+
+def _read_csv(path):
+    with open(path, newline="") as fp:
+        return list(csv.reader(fp))
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+def test_ingest(tmp_path, max_workers):
+    documents = _make_documents(tmp_path / "docs", 3)
+    assert [doc.name for doc in documents] == ["doc0.html", "doc1.html", "doc2.html"]
+
+    output = tmp_path / "out.csv"
+    progress = []
+    count = ingest.ingest(
+        documents,
+        output,
+        max_workers=max_workers,
+        progress=lambda completed, total, doc: progress.append((completed, total)),
+    )
+    rows = _read_csv(output)
+    assert rows[0] == list(ingest.COLUMNS)
+    assert count == len(rows) - 1 == 12
+    assert ["GMD0", "Gas Monitor Detector", "doc0.html"] in rows
+    assert progress == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_ingest_worker_settings(monkeypatch, tmp_path):
+    # Spawned workers do not inherit settings changed at runtime
+    monkeypatch.setattr(
+        concurrent.futures,
+        "ProcessPoolExecutor",
+        functools.partial(
+            concurrent.futures.ProcessPoolExecutor,
+            mp_context=multiprocessing.get_context("spawn"),
+        ),
+    )
+    monkeypatch.setattr(util, "HTML_PARSER", "unsupported")
+    documents = _make_documents(tmp_path / "docs", 1)
+    assert ingest.ingest(documents, tmp_path / "out.csv", max_workers=1) == 0
+
+
+def test_ingest_resume(monkeypatch, tmp_path):
+    documents = _make_documents(tmp_path / "docs", 3)
+    output = tmp_path / "out.csv"
+    original = ingest.extract_document
+
+    def interrupted(path):
+        if path.name == "doc2.html":
+            raise KeyboardInterrupt
+        return original(path)
+
+    monkeypatch.setattr(ingest, "extract_document", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        ingest.ingest(documents, output, max_workers=0)
+    assert not output.exists()
+
+    # Simulate an interruption while writing the journal
+    state_path = tmp_path / f"out.csv{ingest.STATE_SUFFIX}"
+    with open(state_path, "at") as fp:
+        fp.write('{"document": "doc1.html", "sha256": "trunc\n{"document": "doc')
+
+    extracted = []
+
+    def resumed(path):
+        extracted.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(ingest, "extract_document", resumed)
+    assert ingest.ingest(documents, output, max_workers=0) == 12
+    assert extracted == ["doc2.html"]
+    assert len(ingest.IngestState.load(state_path).completed) == 3
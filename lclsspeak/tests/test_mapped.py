@@ -0,0 +1,80 @@
+import pytest
+
+from .. import database, mapped
+from ..definition import URL, Definition
+from ..index import NameIndex
+
+DEFINITIONS = [
+    Definition(
+        name="GMD",
+        definition="Gas Monitor Detector",
+        source="a",
+        url=URL(url="https://example.com", text="example"),
+        alternates=["gasmon"],
+        metadata={"Hutch": "TMO"},
+    ),
+    Definition(name="_gmd", definition="Gas monitor detector", source="b"),
+    Definition(name="XTES", definition="X-ray Transport and Experimental Systems", source="a"),
+    Definition(name="µRad", definition="Microradian", source="c"),
+]
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    path = tmp_path / "test.idx"
+    mapped.write_mapped_index(DEFINITIONS, path, fingerprint="abc")
+    return path
+
+
+def test_lookup(index_path):
+    reference = NameIndex(list(DEFINITIONS))
+    with mapped.MappedIndex(index_path) as index:
+        assert index.fingerprint == "abc"
+        assert index.num_definitions == 4
+        assert len(index) == len(reference) == 4
+        assert list(index.keys()) == sorted(reference.keys(), key=str.encode)
+        for key in ["gmd", "GASMON", "Xtes", "µrad", "unknown", ""]:
+            assert index.lookup(key) == reference.lookup(key)
+        assert index.lookup_many(["XTES"]) == {"XTES": DEFINITIONS[2:3]}
+        assert "gmd" in index
+        assert "unknown" not in index
+        assert list(index) == DEFINITIONS
+        with pytest.raises(IndexError):
+            index.get(4)
+
+
+def test_empty(tmp_path):
+    path = tmp_path / "empty.idx"
+    mapped.write_mapped_index([], path)
+    with mapped.MappedIndex(path) as index:
+        assert index.lookup("gmd") == []
+        assert list(index.keys()) == []
+
+
+def test_invalid(tmp_path):
+    path = tmp_path / "invalid.idx"
+    for contents in [b"", b"LCLSIDX", b"NOT AN INDEX" * 10]:
+        path.write_bytes(contents)
+        with pytest.raises(mapped.MappedIndexError):
+            mapped.MappedIndex(path)
+
+
+def test_load_mapped_index(monkeypatch):
+    loaded = []
+
+    def load_database(rebuild=False):
+        loaded.append(rebuild)
+        return DEFINITIONS
+
+    monkeypatch.setattr(database, "get_fingerprint", lambda: "first")
+    monkeypatch.setattr(database, "load_database", load_database)
+    with mapped.load_mapped_index() as index:
+        assert index.fingerprint == "first"
+    with mapped.load_mapped_index() as index:
+        assert index.lookup("xtes") == DEFINITIONS[2:3]
+    assert loaded == [False]
+
+    monkeypatch.setattr(database, "get_fingerprint", lambda: "second")
+    with mapped.load_mapped_index() as index:
+        assert index.fingerprint == "second"
+    assert loaded == [False, False]
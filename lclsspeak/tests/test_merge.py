@@ -0,0 +1,70 @@
+import pytest
+
+from .. import merge
+from ..definition import URL, Definition
+
+URL_A = URL(url="https://example.com/a", text="A")
+
+
+def _definitions():
+    return [
+        Definition(
+            name="ACR", definition="Accelerator Control Room", source="a",
+            url=URL_A, tags=["site"], metadata={"source_columns": ["Acronym"]},
+        ),
+        Definition(name="GMD", definition="Gas Monitor Detector", source="a"),
+        Definition(
+            name="_acr", definition="accelerator control  room.", source="b",
+            alternates=["ACR-B"], tags=["site", "slacspeak"],
+        ),
+        Definition(name="ACR", definition="Accelerator Control Room B052", source="c"),
+        Definition(name="ACR", definition="Air Changes per Room", source="d"),
+    ]
+
+
+def test_normalize_definition():
+    assert merge.normalize_definition(" Gas-Monitor\nDetector (GMD). ") == (
+        "gas monitor detector gmd"
+    )
+
+
+def test_merge_exact():
+    definitions = _definitions()
+    merged = merge.merge_definitions(definitions)
+    assert [(defn.name, defn.source) for defn in merged] == [
+        ("ACR", "a"), ("GMD", "a"), ("ACR", "c"), ("ACR", "d"),
+    ]
+
+    acr = merged[0]
+    assert acr.definition == "Accelerator Control Room"
+    assert acr.url == URL_A
+    assert acr.alternates == ["ACR-B"]
+    assert acr.tags == ["site", "slacspeak"]
+    assert acr.metadata["source_columns"] == ["Acronym"]
+    assert acr.metadata["sources"] == [
+        {
+            "source": "a",
+            "url": {"url": URL_A.url, "text": URL_A.text},
+            "definition": "Accelerator Control Room",
+        },
+        {"source": "b", "url": None, "definition": "accelerator control  room."},
+    ]
+
+    # Unmerged definitions pass through, and inputs are unchanged
+    assert merged[1] is definitions[1]
+    assert definitions[0].metadata == {"source_columns": ["Acronym"]}
+    assert definitions[0].alternates is None
+
+
+def test_merge_similar():
+    merged = merge.merge_definitions(_definitions(), similarity=0.85)
+    assert [(defn.name, defn.source) for defn in merged] == [
+        ("ACR", "a"), ("GMD", "a"), ("ACR", "d"),
+    ]
+    assert [item["source"] for item in merged[0].metadata["sources"]] == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("similarity", [0.0, 1.5])
+def test_merge_bad_similarity(similarity):
+    with pytest.raises(ValueError):
+        merge.merge_definitions([], similarity=similarity)
@@ -1,4 +1,16 @@
-from .. import packaged
+import concurrent.futures
+import dataclasses
+import functools
+import io
+import multiprocessing
+import re
+
+import bs4
+import pandas as pd
+import pytest
+
+from .. import cache, packaged, util
+from ..definition import by_name
 
 
 def test_packaged_load():
@@ -17,3 +29,228 @@ def test_cached_website_load():
         for item in items:
             print(item)
             assert item.valid
+
+
+def test_sorted_runs():
+    expected = sorted(packaged.load_packaged_data(), key=by_name)
+    assert list(packaged.iter_packaged_data(sort_key=by_name)) == expected
+
+
+@pytest.mark.parametrize("parallel", ["thread", "process"])
+def test_parallel_load(monkeypatch, parallel):
+    expected = packaged.load_packaged_data()
+    for pkg in packaged._packaged_data + packaged._external_data:
+        monkeypatch.setattr(pkg, "_data", None)
+    assert packaged.load_packaged_data(parallel=parallel, max_workers=2) == expected
+    assert all(pkg._data for pkg in packaged._packaged_data)
+
+
+def test_parallel_load_invalid():
+    with pytest.raises(ValueError):
+        packaged.load_packaged_data(parallel="cluster")
+
+
+def test_vectorized_mapping():
+    df = pd.DataFrame(
+        {
+            "Acronym": ["GMD", " _XTES ", None, "VGC", "EPS"],
+            "Long": ["Gas Monitor", "", "Missing name", None, "Equipment"],
+            "Extra": ["Detector ", "X-ray Transport", "Extra", "Vacuum", ""],
+            "Subject": ["Diagnostics", None, "Misc", "Vacuum", "Safety"],
+            "Hutch": ["TMO", "RIX", None, "TXI", 3],
+            "Number": [1, 2, 3, 4, 5],
+        }
+    )
+    mapping = packaged.NamedData(
+        column_to_key={
+            "Acronym": "name",
+            "Long": "definition",
+            "Extra": "definition",
+            "Subject": "tags",
+            "Number": "tags",
+            "Hutch": "metadata",
+            "Missing": "definition",
+        }
+    )
+    expected = mapping.map_rows_to_definitions(df)
+    assert mapping.map_to_definitions(df) == expected
+    assert expected[0].definition == "Gas Monitor\nDetector"
+    assert expected[1].tags == ["2"]
+    assert expected[3].metadata == {
+        "Hutch": "TXI",
+        "source_columns": ["Acronym", "Extra", "Subject", "Number"],
+    }
+
+
+def test_read_csv_rows():
+    fp = io.StringIO('a,b,c\n1,,"x, y"\n2,3\n4,5,6,7\n')
+    assert list(packaged.read_csv_rows(fp)) == [
+        {"a": "1", "c": "x, y"},
+        {"a": "2", "b": "3"},
+        {"a": "4", "b": "5", "c": "6"},
+    ]
+
+
+def test_csv_backends():
+    for pkg in packaged._packaged_data:
+        if isinstance(pkg, packaged.CsvData):
+            by_csv = dataclasses.replace(pkg, backend="csv", _data=None)
+            by_pandas = dataclasses.replace(pkg, backend="pandas", _data=None)
+            assert by_csv.load() == by_pandas.load()
+
+
+def test_csv_backends_values(tmp_path):
+    path = tmp_path / "values.csv"
+    path.write_text(
+        "Acronym,Definition,Count,Notes\n"
+        "NA,Numerical Aperture,1,N/A\n"
+        "GMD,Gas Monitor Detector,,null\n"
+        "007,Agent,2.50,NaN\n"
+        ",Missing name,3,\n"
+    )
+    pkg = packaged.CsvData(
+        url=packaged.URL(url="https://example.com", text="test"),
+        cached=path,
+        mapping=packaged.NamedData(
+            column_to_key={
+                "Acronym": "name",
+                "Definition": "definition",
+                "Count": "metadata",
+                "Notes": "metadata",
+            }
+        ),
+        tags=[],
+    )
+    by_csv = dataclasses.replace(pkg, backend="csv").load(persistent=False)
+    by_pandas = dataclasses.replace(pkg, backend="pandas").load(persistent=False)
+    assert by_csv == by_pandas
+    assert [(defn.name, defn.metadata) for defn in by_csv] == [
+        ("NA", {"source_columns": ["Acronym", "Definition"], "Count": "1", "Notes": "N/A"}),
+        ("GMD", {"source_columns": ["Acronym", "Definition"], "Notes": "null"}),
+        ("007", {"source_columns": ["Acronym", "Definition"], "Count": "2.50", "Notes": "NaN"}),
+        ("", {"source_columns": ["Definition"], "Count": "3"}),
+    ]
+
+
+def test_website_parsed_once(monkeypatch):
+    parsed = []
+    original = bs4.BeautifulSoup
+
+    def counting_soup(*args, **kwargs):
+        parsed.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(bs4, "BeautifulSoup", counting_soup)
+    for pkg in packaged._external_data:
+        parsed.clear()
+        assert dataclasses.replace(pkg, _data=None).load()
+        assert len(parsed) == 1
+
+
+SECTION_HTML = """
+<h1>Introduction</h1>
+<table><tr><th>Acronym</th><th>Meaning</th></tr><tr><td>NO</td><td>Not this</td></tr></table>
+<h1>Acronyms</h1>
+<p>Terms used:</p>
+<table><tr><th>Acronym</th><th>Meaning</th></tr>
+<tr><td>ECS</td><td>Experiment Control Systems</td></tr></table>
+<div><table><tr><th>Acronym</th><th>Meaning</th></tr>
+<tr><td>_GMD</td><td>Gas Monitor</td></tr></table></div>
+<h1>Appendix</h1>
+"""
+
+
+def test_section_scraper():
+    scraper = packaged.SectionScraper(
+        section_names=["acronyms"],
+        tables=[
+            packaged.HtmlTable(
+                mapping=packaged.NamedData(
+                    column_to_key={"Acronym": "name", "Meaning": "definition"}
+                )
+            )
+        ],
+    )
+    definitions = list(scraper.scrape(SECTION_HTML))
+    assert [(defn.name, defn.definition) for defn in definitions] == [
+        ("ECS", "Experiment Control Systems"),
+        ("GMD", "Gas Monitor"),
+    ]
+
+
+def test_required_literals():
+    assert packaged.get_required_literals(re.compile(r"(?P<name>[^=]+)\s*=\s*(?P<d>.+)")) == "="
+    assert packaged.get_required_literals(re.compile(r"^(\w+) \((.+)\)")) == " ()"
+    # Optional, alternative, and case-insensitive parts are not required
+    assert packaged.get_required_literals(re.compile(r"a?(b|c)d*")) == ""
+    assert packaged.get_required_literals(re.compile(r"(?i)x:y")) == ""
+    assert packaged.get_required_literals(re.compile(r"a(?i:b)")) == "a"
+
+
+def test_required_literals_packaged():
+    # The analysis uses the internal re parser and finds no literals if that
+    # changes; fail rather than silently losing the prefilter
+    regexes = [
+        regex
+        for source in packaged._packaged_data + packaged._external_data
+        if isinstance(source, packaged.WebsiteData)
+        for scraper in source.scrapers or []
+        if isinstance(scraper, packaged.RegexHtmlScraper)
+        for regex in scraper.regexes
+    ]
+    assert regexes
+    for regex in regexes:
+        assert packaged.get_required_literals(regex), regex.pattern
+
+
+def test_regex_scraper():
+    html = """
+    <p>PA = Paragraph</p>
+    <li>LI = List item</li>
+    <li>Nothing to see</li>
+    <li>XY (Ex Why) note</li>
+    """
+    scraper = packaged.RegexHtmlScraper(
+        tags=["li", "p"],
+        regexes=[
+            re.compile(r"(?P<name>[^=(]+)\s*=\s*(?P<definition>.+)"),
+            re.compile(r"^(?P<name>[A-Z]+) \((?P<definition>[^)]+)\)\s*(?P<note>.*)$"),
+        ],
+    )
+    definitions = list(scraper.scrape(bs4.BeautifulSoup(html, "html.parser")))
+    # Ordered by tag, then by position
+    assert [defn.name for defn in definitions] == ["LI", "XY", "PA"]
+    assert definitions[1].definition == "Ex Why"
+    assert definitions[1].metadata == {"note": "note"}
+
+
+def test_regex_scraper_section():
+    html = (
+        "<h2>Terms</h2><p>GMD = Gas Monitor Detector</p>"
+        "<ul><li>KB = Kirkpatrick-Baez</li></ul>"
+    )
+    soup = bs4.BeautifulSoup(html, "html.parser")
+    section = packaged.HtmlSection(title="Terms", elements=list(soup.children)[1:])
+    scraper = packaged.RegexHtmlScraper(
+        tags=["p", "li"],
+        regexes=[re.compile(r"(?P<name>[^=]+)\s*=\s*(?P<definition>.+)")],
+    )
+    # Top-level elements of the section match, as with the full document
+    assert [defn.name for defn in scraper.scrape(section)] == ["GMD", "KB"]
+    assert [defn.name for defn in scraper.scrape(soup)] == ["GMD", "KB"]
+
+
+def test_parallel_worker_settings(monkeypatch):
+    # Spawned workers do not inherit settings changed at runtime
+    monkeypatch.setitem(
+        packaged._executors,
+        "process",
+        functools.partial(
+            concurrent.futures.ProcessPoolExecutor,
+            mp_context=multiprocessing.get_context("spawn"),
+        ),
+    )
+    monkeypatch.setattr(util, "HTML_PARSER", "html.parser")
+    with packaged._get_executor("process", max_workers=1) as executor:
+        assert executor.submit(util.get_html_parser).result() == "html.parser"
+        assert executor.submit(cache.get_cache_path).result() == cache.get_cache_path()
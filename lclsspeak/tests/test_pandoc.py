@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+from .. import packaged, pandoc
+from ..definition import URL
+
+DOCUMENT_HTML = """
+<h1>Acronyms</h1>
+<table>
+<tr><th>ECS</th><th>Experiment Control Systems Department</th></tr>
+<tr><td>GMD</td><td>Gas Monitor Detector</td></tr>
+</table>
+"""
+
+
+class FakePandoc:
+    """Stands in for pandoc, recording conversions."""
+
+    def __init__(self):
+        self.converted = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def convert(self, path, input_format="docx"):
+        with self.lock:
+            self.converted.append(path.name)
+            self.active += 1
+            self.max_active = max(self.active, self.max_active)
+        time.sleep(0.05)
+        with self.lock:
+            self.active -= 1
+        return DOCUMENT_HTML.replace("GMD", path.stem)
+
+
+@pytest.fixture
+def fake_pandoc(monkeypatch):
+    fake = FakePandoc()
+    monkeypatch.setattr(pandoc, "convert", fake.convert)
+    monkeypatch.setattr(pandoc, "get_pandoc_version", lambda: "pandoc 3.1")
+    return fake
+
+
+def _document(tmp_path, name: str) -> packaged.PandocData:
+    path = tmp_path / f"{name}.docx"
+    path.write_bytes(name.encode())
+    return packaged.PandocData(
+        url=URL(url="https://github.com/pcdshub/lclsspeak", text="docx"),
+        cached=path,
+        scrapers=packaged.default_docx_scrapers,
+    )
+
+
+def test_convert_cached(fake_pandoc, tmp_path, monkeypatch):
+    path = _document(tmp_path, "DOC1").cached
+    html = pandoc.convert_cached(path)
+    assert pandoc.convert_cached(path) == html
+    assert fake_pandoc.converted == ["DOC1.docx"]
+
+    # A different pandoc version may convert differently
+    monkeypatch.setattr(pandoc, "get_pandoc_version", lambda: "pandoc 3.2")
+    pandoc.convert_cached(path)
+    assert fake_pandoc.converted == ["DOC1.docx"] * 2
+
+    path.write_bytes(b"changed")
+    pandoc.convert_cached(path)
+    assert len(fake_pandoc.converted) == 3
+
+
+def test_convert_many(fake_pandoc, tmp_path):
+    paths = [_document(tmp_path, f"DOC{idx}").cached for idx in range(4)]
+    html = pandoc.convert_many(paths, max_workers=4)
+    assert [f"DOC{idx}" in text for idx, text in enumerate(html)] == [True] * 4
+    assert fake_pandoc.max_active > 1
+
+
+def test_load_documents(fake_pandoc, tmp_path, monkeypatch):
+    documents = [_document(tmp_path, f"DOC{idx}") for idx in range(3)]
+    monkeypatch.setattr(packaged, "_packaged_data", documents)
+    monkeypatch.setattr(packaged, "_external_data", [])
+    monkeypatch.setattr(packaged, "_load_slacspeak", list)
+
+    names = [defn.name for defn in packaged.load_packaged_data()]
+    assert names == ["DOC0", "DOC1", "DOC2"]
+    assert sorted(fake_pandoc.converted) == ["DOC0.docx", "DOC1.docx", "DOC2.docx"]
+
+    # New processes neither convert nor parse unchanged documents
+    for doc in documents:
+        doc._data = doc._html_data = None
+    assert [defn.name for defn in packaged.load_packaged_data()] == names
+    assert len(fake_pandoc.converted) == 3
@@ -0,0 +1,75 @@
+"""
+Conformance of the supported HTML parsers: every packaged HTML source must
+yield identical definitions regardless of the parser.
+"""
+import dataclasses
+import importlib.util
+
+import pytest
+
+from .. import packaged, slacspeak, util
+
+REFERENCE_PARSER = "html.parser"
+
+
+def _load(source, parser: str):
+    if source == "slacspeak":
+        with open(util.SLACSPEAK_PATH, encoding="ISO-8859-1") as fp:
+            return slacspeak.parse_slacspeak(fp.read(), parser=parser)
+    # Parse directly: the module-scoped fixture below runs outside of the
+    # per-test cache directory
+    return dataclasses.replace(source, parser=parser, _data=None).load(persistent=False)
+
+
+def _source_id(source) -> str:
+    return source if isinstance(source, str) else source.url.text
+
+
+HTML_SOURCES = [
+    source
+    for source in packaged._packaged_data + packaged._external_data
+    if isinstance(source, packaged.WebsiteData)
+] + ["slacspeak"]
+
+
+@pytest.fixture(scope="module", params=HTML_SOURCES, ids=_source_id)
+def source_and_reference(request):
+    return request.param, _load(request.param, REFERENCE_PARSER)
+
+
+@pytest.mark.parametrize(
+    "parser", [parser for parser in util.HTML_PARSERS if parser != REFERENCE_PARSER]
+)
+def test_parser_conformance(source_and_reference, parser):
+    module = util.HTML_PARSERS[parser]
+    if module and importlib.util.find_spec(module) is None:
+        pytest.skip(f"{module} is not installed")
+
+    source, reference = source_and_reference
+    assert len(reference) > 15
+    assert _load(source, parser) == reference
+
+
+def test_get_html_parser(monkeypatch):
+    assert util.get_html_parser("html5lib") == "html5lib"
+    with pytest.raises(ValueError):
+        util.get_html_parser("unknown")
+
+    monkeypatch.setitem(util.HTML_PARSERS, "lxml", "lxml_is_not_installed")
+    monkeypatch.setattr(util, "HTML_PARSER", "lxml")
+    assert util.get_html_parser() == "html.parser"
+    assert util.get_html_parser("lxml") == "lxml"
+
+
+@pytest.mark.parametrize("parser", list(util.HTML_PARSERS))
+def test_parse_only_conformance(source_and_reference, parser):
+    # Parsing the whole document must give the same results as parsing only
+    # the pre-extracted fragments
+    source, reference = source_and_reference
+    if not getattr(source, "parse_only", None):
+        pytest.skip("Source is parsed in full")
+    module = util.HTML_PARSERS[parser]
+    if module and importlib.util.find_spec(module) is None:
+        pytest.skip(f"{module} is not installed")
+
+    assert _load(dataclasses.replace(source, parse_only=None), parser) == reference
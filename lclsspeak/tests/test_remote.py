@@ -0,0 +1,190 @@
+import dataclasses
+import http.server
+import threading
+import time
+
+import pytest
+
+from .. import packaged, remote, slacspeak, util
+
+CSV_V1 = b"ccc,Description\nGMD,Gas Monitor Detector\n"
+CSV_V2 = b"ccc,Description\nGMD,Gas Monitor Detector\nXTES,X-ray Transport\n"
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.active, server.max_active)
+        try:
+            time.sleep(server.delay)
+            self._respond()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _respond(self):
+        server = self.server
+        with server.lock:
+            fail = server.failures > 0
+            server.failures -= fail
+        if fail:
+            self.send_response(503)
+            self.end_headers()
+            return
+
+        etag = f'"{server.version}"'
+        if server.conditional and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(server.content)))
+        self.end_headers()
+        self.wfile.write(server.content)
+
+    def log_message(self, *args):
+        ...
+
+
+@pytest.fixture
+def stub_server():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    server.version = 1
+    server.conditional = True
+    server.failures = 0
+    server.delay = 0.0
+    server.lock = threading.Lock()
+    server.active = server.max_active = 0
+    server.content = CSV_V1
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/sheet.csv"
+
+
+def test_fetch(stub_server, tmp_path):
+    path = tmp_path / "sheet.csv"
+    url = _url(stub_server)
+
+    result = remote.fetch(url, path, token="secret")
+    assert result.changed
+    assert result.bytes_transferred == len(CSV_V1)
+    assert path.read_bytes() == CSV_V1
+    assert remote.read_metadata(path)["etag"] == '"1"'
+    assert stub_server.requests[-1]["Authorization"] == "Bearer secret"
+
+    result = remote.fetch(url, path)
+    assert not result.changed
+    assert result.status_code == 304
+    assert stub_server.requests[-1]["If-None-Match"] == '"1"'
+
+    stub_server.version, stub_server.content = 2, CSV_V2
+    result = remote.fetch(url, path)
+    assert result.changed
+    assert path.read_bytes() == CSV_V2
+    # No temporary files are left behind
+    assert sorted(fn.name for fn in tmp_path.iterdir()) == [
+        "sheet.csv", "sheet.csv.http.json"
+    ]
+
+
+def test_fetch_ignored_conditional(stub_server, tmp_path):
+    stub_server.conditional = False
+    path = tmp_path / "sheet.csv"
+    assert remote.fetch(_url(stub_server), path).changed
+    mtime = path.stat().st_mtime_ns
+    result = remote.fetch(_url(stub_server), path)
+    assert result.status_code == 200
+    assert not result.changed
+    assert path.stat().st_mtime_ns == mtime
+
+    # The metadata outlived the file
+    path.unlink()
+    result = remote.fetch(_url(stub_server), path)
+    assert result.changed
+    assert path.read_bytes() == CSV_V1
+
+
+def test_refresh_source(stub_server, tmp_path):
+    ccc = packaged._packaged_data[0]
+    source = dataclasses.replace(
+        ccc, cached=tmp_path / "sheet.csv", download_url=_url(stub_server), _data=None
+    )
+    data = source.load(use_cache=False)
+    assert [defn.name for defn in data] == ["GMD"]
+    # Unchanged: the parsed definitions are kept
+    assert source.load(use_cache=False) is data
+
+    stub_server.version, stub_server.content = 2, CSV_V2
+    assert [defn.name for defn in source.load(use_cache=False)] == ["GMD", "XTES"]
+
+    released = packaged._packaged_data[1]
+    assert released.remote_url is None
+    assert released.refresh() is None
+
+
+def test_fetch_all(stub_server, tmp_path):
+    stub_server.delay = 0.1
+    stub_server.failures = 1
+    fetch_requests = [
+        remote.FetchRequest(name=str(idx), url=_url(stub_server), path=tmp_path / f"{idx}.csv")
+        for idx in range(4)
+    ]
+    results = remote.fetch_all(fetch_requests, max_per_host=2, backoff=0.01)
+    assert all(result.changed for result in results)
+    assert sum(result.attempts for result in results) == 5
+    assert stub_server.max_active == 2
+
+    stub_server.failures = 10
+    (result, ) = remote.fetch_all(fetch_requests[:1], retries=1, backoff=0.01)
+    assert isinstance(result, Exception)
+
+
+def test_get_session():
+    session = remote.get_session()
+    assert remote.get_session() is session
+
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(remote.get_session()))
+    thread.start()
+    thread.join()
+    assert sessions[0] is not session
+
+
+def test_get_fetch_requests():
+    fetch_requests = {
+        request.name: request for request in packaged.get_fetch_requests()
+    }
+    ccc = packaged._packaged_data[0]
+    assert fetch_requests[ccc.url.text].url.endswith("export?format=csv")
+    assert fetch_requests["slacspeak"].path.parent == util.CACHE_PATH
+    # Local-only sources are not included
+    assert packaged._packaged_data[1].url.text not in fetch_requests
+
+
+def test_refresh_slacspeak(stub_server, monkeypatch):
+    fixture = util.SLACSPEAK_PATH.read_bytes()
+    assert util.get_slacspeak_path() == util.SLACSPEAK_PATH
+
+    stub_server.content = (
+        b'<div id="maincontent"><dl><dt>GMD</dt><dd>Gas Monitor Detector</dd></dl></div>'
+    )
+    monkeypatch.setattr(slacspeak, "SLACSPEAK_URL", _url(stub_server))
+    assert [defn.name for defn in slacspeak.get_slacspeak()] == ["GMD"]
+
+    # The packaged copy is a test fixture and left as-is
+    assert util.SLACSPEAK_PATH.read_bytes() == fixture
+    assert util.get_slacspeak_path() == util.get_slacspeak_download_path()
@@ -0,0 +1,79 @@
+import pytest
+
+from ..definition import Definition
+from ..index import NameIndex
+from ..search import SearchEngine, edit_distance, get_deletes
+
+
+@pytest.fixture
+def engine() -> SearchEngine:
+    names = ["GMD", "XGMD", "XTES", "XTES-FEE", "VMDD", "XTCAV", "Zevatron"]
+    return SearchEngine(
+        NameIndex(
+            [
+                Definition(name=name, definition=f"{name} definition", source="test")
+                for name in names
+            ]
+        ),
+        max_distance=2,
+    )
+
+
+@pytest.mark.parametrize(
+    "a, b, max_distance, expected",
+    [
+        ("gmd", "gmd", None, 0),
+        ("gmdd", "gmd", None, 1),
+        ("kitten", "sitting", None, 3),
+        ("kitten", "sitting", 1, 2),
+        ("", "abc", None, 3),
+    ],
+)
+def test_edit_distance(a, b, max_distance, expected):
+    assert edit_distance(a, b, max_distance) == expected
+
+
+def test_get_deletes():
+    assert get_deletes("abc", 1) == {"abc", "ab", "ac", "bc"}
+    assert "a" in get_deletes("abc", 2)
+
+
+def test_prefix(engine: SearchEngine):
+    results = engine.prefix("XTE")
+    assert [result.name for result in results] == ["xtes", "xtes-fee"]
+    assert [result.match for result in results] == ["prefix", "prefix"]
+    assert engine.prefix("xtes", limit=1)[0].match == "exact"
+    assert engine.prefix("nothing") == []
+
+
+def test_fuzzy(engine: SearchEngine):
+    results = engine.fuzzy("GMDD")
+    assert [(result.name, result.distance) for result in results] == [
+        ("gmd", 1),
+        ("vmdd", 1),
+        ("xgmd", 2),
+    ]
+    assert [result.name for result in engine.fuzzy("zevatorn")] == ["zevatron"]
+    assert [result.name for result in engine.fuzzy("GMDD", max_distance=1)] == [
+        "gmd",
+        "vmdd",
+    ]
+    with pytest.raises(ValueError):
+        engine.fuzzy("GMDD", max_distance=3)
+
+
+def test_search_ranking(engine: SearchEngine):
+    results = engine.search("xte", limit=3)
+    assert [(result.name, result.match) for result in results] == [
+        ("xtes", "prefix"),
+        ("xtes-fee", "prefix"),
+    ]
+    assert results[0].definitions[0].name == "XTES"
+
+    results = engine.search("gmd", limit=3)
+    assert [(result.name, result.match) for result in results] == [
+        ("gmd", "exact"),
+        ("xgmd", "fuzzy"),
+        ("vmdd", "fuzzy"),
+    ]
+    assert len(engine.search("gmd", limit=None, fuzzy=False)) == 1
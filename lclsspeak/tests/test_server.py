@@ -0,0 +1,109 @@
+import asyncio
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from .. import database, fulltext
+from ..definition import Definition
+from ..server import (
+    LookupServer,
+    RequestError,
+    ServerState,
+    handle_request,
+    load_state,
+)
+
+
+def _state(definition: str, fingerprint: str) -> ServerState:
+    return ServerState.from_definitions(
+        [
+            Definition(name="GMD", definition=definition, source="test"),
+            Definition(name="XTES", definition="X-ray Transport", source="test"),
+        ],
+        fingerprint=fingerprint,
+    )
+
+
+def test_handle_request():
+    state = _state("Gas Monitor Detector", "a")
+    assert handle_request(state, "/health")["definitions"] == 2
+
+    results = handle_request(state, "/lookup?name=gmd&name=nope")["results"]
+    assert results["gmd"][0]["definition"] == "Gas Monitor Detector"
+    assert results["nope"] == []
+
+    results = handle_request(state, "/search?q=GMDD")["results"]
+    assert [result["name"] for result in results] == ["gmd"]
+
+    results = handle_request(state, "/reverse?q=gas+monitors")["results"]
+    assert [result["definition"]["name"] for result in results] == ["GMD"]
+
+    with pytest.raises(RequestError):
+        handle_request(state, "/search")
+    with pytest.raises(RequestError):
+        handle_request(state, "/search?q=GMDD&limit=ten")
+    with pytest.raises(RequestError) as ex:
+        handle_request(state, "/unknown")
+    assert ex.value.status == 404
+
+
+def _get(port: int, target: str):
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}{target}") as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as ex:
+        return ex.code, json.load(ex)
+
+
+def test_server_reload():
+    fingerprints = ["a"]
+    states = {
+        "a": _state("Gas Monitor Detector", "a"),
+        "b": _state("Gas Monitor Detector (reloaded)", "b"),
+    }
+
+    async def run():
+        server = LookupServer(
+            loader=lambda: states[fingerprints[-1]],
+            get_fingerprint=lambda: fingerprints[-1],
+            reload_interval=0,
+        )
+        await server.start(host="127.0.0.1", port=0)
+        port = server.server.sockets[0].getsockname()[1]
+        try:
+            requests = [
+                asyncio.to_thread(_get, port, "/lookup?name=GMD")
+                for _ in range(10)
+            ]
+            for status, response in await asyncio.gather(*requests):
+                assert status == 200
+                assert response["results"]["GMD"][0]["definition"] == "Gas Monitor Detector"
+
+            assert not await server.check_for_changes()
+            fingerprints.append("b")
+            assert await server.check_for_changes()
+            status, response = await asyncio.to_thread(_get, port, "/lookup?name=GMD")
+            assert response["results"]["GMD"][0]["definition"].endswith("(reloaded)")
+
+            status, response = await asyncio.to_thread(_get, port, "/unknown")
+            assert status == 404
+            assert "error" in response
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
+
+
+def test_load_state_fingerprint(monkeypatch):
+    fingerprints = ["a"]
+
+    def load_fulltext_index():
+        # The data changes while the indexes are built
+        fingerprints.append("b")
+        return fulltext.FullTextIndex(_state("Gas Monitor Detector", "a").definitions)
+
+    monkeypatch.setattr(database, "get_fingerprint", lambda: fingerprints[-1])
+    monkeypatch.setattr(fulltext, "load_fulltext_index", load_fulltext_index)
+    assert load_state().fingerprint == "a"
@@ -1,4 +1,4 @@
-from .. import slacspeak
+from .. import slacspeak, util
 
 
 def test_parse():
@@ -21,3 +21,38 @@ def test_parse():
 
     bsl1 = name_to_defn['BSL-1']
     assert bsl1.definition == 'BioSafety Level 1, a basic level of containment defined by the CDC that relies on standard microbiological practices.'
+
+
+def test_stream_parse_matches():
+    with open(util.SLACSPEAK_PATH, encoding="ISO-8859-1") as fp:
+        source = fp.read()
+
+    expected = slacspeak.parse_slacspeak(source)
+    assert list(slacspeak.iter_slacspeak(source)) == expected
+
+    # Chunk boundaries may fall anywhere, including inside of tags
+    chunks = [source[idx:idx + 1000] for idx in range(0, len(source), 1000)]
+    assert list(slacspeak.iter_slacspeak(chunks)) == expected
+
+
+UNCLOSED = """
+<html><body>
+<dl><dt>Outside</dt><dd>Not in the main content</dd></dl>
+<div id="maincontent">
+<div><dl>
+<dt>ABC<dd>Alpha &amp; <b>Beta</b> Collider
+<dt>XYZ</dt><dd>Unclosed at the end of the list
+</dl></div>
+<dl><dt>LAST</dt><dd>Last entry</div>
+</body></html>
+"""
+
+
+def test_stream_parse_unclosed():
+    definitions = list(slacspeak.iter_slacspeak(UNCLOSED))
+    assert [(defn.name, defn.definition) for defn in definitions] == [
+        ("ABC", "Alpha & Beta Collider\n"),
+        ("XYZ", "Unclosed at the end of the list\n"),
+        ("LAST", "Last entry"),
+    ]
+    assert definitions == slacspeak.parse_slacspeak(UNCLOSED, parser="lxml")
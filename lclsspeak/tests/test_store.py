@@ -0,0 +1,72 @@
+import tracemalloc
+
+import pytest
+
+from ..definition import URL, Definition
+from ..store import DefinitionStore
+
+URL_A = URL(url="https://example.com/a", text="Source A")
+
+DEFINITIONS = [
+    Definition(name="GMD", definition="Gas Monitor Detector", source="A", url=URL_A),
+    Definition(
+        name="XTES",
+        definition="X-ray Transport",
+        source="B",
+        alternates=["XTS"],
+        tags=["scraped"],
+        metadata={"Hutch": "TMO"},
+    ),
+    Definition(name="KB", definition="Kirkpatrick-Baez", source="A", url=URL_A),
+]
+
+
+def test_round_trip():
+    store = DefinitionStore.from_definitions(DEFINITIONS)
+    assert len(store) == 3
+    assert list(store) == DEFINITIONS
+    assert store[-1] == DEFINITIONS[-1]
+    assert store[1:] == DEFINITIONS[1:]
+    assert list(store.find("A")) == [DEFINITIONS[0], DEFINITIONS[2]]
+    assert list(store.find("missing")) == []
+    with pytest.raises(IndexError):
+        store[3]
+
+    # Repeated values are stored once
+    assert len(store.source_table) == 2
+    assert len(store.url_table) == 1
+
+
+def test_views_are_independent():
+    store = DefinitionStore.from_definitions(DEFINITIONS)
+    defn = store[1]
+    defn.tags.append("modified")
+    defn.metadata["Hutch"] = "RIX"
+    defn.alternates.clear()
+    assert store[1] == DEFINITIONS[1]
+
+
+def _measure(load):
+    tracemalloc.start()
+    try:
+        data = load()
+        return data, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_memory():
+    def definitions():
+        for idx in range(2000):
+            yield Definition(
+                name=f"ACR{idx}",
+                definition=f"Acronym number {idx}",
+                source="Source A",
+                url=URL(url="https://example.com/a", text="Source A"),
+                tags=["scraped"],
+            )
+
+    as_list, list_size = _measure(lambda: list(definitions()))
+    as_store, store_size = _measure(lambda: DefinitionStore.from_definitions(definitions()))
+    assert list(as_store) == as_list
+    assert store_size < list_size / 2
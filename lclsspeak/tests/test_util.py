@@ -0,0 +1,35 @@
+import os
+import stat
+
+import pytest
+
+from .. import util
+
+
+def _permissions(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_atomic_write(tmp_path):
+    # Permissions as for any new file, subject to the umask
+    reference = tmp_path / "reference.txt"
+    reference.write_text("")
+
+    path = tmp_path / "file.txt"
+    with util.atomic_write(path) as fp:
+        fp.write("first")
+    assert path.read_text() == "first"
+    assert _permissions(path) == _permissions(reference)
+
+    os.chmod(path, 0o640)
+    with pytest.raises(RuntimeError):
+        with util.atomic_write(path) as fp:
+            fp.write("second")
+            raise RuntimeError()
+    assert path.read_text() == "first"
+    assert sorted(os.listdir(tmp_path)) == ["file.txt", "reference.txt"]
+
+    with util.atomic_write(path) as fp:
+        fp.write("third")
+    assert path.read_text() == "third"
+    assert _permissions(path) == 0o640
@@ -1,9 +1,124 @@
+import contextlib
+import importlib.util
 import os
 import pathlib
+import secrets
+import stat
+from typing import IO, Generator, Optional
 
 MODULE_PATH = pathlib.Path(__file__).parent.resolve()
 TESTS_PATH = MODULE_PATH / "tests"
 DATA_PATH = MODULE_PATH / "data"
+SLACSPEAK_PATH = TESTS_PATH / "slacspeak.html"
+#: Downloads of slacspeak go to ``CACHE_PATH``; the packaged copy is a test
+#: fixture.
+SLACSPEAK_DOWNLOAD_FILENAME = "slacspeak.html"
+
+# Compiled artifacts (e.g., the acronym database) are written here, as the
+# package directory may not be writable once installed.
+CACHE_PATH = pathlib.Path(
+    os.environ.get("LCLSSPEAK_CACHE_PATH", "")
+    or pathlib.Path(os.environ.get("XDG_CACHE_HOME", "") or "~/.cache") / "lclsspeak"
+).expanduser()
 
 
 CONFLUENCE_TOKEN = os.environ.get("CONFLUENCE_TOKEN", "")
+
+#: Supported BeautifulSoup parsers and the modules they require.
+HTML_PARSERS = {
+    "lxml": "lxml",
+    "html.parser": None,
+    "html5lib": "html5lib",
+}
+#: The default BeautifulSoup parser.  lxml is the fastest, if installed.
+HTML_PARSER = os.environ.get("LCLSSPEAK_HTML_PARSER", "lxml")
+
+
+def get_html_parser(parser: Optional[str] = None) -> str:
+    """
+    Get the BeautifulSoup parser to use.
+
+    Parameters
+    ----------
+    parser : str, optional
+        A specific parser to use.  Defaults to ``HTML_PARSER``, falling back
+        to the built-in "html.parser" if its requirements are not installed.
+    """
+    requested = parser or HTML_PARSER
+    if requested not in HTML_PARSERS:
+        raise ValueError(
+            f"Unsupported HTML parser: {requested!r} (options: {list(HTML_PARSERS)})"
+        )
+
+    module = HTML_PARSERS[requested]
+    if parser is None and module and importlib.util.find_spec(module) is None:
+        return "html.parser"
+    return requested
+
+
+def get_slacspeak_download_path() -> pathlib.Path:
+    return CACHE_PATH / SLACSPEAK_DOWNLOAD_FILENAME
+
+
+def get_slacspeak_path() -> pathlib.Path:
+    """The downloaded copy of slacspeak, if any, or else the packaged one."""
+    path = get_slacspeak_download_path()
+    return path if path.exists() else SLACSPEAK_PATH
+
+
+def _create_temp_file(path: pathlib.Path) -> tuple[int, str]:
+    """
+    Create a uniquely-named file next to ``path``.
+
+    Unlike ``tempfile.mkstemp``, which is owner-only, the file gets the
+    permissions of any newly created file (i.e., subject to the umask).
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(100):
+        temp_name = str(path.parent / f".{path.name}.{secrets.token_hex(4)}")
+        try:
+            return os.open(temp_name, flags, 0o666), temp_name
+        except FileExistsError:
+            continue
+    raise FileExistsError(f"No temporary filename available for {path}")
+
+
+@contextlib.contextmanager
+def atomic_replace(path: pathlib.Path) -> Generator[pathlib.Path, None, None]:
+    """
+    Get a temporary filename to be moved to ``path`` once written.
+
+    As ``atomic_write``, for writers which take a filename rather than a
+    file object (e.g., ``sqlite3``).
+    """
+    path = pathlib.Path(path)
+    try:
+        permissions = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        permissions = None
+    fd, temp_name = _create_temp_file(path)
+    os.close(fd)
+    try:
+        if permissions is not None:
+            os.chmod(temp_name, permissions)
+        yield pathlib.Path(temp_name)
+        os.replace(temp_name, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_name)
+        raise
+
+
+@contextlib.contextmanager
+def atomic_write(
+    path: pathlib.Path, mode: str = "wt", **kwargs
+) -> Generator[IO, None, None]:
+    """
+    Open a temporary file to be moved to ``path`` once written.
+
+    Readers never see a partially-written file, and ``path`` is left as-is if
+    writing fails.  The file keeps the permissions of any file it replaces.
+    Additional keyword arguments are passed to ``open``.
+    """
+    with atomic_replace(path) as temp_path, open(temp_path, mode, **kwargs) as fp:
+        yield fp